@@ -0,0 +1,86 @@
+"""
+Benchmark: per-element WebDriver reads versus BasePage.extract on tables of 1, 10 and 100 rows
+
+Usage:
+    python -m benchmarks.extraction [--rows 1 10 100] [--repeat 5] [--browser chrome]
+"""
+import argparse
+import time
+from selenium.webdriver.common.by import By
+
+from utils.config_reader import ConfigReader
+from utils.driver_manager import DriverManager
+from utils.command_metrics import CommandRecorder
+from utils.wait_utils import WaitUtils
+from tests.pages.cart_page import CartPage
+
+
+ROW_TEMPLATE = ("<tr><td class='text-left'><a href='#'>Product {n}</a></td>"
+                "<td class='text-left'><input type='text' value='{n}'></td>"
+                "<td class='text-right'>${n}.00</td><td class='text-right'>${total}.00</td></tr>")
+
+
+def build_cart_html(rows):
+    """Build a cart-like table with the given number of product rows"""
+    body = "".join(ROW_TEMPLATE.format(n=n, total=n * n) for n in range(1, rows + 1))
+    return f"<div class='table-responsive'><table><tbody>{body}</tbody></table></div>"
+
+
+def read_per_element(driver):
+    """The pre-extract CartPage.get_cart_items: several WebDriver calls per row"""
+    items = []
+    for row in driver.find_elements(*CartPage.CART_ROWS):
+        items.append({
+            'product_name': row.find_element(By.CSS_SELECTOR, "td.text-left a").text,
+            'quantity': int(row.find_element(By.CSS_SELECTOR, "input[type='text']").get_attribute("value")),
+            'price': row.find_element(By.CSS_SELECTOR, "td.text-right").text,
+            'total': row.find_elements(By.CSS_SELECTOR, "td.text-right")[-1].text,
+        })
+    return items
+
+
+def measure(recorder, label, read, repeat):
+    """Run read() repeat times and return (best seconds, commands per read)"""
+    timings = []
+    for _ in range(repeat):
+        recorder.begin(label)
+        start = time.perf_counter()
+        read()
+        timings.append(time.perf_counter() - start)
+        commands = recorder.command_count()
+        recorder.end()
+    return min(timings), commands
+
+
+def main():
+    """Main benchmark function"""
+    config = ConfigReader()
+    parser = argparse.ArgumentParser(description="Compare per-element reads with single-script extraction")
+    parser.add_argument("--rows", nargs="+", type=int, default=[1, 10, 100], help="Table sizes to test")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per size and method (best is kept)")
+    parser.add_argument("--browser", default=config.get_browser(), help="Browser to use")
+    args = parser.parse_args()
+
+    manager = DriverManager(args.browser, headless=True)
+    driver = manager.get_driver()
+    recorder = CommandRecorder()
+    recorder.attach(driver)
+    cart_page = CartPage(driver, WaitUtils(driver, config.get_explicit_wait()), None)
+
+    print("📊 Extraction benchmark")
+    print("=" * 40)
+    print(f"{'Rows':>5}  {'Per-element':>18}  {'extract()':>18}  Speed-up")
+    try:
+        for rows in args.rows:
+            driver.get("about:blank")
+            driver.execute_script("document.body.innerHTML = arguments[0];", build_cart_html(rows))
+            old_time, old_commands = measure(recorder, "per_element", lambda: read_per_element(driver), args.repeat)
+            new_time, new_commands = measure(recorder, "extract", cart_page.get_cart_items, args.repeat)
+            print(f"{rows:>5}  {old_commands:>5} cmds {old_time * 1000:7.1f}ms  "
+                  f"{new_commands:>5} cmds {new_time * 1000:7.1f}ms  {old_time / new_time:6.1f}x")
+    finally:
+        manager.quit_driver()
+
+
+if __name__ == "__main__":
+    main()
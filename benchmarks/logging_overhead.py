@@ -0,0 +1,79 @@
+"""
+Benchmark: per-action logging cost of the old synchronous f-string setup versus lazy, queue-backed logging
+
+Usage:
+    python -m benchmarks.logging_overhead [--actions 5000] [--text-size 2000]
+"""
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from loguru import logger
+
+from utils.log_utils import configure_logging, flush_logs
+
+
+LOCATOR = ("css selector", ".table-responsive tbody tr td.text-left a")
+
+
+def eager_action(text, names):
+    """What a BasePage read logged before: f-strings built whether or not the level is enabled"""
+    logger.debug(f"Element found: {LOCATOR}")
+    logger.debug(f"Element text: {text}")
+    logger.info(f"Found product names: {names}")
+    logger.info(f"Clicked element: {LOCATOR}")
+
+
+def lazy_action(text, names):
+    """The same records as templates with structured arguments"""
+    logger.debug("Element found: {locator}", locator=LOCATOR)
+    logger.debug("Element text: {text}", text=text)
+    logger.info("Found {count} product names", count=len(names), names=names)
+    logger.info("Clicked element: {locator}", locator=LOCATOR)
+
+
+def run(action, actions, text, names):
+    """Return (caller µs per action, µs per action including the final queue flush)"""
+    start = time.perf_counter()
+    for _ in range(actions):
+        action(text, names)
+    caller = time.perf_counter() - start
+    flush_logs()
+    total = time.perf_counter() - start
+    return caller * 1e6 / actions, total * 1e6 / actions
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Compare logging overhead per page action")
+    parser.add_argument("--actions", type=int, default=5000, help="Simulated page actions per scenario")
+    parser.add_argument("--text-size", type=int, default=2000, help="Characters of element text logged")
+    args = parser.parse_args()
+    text = "x" * args.text_size
+    names = [f"Product {n}" for n in range(50)]
+
+    print("📊 Logging overhead benchmark")
+    print("=" * 40)
+    print(f"{'Setup':<44} {'Caller µs':>10} {'Total µs':>10}")
+    with tempfile.TemporaryDirectory() as log_dir, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stderr(devnull):
+        # Before: default DEBUG console sink plus a synchronous, rotating file shared by all workers
+        logger.remove()
+        logger.add(devnull, level="DEBUG")
+        logger.add(Path(log_dir) / "test.log", rotation="1 day", retention="7 days", level="DEBUG")
+        results = [("before: sync sinks, eager f-strings", run(eager_action, args.actions, text, names))]
+
+        for level in ("DEBUG", "INFO"):
+            configure_logging(Path(log_dir) / level, level=level, console_level="INFO")
+            results.append((f"after: queued sinks, lazy, file level {level}",
+                            run(lazy_action, args.actions, text, names)))
+        logger.remove()
+
+    for label, (caller, total) in results:
+        print(f"{label:<44} {caller:>10.1f} {total:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
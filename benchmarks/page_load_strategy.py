@@ -0,0 +1,58 @@
+"""
+Benchmark: run the same suite under each page load strategy and compare wall time
+
+Usage:
+    python -m benchmarks.page_load_strategy [--target tests/testcases] [--strategies normal eager]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def run_suite(target, strategy, extra_args):
+    """Run pytest once with the given strategy and return (seconds, exit code)"""
+    cmd = [sys.executable, "-m", "pytest", target, "-q", "-p", "no:cacheprovider",
+           "--page-load-strategy", strategy, *extra_args]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    summary = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+    return elapsed, result.returncode, summary
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Compare page load strategies on the same suite")
+    parser.add_argument("--target", default="tests/testcases", help="Test path to run")
+    parser.add_argument("--strategies", nargs="+", default=["normal", "eager"],
+                        choices=["normal", "eager", "none"], help="Strategies to compare")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per strategy")
+    parser.add_argument("pytest_args", nargs="*", help="Extra pytest arguments (after --)")
+    args = parser.parse_args()
+
+    print("📊 Page load strategy benchmark")
+    print("=" * 40)
+
+    results = {}
+    for strategy in args.strategies:
+        timings = []
+        for run in range(args.repeat):
+            elapsed, code, summary = run_suite(args.target, strategy, args.pytest_args)
+            timings.append(elapsed)
+            print(f"  {strategy:<7} run {run + 1}: {elapsed:8.1f}s  exit={code}  {summary}")
+        results[strategy] = min(timings)
+
+    baseline = results.get("normal")
+    print("\nStrategy   Best (s)   vs normal")
+    for strategy, best in results.items():
+        ratio = f"{best / baseline:.2f}x" if baseline else "-"
+        print(f"{strategy:<10} {best:8.1f}   {ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,7 @@ def demo_basic_usage():
         print("✅ Driver initialized successfully")
         
         # Initialize utilities
-        wait_utils = WaitUtils(driver, config.get_explicit_wait())
+        wait_utils = WaitUtils(driver, config.get_explicit_wait(), config.get_wait_mode(), config.get_network_quiet_ms())
         screenshot_utils = ScreenshotUtils(driver, config.get_screenshot_path())
         
         # Initialize page objects
@@ -14,61 +14,67 @@ class TestRunner:
         self.reports_dir = self.project_root / "tests" / "reports"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
     
-    def run_smoke_tests(self, browser="chrome", headless=False, parallel=False):
+    def run_smoke_tests(self, browser="chrome", headless=False, parallel=False, isolation=None):
         """Run smoke tests"""
         logger.info("Running smoke tests...")
         cmd = self._build_command(
             markers="smoke",
             browser=browser,
             headless=headless,
-            parallel=parallel
+            parallel=parallel,
+            isolation=isolation
         )
         return self._execute_command(cmd, "smoke")
     
-    def run_regression_tests(self, browser="chrome", headless=False, parallel=True):
+    def run_regression_tests(self, browser="chrome", headless=False, parallel=True, isolation=None):
         """Run regression tests"""
         logger.info("Running regression tests...")
         cmd = self._build_command(
             markers="regression",
             browser=browser,
             headless=headless,
-            parallel=parallel
+            parallel=parallel,
+            isolation=isolation
         )
         return self._execute_command(cmd, "regression")
     
-    def run_sanity_tests(self, browser="chrome", headless=False, parallel=False):
+    def run_sanity_tests(self, browser="chrome", headless=False, parallel=False, isolation=None):
         """Run sanity tests"""
         logger.info("Running sanity tests...")
         cmd = self._build_command(
             markers="sanity",
             browser=browser,
             headless=headless,
-            parallel=parallel
+            parallel=parallel,
+            isolation=isolation
         )
         return self._execute_command(cmd, "sanity")
     
-    def run_specific_tests(self, test_path, browser="chrome", headless=False, parallel=False):
+    def run_specific_tests(self, test_path, browser="chrome", headless=False, parallel=False, isolation=None):
         """Run specific test file or test function"""
         logger.info(f"Running specific tests: {test_path}")
         cmd = self._build_command(
             test_path=test_path,
             browser=browser,
             headless=headless,
-            parallel=parallel
+            parallel=parallel,
+            isolation=isolation
         )
         return self._execute_command(cmd, "specific")
     
-    def run_all_tests(self, browser="chrome", headless=False, parallel=True):
+    def run_all_tests(self, browser="chrome", headless=False, parallel=True, isolation=None):
         """Run all tests"""
         logger.info("Running all tests...")
         cmd = self._build_command(
             browser=browser,
             headless=headless,
-            parallel=parallel
+            parallel=parallel,
+            isolation=isolation
         )
         return self._execute_command(cmd, "all")
     
-    def _build_command(self, markers=None, test_path=None, browser="chrome", headless=False, parallel=False):
+    def _build_command(self, markers=None, test_path=None, browser="chrome", headless=False, parallel=False,
+                       isolation=None):
         """Build pytest command"""
         cmd = ["python", "-m", "pytest"]
         
@@ -85,6 +91,10 @@ class TestRunner:
         if headless:
             cmd.append("--headless")
         
+        # Add browser isolation mode
+        if isolation:
+            cmd.extend(["--isolation", isolation])
+        
         # Add parallel execution
         if parallel:
             cmd.extend(["-n", "auto"])
@@ -94,7 +104,9 @@ class TestRunner:
             "--tb=short",
             "--capture=no",
             "--html=tests/reports/html-report/report.html",
-            "--self-contained-html"
+            "--self-contained-html",
+            "--json-report",
+            "--json-report-file=tests/reports/json-report.json"
         ])
         
         return cmd
@@ -136,10 +148,12 @@ def main():
     parser = argparse.ArgumentParser(description="E-commerce Automation Test Runner")
     parser.add_argument("--suite", choices=["smoke", "regression", "sanity", "all"], 
                        default="smoke", help="Test suite to run")
-    parser.add_argument("--browser", choices=["chrome", "firefox", "edge"], 
+    parser.add_argument("--browser", choices=["chrome", "firefox", "edge", "remote"], 
                        default="chrome", help="Browser to use")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
     parser.add_argument("--parallel", action="store_true", help="Run tests in parallel")
+    parser.add_argument("--isolation", choices=["reset", "context", "restart"],
+                       help="Isolation between tests sharing a browser (default: config.ini)")
     parser.add_argument("--test", help="Specific test file or function to run")
     parser.add_argument("--open-reports", action="store_true", help="Open reports after execution")
     
@@ -157,31 +171,36 @@ def main():
                 test_path=args.test,
                 browser=args.browser,
                 headless=args.headless,
-                parallel=args.parallel
+                parallel=args.parallel,
+                isolation=args.isolation
             )
         elif args.suite == "smoke":
             success = runner.run_smoke_tests(
                 browser=args.browser,
                 headless=args.headless,
-                parallel=args.parallel
+                parallel=args.parallel,
+                isolation=args.isolation
             )
         elif args.suite == "regression":
             success = runner.run_regression_tests(
                 browser=args.browser,
                 headless=args.headless,
-                parallel=args.parallel
+                parallel=args.parallel,
+                isolation=args.isolation
             )
         elif args.suite == "sanity":
             success = runner.run_sanity_tests(
                 browser=args.browser,
                 headless=args.headless,
-                parallel=args.parallel
+                parallel=args.parallel,
+                isolation=args.isolation
             )
         elif args.suite == "all":
             success = runner.run_all_tests(
                 browser=args.browser,
                 headless=args.headless,
-                parallel=args.parallel
+                parallel=args.parallel,
+                isolation=args.isolation
             )
         
         if args.open_reports:
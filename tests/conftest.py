@@ -3,19 +3,63 @@ Pytest configuration and fixtures
 """
 import pytest
 import os
+import re
+import html
 from pathlib import Path
 from selenium import webdriver
 from loguru import logger
 
 from utils.driver_manager import DriverManager
+from utils.driver_pool import DriverPool
+from utils.browser_launcher import BrowserLauncher
+from utils.driver_watchdog import DriverWatchdog
+from utils.grid_connection import GridConnection
+from utils.command_metrics import CommandRecorder
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.retry_policy import RetryPolicy
+from utils.wait_profiler import WaitProfiler
+from utils.form_metrics import FormFillMetrics
+from utils.element_cache import ElementCache
+from utils.session_cache import SessionCache
+from utils.cart_api import CartApi
 from utils.config_reader import ConfigReader
 from utils.screenshot_utils import ScreenshotUtils
 from utils.wait_utils import WaitUtils
+from utils.report_utils import write_worker_report
+from utils.log_utils import configure_logging, flush_logs, merge_worker_logs
+
+try:
+    import allure
+except ImportError:
+    allure = None
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:
+    html_extras = None
 
 
 # Global configuration
 config = ConfigReader()
 
+# Spare browsers started while tests are collected (see pytest_sessionstart)
+browser_launcher = None
+
+# Per-test blocked/loaded request counts, written at session finish
+resource_stats = {}
+
+# Every wait that ended in a timeout, written at session finish
+wait_timeouts = []
+
+# Passing tests that only passed because a step was retried: {nodeid: recovered steps}
+avoided_reruns = {}
+
+# Wait profiles of every test report seen by this process (workers' reports too, under xdist)
+reported_wait_profiles = []
+
+# In-memory log of the running test, kept only if it fails (None when [LOGGING] test_buffer_size = 0)
+test_log_buffer = None
+
 
 @pytest.fixture(scope="session")
 def test_config():
@@ -23,28 +67,221 @@ def test_config():
     return config
 
 
-@pytest.fixture(scope="function")
-def driver():
-    """Function-level driver fixture"""
-    driver_manager = DriverManager(
-        browser=config.get_browser(),
-        headless=config.get_headless()
+def get_run_option(pytest_config, name, default):
+    """Get a command line override, falling back to config.ini"""
+    value = pytest_config.getoption(name, default=None)
+    return default if value is None else value
+
+
+def is_xdist_controller(pytest_config):
+    """Check if this process only distributes tests to xdist workers"""
+    return bool(getattr(pytest_config.option, "numprocesses", None)) and not hasattr(pytest_config, "workerinput")
+
+
+def get_driver_options(pytest_config):
+    """DriverManager settings shared by pooled and pre-warmed browsers"""
+    return {
+        'page_load_strategy': get_run_option(pytest_config, "--page-load-strategy",
+                                             config.get_page_load_strategy()),
+        'page_load_timeout': config.get_page_load_timeout()
+    }
+
+
+@pytest.fixture(scope="session")
+def driver_pool(pytestconfig):
+    """Session-level pool of browsers shared by the tests of one worker"""
+    max_uses = config.get_driver_pool_max_uses() if config.is_driver_pool_enabled() else 1
+    pool = DriverPool(
+        browser=get_run_option(pytestconfig, "--browser", config.get_browser()),
+        headless=get_run_option(pytestconfig, "--headless", config.get_headless()),
+        max_uses=max_uses,
+        launcher=browser_launcher,
+        isolation=get_run_option(pytestconfig, "--isolation", config.get_isolation_mode()),
+        driver_options=get_driver_options(pytestconfig)
     )
     
-    driver = driver_manager.get_driver()
-    driver.get(config.get_base_url())
+    yield pool
+    
+    pool.close()
+    write_worker_report(config.get_report_path(), "driver_pool", pool.stats())
+
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
+    """Function-level driver fixture leased from the pool"""
+    driver = driver_pool.acquire()
+    driver_manager = driver_pool.get_manager(driver)
+    
+    # Setup can fail without a test to blame (site down, session cache login, cart seeding); the lease must
+    # still end, or every following test launches another browser next to the stranded one
+    try:
+        # Visual checks opt back in to images, fonts and third-party resources
+        allow_resources = request.node.get_closest_marker("allow_resources") is not None
+        if allow_resources:
+            driver_manager.set_resource_blocking(False)
+        
+        # Seeded-cart and logged-in tests get their session cookies before the first page load where the
+        # browser allows it; a seeded cart continues the logged-in session when the test has one
+        cookies = None
+        if request.node.get_closest_marker("cart_items"):
+            cookies = request.getfixturevalue("seeded_cart").get_cookies()
+        elif "authenticated_session" in request.fixturenames:
+            session = request.getfixturevalue("authenticated_session")
+            cookies = session['cookies'] if session else None
+        injected = not cookies or SessionCache.inject(driver, cookies)
+        
+        driver.get(config.get_base_url())
+        ElementCache.for_driver(driver).invalidate("navigation")
+        if driver.capabilities.get("pageLoadStrategy") == "none":
+            # Page objects derive the host from current_url, so wait for navigation to commit
+            WaitUtils(driver, config.get_explicit_wait()).wait_for_url_contains(
+                config.get_base_url().split('/')[2])
+        if not injected:
+            # Without CDP the cookies can only be added on the site; they apply from the test's next page load
+            SessionCache.add_to_page(driver, cookies)
+        
+        # Count the test's own round trips, not the fixture's navigation above
+        command_recorder = CommandRecorder.default()
+        command_recorder.attach(driver)
+        command_recorder.begin(request.node.nodeid)
+        GridConnection.begin_test(request.node.nodeid)
+    except Exception:
+        driver_pool.release(driver, crashed=True)
+        raise
     
     yield driver
     
-    # Cleanup
-    driver.quit()
-    logger.info("Driver quit successfully")
+    command_summary = command_recorder.end()
+    if command_summary:
+        request.node.user_properties.append(("webdriver_commands", command_summary['total_commands']))
+    grid_latency = GridConnection.end_test()
+    if grid_latency:
+        request.node.user_properties.append(("grid_latency", grid_latency))
+    
+    # Return the browser; retire it if the test lost the session. Without a call report a later fixture
+    # failed during setup, so that report decides
+    report = getattr(request.node, "rep_call", None) or getattr(request.node, "rep_setup", None)
+    crashed = bool(report and report.failed and _is_driver_crash(report))
+    if not crashed:
+        _record_resource_stats(request.node, driver_manager)
+        if allow_resources:
+            driver_manager.set_resource_blocking(True)
+    driver_pool.release(driver, crashed=crashed)
+    logger.info("Driver released to pool")
+
+
+def _record_resource_stats(item, driver_manager):
+    """Report how many requests resource blocking saved this test"""
+    if not driver_manager.resource_blocker.enabled:
+        return
+    stats = driver_manager.collect_resource_stats()
+    resource_stats[item.nodeid] = stats
+    item.user_properties.append(("resource_blocking", stats))
+    logger.info(f"Blocked {stats['blocked_requests']} requests {stats['blocked_by_type']}, "
+                f"loaded {stats['loaded_requests']} requests ({stats['loaded_bytes']} bytes)")
+
+
+def _enforce_command_budget(item, report):
+    """Fail a passing test that made more WebDriver commands than its command_budget marker allows"""
+    marker = item.get_closest_marker("command_budget")
+    if marker is None or not report.passed:
+        return
+    failure = CommandRecorder.default().budget_failure(CommandRecorder.budget_limit(marker))
+    if failure:
+        report.outcome = "failed"
+        report.longrepr = failure
+        logger.error(f"Test {item.name} failed: {failure}")
+
+
+def _is_driver_crash(report):
+    """Check if a failed test report looks like a dead browser session"""
+    crash_markers = ("InvalidSessionIdException", "chrome not reachable", "session deleted",
+                     "no such window", "disconnected", "Max retries exceeded")
+    text = str(report.longrepr)
+    return any(marker in text for marker in crash_markers)
+
+
+@pytest.fixture(scope="function")
+def authenticated_session(request):
+    """Cached session of the valid test account (None for tests marked login_ui, which log in through the UI)"""
+    if request.node.get_closest_marker("login_ui"):
+        yield None
+        return
+    credentials = config.get_valid_credentials()
+    cookies = SessionCache.default().get_cookies(credentials['username'], credentials['password'])
+    
+    yield {'username': credentials['username'], 'cookies': cookies}
+    
+    # A failure may mean the session ended server-side; the next test checks it instead of trusting the memo
+    report = getattr(request.node, "rep_call", None) or getattr(request.node, "rep_setup", None)
+    if report is not None and report.failed:
+        SessionCache.default().invalidate(credentials['username'])
 
 
 @pytest.fixture(scope="function")
-def wait_utils(driver):
+def seeded_cart(request):
+    """Cart filled over HTTP with the cart_items marker's products and emptied the same way afterwards"""
+    marker = request.node.get_closest_marker("cart_items")
+    if marker and marker.args:
+        products = [item if isinstance(item, tuple) else (item, 1) for item in marker.args]
+    else:
+        products = config.get_cart_seed_products()
+    session = request.getfixturevalue("authenticated_session") if "authenticated_session" in request.fixturenames \
+        else None
+    # A customer's cart lives on the server and every worker shares the account, so tests seeding it run one
+    # at a time across workers; anonymous carts belong to their own session and need no lock
+    account_lock = SessionCache.default().account_lock(session['username']) if session else None
+    if account_lock is not None:
+        account_lock.acquire()
+    try:
+        cart_api = CartApi.from_config(config, cookies=session['cookies'] if session else None)
+        if session:
+            # The cart persists across sessions, so start from an empty one
+            cart_api.clear()
+        cart_api.seed(products)
+        
+        yield cart_api
+        
+        try:
+            cart_api.clear()
+        except Exception:
+            # Already logged; an anonymous cart left behind expires with its session
+            pass
+    finally:
+        if account_lock is not None:
+            account_lock.release()
+
+
+@pytest.fixture(scope="function")
+def wait_utils(request, driver):
     """Wait utilities fixture"""
-    return WaitUtils(driver, config.get_explicit_wait())
+    wait_utils = WaitUtils(driver, config.get_explicit_wait(), config.get_wait_mode(), config.get_network_quiet_ms(),
+                           AdaptiveTimeouts.default())
+    wait_utils.add_listener(_wait_timeout_recorder(request.node.nodeid))
+    wait_utils.add_listener(WaitProfiler.default().on_wait)
+    return wait_utils
+
+
+def _wait_timeout_recorder(test_id):
+    """Wait listener that keeps every timed-out wait for the audit report"""
+    def record(event):
+        if not event['success']:
+            wait_timeouts.append({'test': test_id, 'kind': event['kind'], 'locator': str(event['locator']),
+                                  'mode': event['mode'], 'seconds': round(event['seconds'], 2)})
+    return record
+
+
+def wait_timeout_audit():
+    """Summarise timed-out waits and the wall time they consumed, worst test first"""
+    by_test = {}
+    for timeout in wait_timeouts:
+        by_test[timeout['test']] = round(by_test.get(timeout['test'], 0) + timeout['seconds'], 2)
+    return {
+        'timeouts': len(wait_timeouts),
+        'total_seconds': round(sum(timeout['seconds'] for timeout in wait_timeouts), 2),
+        'by_test': dict(sorted(by_test.items(), key=lambda entry: entry[1], reverse=True)),
+        'waits': wait_timeouts,
+    }
 
 
 @pytest.fixture(scope="function")
@@ -175,31 +412,221 @@ class BaseTest:
 
 
 # Pytest hooks
+def pytest_addoption(parser):
+    """Command line overrides for config.ini (used by run_tests.py)"""
+    parser.addoption("--browser", action="store", default=None,
+                     choices=["chrome", "firefox", "edge", "remote"], help="Browser to use")
+    parser.addoption("--headless", action="store_true", default=None,
+                     help="Run browsers in headless mode")
+    parser.addoption("--isolation", action="store", default=None,
+                     choices=list(DriverPool.ISOLATION_MODES),
+                     help="Isolation between tests sharing a browser")
+    parser.addoption("--page-load-strategy", action="store", default=None,
+                     choices=list(DriverManager.PAGE_LOAD_STRATEGIES),
+                     help="WebDriver page load strategy")
+
+
 def pytest_configure(config):
-    """Configure pytest"""
-    # Setup logging
-    logger.add(
-        "tests/reports/test.log",
-        rotation="1 day",
-        retention="7 days",
-        level="DEBUG"
+    """Configure pytest (markers are registered in pytest.ini)"""
+    setup_logging(config)
+
+
+def setup_logging(pytest_config):
+    """Log to this process's queue-backed sink (merged into test.log at session finish)"""
+    global test_log_buffer
+    if not hasattr(pytest_config, "workerinput"):
+        # Workers start after this, so only this run's worker logs get merged
+        for old_log in Path(config.get_log_dir()).glob("test_*.jsonl"):
+            old_log.unlink()
+    test_log_buffer = configure_logging(config.get_log_dir(), config.get_log_level(),
+                                        config.get_console_log_level(), config.get_test_log_buffer_size())
+
+
+def _keep_test_log(item, report):
+    """Flush a failed or rerun test's buffered log to disk and the reports; passing tests get one line"""
+    phases = [getattr(item, f"rep_{when}", None) for when in ("setup", "call", "teardown")]
+    failed = any(phase is not None and phase.failed for phase in phases)
+    text = test_log_buffer.end(keep=failed)
+    if not failed:
+        skipped = any(phase is not None and phase.skipped for phase in phases)
+        logger.info("{outcome} {test}", outcome="SKIPPED" if skipped else "PASSED", test=item.nodeid)
+        return
+    attempt = getattr(item, "execution_count", 1)
+    name = re.sub(r"[^\w.-]+", "_", item.nodeid) + (f"-attempt{attempt}" if attempt > 1 else "")
+    log_file = Path(config.get_log_dir()) / "failed" / f"{name}.log"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    log_file.write_text(text, encoding="utf-8")
+    logger.info("FAILED {test}, log kept in {path}", test=item.nodeid, path=str(log_file))
+    if html_extras is not None:
+        report.extras = getattr(report, "extras", []) + [html_extras.text(text, name="Test log")]
+    if allure is not None:
+        allure.attach(text, name="Test log", attachment_type=allure.attachment_type.TEXT)
+
+
+def _only_unit_tests(pytest_config):
+    """Check if the run only targets tests/unit, which never needs a browser"""
+    unit_dir = Path(__file__).parent / "unit"
+    paths = [Path(arg.split("::")[0]).resolve() for arg in pytest_config.args]
+    return bool(paths) and all(path == unit_dir or unit_dir in path.parents for path in paths)
+
+
+def pytest_sessionstart(session):
+    """Start spare browsers before collection so the first test gets a warm one"""
+    global browser_launcher
+    if (config.get_prewarm_spares() <= 0 or is_xdist_controller(session.config)
+            or session.config.option.collectonly or _only_unit_tests(session.config)):
+        return
+    # Spares start headless whatever [ENVIRONMENT] headless says; prewarm_spares = 0 gives visible windows
+    browser_launcher = BrowserLauncher(
+        browser=get_run_option(session.config, "--browser", config.get_browser()),
+        headless=True,
+        spares=config.get_prewarm_spares(),
+        driver_options=get_driver_options(session.config)
     )
+    browser_launcher.start()
+
 
+def pytest_sessionfinish(session, exitstatus):
+    """Quit spare browsers and reap any driver/browser processes left behind"""
+    if browser_launcher:
+        browser_launcher.close()
+    
+    watchdog = DriverWatchdog.default()
+    watchdog.reap_all()
+    if not (is_xdist_controller(session.config) or session.config.option.collectonly):
+        write_worker_report(config.get_report_path(), "watchdog", watchdog.stats())
+        if resource_stats:
+            write_worker_report(config.get_report_path(), "resource_blocking", resource_stats)
+        if GridConnection.latencies:
+            write_worker_report(config.get_report_path(), "grid_latency", GridConnection.latency_summary())
+        if wait_timeouts:
+            audit = wait_timeout_audit()
+            write_worker_report(config.get_report_path(), "wait_timeouts", audit)
+            logger.warning(f"{audit['timeouts']} waits timed out, costing {audit['total_seconds']}s")
+        adaptive_timeouts = AdaptiveTimeouts.default()
+        if adaptive_timeouts.enabled:
+            adaptive_timeouts.save()
+            write_worker_report(config.get_report_path(), "adaptive_timeouts", adaptive_timeouts.report())
+        retry_policy = RetryPolicy.default()
+        if retry_policy.retries:
+            write_worker_report(config.get_report_path(), "retry_policy",
+                                {**retry_policy.stats(), 'avoided_reruns': len(avoided_reruns),
+                                 'recovered_tests': avoided_reruns})
+        if WaitProfiler.default().tests:
+            write_worker_report(config.get_report_path(), "wait_profile", WaitProfiler.default().report())
+        if CommandRecorder.default().tests:
+            write_worker_report(config.get_report_path(), "command_metrics", CommandRecorder.default().report())
+        if FormFillMetrics.default().forms:
+            write_worker_report(config.get_report_path(), "form_fill", FormFillMetrics.default().report())
+        if ElementCache.totals['hits'] or ElementCache.totals['misses']:
+            write_worker_report(config.get_report_path(), "element_cache", ElementCache.stats())
+        if SessionCache._default is not None:
+            write_worker_report(config.get_report_path(), "session_cache", SessionCache.default().stats())
+        if CartApi.totals['requests']:
+            write_worker_report(config.get_report_path(), "cart_api", CartApi.stats())
+    
+    # Flush this process's log queue; the controller (or a plain run) merges every worker's log
+    if test_log_buffer is not None and test_log_buffer.active:
+        # The last test never reached teardown (e.g. an interrupted run); keep what it logged
+        test_log_buffer.end(keep=True)
+    flush_logs()
+    if not hasattr(session.config, "workerinput"):
+        merge_worker_logs(config.get_log_dir(), config.get_report_path())
 
+
+def pytest_collection_modifyitems(items):
+    """Reject command_budget markers without a limit before any test runs"""
+    unbounded = CommandRecorder.unbounded_budgets(items)
+    if unbounded:
+        raise pytest.UsageError("command_budget needs a limit, e.g. @pytest.mark.command_budget(40): "
+                                + ", ".join(unbounded))
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item):
     """Setup before each test"""
+    if test_log_buffer is not None:
+        # Before fixtures run, so a failing setup's log is captured too
+        test_log_buffer.begin(item.nodeid)
+    item.recovered_steps_before = RetryPolicy.default().recovered
     logger.info(f"Starting test: {item.name}")
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Profile waiting versus acting for the test body"""
+    WaitProfiler.default().begin(item.nodeid)
+    yield
+    WaitProfiler.default().end()
+
+
+def pytest_runtest_logreport(report):
+    """Collect wait profiles for the HTML summary"""
+    profile = getattr(report, "wait_profile", None)
+    if report.when == "call" and profile:
+        reported_wait_profiles.append(profile)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_json_runtest_metadata(item, call):
+    """Add the wait profile to the JSON report"""
+    if call.when != "call":
+        return {}
+    return {'wait_profile': WaitProfiler.default().tests.get(item.nodeid)}
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_header(cells):
+    """Add a waiting percentage column to the HTML report"""
+    cells.insert(2, "<th>Waiting %</th>")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    """Fill the waiting percentage column"""
+    profile = getattr(report, "wait_profile", None)
+    cells.insert(2, f"<td>{profile['waiting_pct'] if profile else '-'}</td>")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    """Add a top slow waits table to the HTML report"""
+    slow_waits = WaitProfiler.top_slow_waits(reported_wait_profiles)
+    if not slow_waits:
+        return
+    rows = "".join(
+        f"<tr><td>{wait['seconds']:.2f}s</td><td>{html.escape(wait['kind'])}</td>"
+        f"<td>{html.escape(wait['locator'])}</td><td>{'ok' if wait['success'] else 'timeout'}</td>"
+        f"<td>{html.escape(wait['test'])}</td></tr>"
+        for wait in slow_waits
+    )
+    prefix.append("<h2>Top slow waits</h2><table><tr><th>Time</th><th>Condition</th><th>Locator</th>"
+                  f"<th>Outcome</th><th>Test</th></tr>{rows}</table>")
+
+
 def pytest_runtest_teardown(item, nextitem):
     """Teardown after each test"""
     logger.info(f"Completed test: {item.name}")
 
 
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Generate test report"""
+    outcome = yield
+    # Keep each phase's report on the item so fixtures can inspect it at teardown
+    report = outcome.get_result()
+    setattr(item, f"rep_{call.when}", report)
+    
     if call.when == "call":
+        report.wait_profile = WaitProfiler.default().tests.get(item.nodeid)
+        _enforce_command_budget(item, report)
+        recovered = RetryPolicy.default().recovered - getattr(item, "recovered_steps_before", 0)
+        if report.passed and recovered:
+            # Without step-level retries this test would have gone to pytest-rerunfailures
+            avoided_reruns[item.nodeid] = recovered
         if call.excinfo is not None:
             logger.error(f"Test {item.name} failed: {call.excinfo.value}")
         else:
             logger.info(f"Test {item.name} passed")
+    elif call.when == "teardown" and test_log_buffer is not None and test_log_buffer.active:
+        _keep_test_log(item, report)
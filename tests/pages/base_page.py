@@ -4,186 +4,504 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from loguru import logger
+import time
 
+from utils.config_reader import ConfigReader
 from utils.wait_utils import WaitUtils
 from utils.screenshot_utils import ScreenshotUtils
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.retry_policy import RetryPolicy
+from utils.wait_profiler import profiled
+from utils.form_metrics import FormFillMetrics
+from utils.element_cache import ElementCache
+
+
+# Builds one record per root element from a normalised schema in a single round trip
+EXTRACT_SCRIPT = """
+var by = arguments[0], value = arguments[1], schema = arguments[2];
+
+function roots() {
+    if (by === 'xpath') {
+        var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        return nodes;
+    }
+    var selectors = {'id': '#' + CSS.escape(value), 'class name': '.' + CSS.escape(value),
+                     'name': '[name="' + value + '"]', 'tag name': value, 'css selector': value};
+    return Array.prototype.slice.call(document.querySelectorAll(selectors[by]));
+}
+
+function visible(el) {
+    if (!el || !el.isConnected) return false;
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') return false;
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function number(raw) {
+    var match = String(raw === null || raw === undefined ? '' : raw).replace(/,/g, '').match(/-?\\d+(\\.\\d+)?/);
+    return match ? parseFloat(match[0]) : null;
+}
+
+return roots().map(function (root) {
+    var record = {};
+    Object.keys(schema).forEach(function (name) {
+        var field = schema[name];
+        var matches = field.selector ? root.querySelectorAll(field.selector) : [root];
+        var el = matches.length ? matches[field.index < 0 ? matches.length + field.index : field.index] : null;
+        var raw = null;
+        if (field.type === 'visible') {
+            raw = visible(el);
+        } else if (el) {
+            raw = field.attribute ? el.getAttribute(field.attribute)
+                : field.property ? el[field.property]
+                : (el.innerText || '').trim();
+        }
+        if (field.type === 'int' || field.type === 'float') {
+            raw = number(raw);
+            if (raw !== null && field.type === 'int') raw = Math.trunc(raw);
+        }
+        record[name] = raw === undefined ? null : raw;
+    });
+    return record;
+});
+"""
+
+
+# Element text and attribute values are logged as a preview; whole cart tables or checkout panes would
+# otherwise be formatted and written on every read
+LOG_PREVIEW_CHARS = 80
+
+# Sets form fields in order with the events a user's typing would fire; stops after a select that
+# has more fields after it, since its change handler may reload them (e.g. country -> region)
+FILL_FORM_SCRIPT = """
+var fields = arguments[0], start = arguments[1];
+
+function locate(by, value) {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    var selectors = {'id': '#' + CSS.escape(value), 'class name': '.' + CSS.escape(value),
+                     'name': '[name="' + value + '"]', 'tag name': value, 'css selector': value};
+    return document.querySelector(selectors[by]);
+}
+
+function fire(el, type) {
+    el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+
+for (var i = start; i < fields.length; i++) {
+    var field = fields[i], el = locate(field.by, field.value);
+    if (!el) return {error: 'element not found', index: i};
+    if (el.tagName === 'SELECT') {
+        var option = Array.prototype.find.call(el.options, function (o) { return o.text.trim() === field.text; });
+        if (!option) return {error: 'option not found', index: i};
+        el.value = option.value;
+        fire(el, 'input');
+        fire(el, 'change');
+        if (i + 1 < fields.length) return {next: i + 1};
+    } else {
+        el.focus();
+        // The prototype setter keeps frameworks that track the value property in sync
+        Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, field.text);
+        fire(el, 'input');
+        fire(el, 'change');
+        el.blur();
+    }
+}
+return {next: null};
+"""
 
 
 class BasePage:
     
+    # Minimal condition the page needs under eager/none page load strategies
+    READY_LOCATOR = None
+    
+    # The header's account menu links to logout for customers and to login for visitors
+    LOGGED_IN_LINK = (By.CSS_SELECTOR, "#top-links a[href*='route=account/logout']")
+    LOGGED_OUT_LINK = (By.CSS_SELECTOR, "#top-links a[href*='route=account/login']")
+    
     def __init__(self, driver: WebDriver, wait_utils: WaitUtils, screenshot_utils: ScreenshotUtils):
         self.driver = driver
         self.wait_utils = wait_utils
         self.screenshot_utils = screenshot_utils
         self.actions = ActionChains(driver)
+        self.page_url = "/"
+        self.adaptive_timeouts = AdaptiveTimeouts.default()
+        self.retry_policy = RetryPolicy.default()
+        config = ConfigReader()
+        self.form_fill_mode = config.get_form_fill_mode()
+        self.keystroke_forms = config.get_keystroke_forms()
+        self.probe_timeout = config.get_probe_timeout()
+        # Shared by every page object on this driver; waits that see the page change end its generation
+        self.element_cache = ElementCache.for_driver(driver)
+        if self.element_cache.on_wait not in wait_utils.listeners:
+            wait_utils.add_listener(self.element_cache.on_wait)
+    
+    def open_page(self):
+        """Open page_url on the current host and wait until the page is ready"""
+        parts = self.driver.current_url.split('/')
+        self.open_url(parts[0] + '//' + parts[2] + self.page_url)
+    
+    @profiled("navigation")
+    def open_url(self, url):
+        """Navigate to url and wait until the page is ready"""
+        strategy = self.wait_utils.get_page_load_strategy()
+        if strategy == "none":
+            # get() returns before the new document exists; wait for the old one to go
+            old_root = self.driver.find_element(By.TAG_NAME, "html")
+            self.driver.get(url)
+            self.wait_utils.wait.until(EC.staleness_of(old_root))
+        else:
+            self.driver.get(url)
+        self.element_cache.invalidate("navigation")
+        self.wait_until_ready()
+    
+    def wait_until_ready(self):
+        """Wait for the page's readiness condition"""
+        if self.wait_utils.get_page_load_strategy() == "normal" or self.READY_LOCATOR is None:
+            self.wait_utils.wait_for_page_load()
+        else:
+            self._wait_adaptively(self.wait_utils.wait_for_element_visible, self.READY_LOCATOR)
+            logger.debug("{page} ready: {locator}", page=type(self).__name__, locator=self.READY_LOCATOR)
     
     def find_element(self, locator):
         """one item"""
 
         try:
-            element = self.wait_utils.wait_for_element_visible(locator)
-            logger.debug(f"Element found: {locator}")
+            element = self.element_cache.get(
+                ("visible", locator), lambda: self._wait_adaptively(self.wait_utils.wait_for_element_visible, locator)
+            )
+            logger.debug("Element found: {locator}", locator=locator)
             return element
         except Exception as e:
-            logger.error(f"Element not found: {locator}, Error: {str(e)}")
+            logger.error("Element not found: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    def _with_element(self, locator, use):
+        """Call use(element) on the located element, re-resolving it once if the cached one went stale"""
+        try:
+            return use(self.find_element(locator))
+        except StaleElementReferenceException:
+            self.element_cache.stale_hit()
+            return use(self.find_element(locator))
+    
+    def _wait_adaptively(self, wait, locator):
+        """Run a WaitUtils wait with this page's learned timeout for locator and record how long it took"""
+        key = f"{type(self).__name__}:{locator[0]}={locator[1]}"
+        timeout = self.adaptive_timeouts.timeout_for(key, self.wait_utils.timeout)
+        start = time.perf_counter()
+        try:
+            element = wait(locator, timeout)
+        except TimeoutException:
+            self.adaptive_timeouts.record_timeout(key, timeout)
+            raise
+        self.adaptive_timeouts.record(key, time.perf_counter() - start, timeout)
+        return element
+    
+    @profiled("action")
     def find_elements(self, locator):
         """multiple"""
         try:
             elements = self.driver.find_elements(*locator)
-            logger.debug(f"Found {len(elements)} elements: {locator}")
+            logger.debug("Found {count} elements: {locator}", count=len(elements), locator=locator)
             return elements
         except Exception as e:
-            logger.error(f"Elements not found: {locator}, Error: {str(e)}")
+            logger.error("Elements not found: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    def find_cached_elements(self, locator):
+        """find_elements reused for the rest of the page generation (callers acting on them must end it)"""
+        return self.element_cache.get(("all", locator), lambda: self.find_elements(locator))
+    
+    @profiled("action")
+    def extract(self, root_locator, schema):
+        """Read one typed record per root element in a single script call"""
+        # schema maps field names to a CSS selector relative to the root (its text), None (the root's
+        # own text) or a dict of selector, attribute or property, index (-1 for the last match) and
+        # type (text, int, float or visible)
+        try:
+            fields = {}
+            for name, spec in schema.items():
+                spec = {'selector': spec} if spec is None or isinstance(spec, str) else spec
+                fields[name] = {'selector': spec.get('selector'), 'attribute': spec.get('attribute'),
+                                'property': spec.get('property'), 'index': spec.get('index', 0),
+                                'type': spec.get('type', 'text')}
+            records = self.driver.execute_script(EXTRACT_SCRIPT, root_locator[0], root_locator[1], fields)
+            logger.debug("Extracted {count} records: {root_locator}", count=len(records), root_locator=root_locator)
+            return records
+        except Exception as e:
+            logger.error("Failed to extract records: {root_locator}, Error: {error}",
+                         root_locator=root_locator, error=str(e))
+            raise
+    
+    @profiled("action")
     def click_element(self, locator):
         """Click"""
         try:
-            element = self.wait_utils.wait_for_element_clickable(locator)
-            element.click()
-            logger.info(f"Clicked element: {locator}")
+            # Re-resolve the element on every attempt so a re-rendered node is picked up
+            self.retry_policy.run(
+                lambda: self._wait_adaptively(self.wait_utils.wait_for_element_clickable, locator).click(),
+                f"click {locator}"
+            )
+            self.element_cache.invalidate("click")
+            logger.info("Clicked element: {locator}", locator=locator)
         except Exception as e:
-            logger.error(f"Failed to click element: {locator}, Error: {str(e)}")
+            logger.error("Failed to click element: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
     def send_keys_to_element(self, locator, text):
         """Send keys"""
         try:
-            element = self.find_element(locator)
-            element.clear()
-            element.send_keys(text)
-            logger.info(f"Sent keys '{text}' to element: {locator}")
+            def type_text(element):
+                element.clear()
+                element.send_keys(text)
+            
+            start = time.perf_counter()
+            self.retry_policy.run(lambda: self._with_element(locator, type_text), f"send keys to {locator}")
+            FormFillMetrics.default().record_keystroke_field(time.perf_counter() - start)
+            logger.info("Sent keys '{text}' to element: {locator}", text=text, locator=locator)
         except Exception as e:
-            logger.error(f"Failed to send keys to element: {locator}, Error: {str(e)}")
+            logger.error("Failed to send keys to element: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
+    def fill_form(self, fields, form="form"):
+        """Fill {locator: value} in order; selects are chosen by visible text"""
+        # Batched mode waits for the first field once and sets everything in one script call;
+        # forms listed in [FORMS] keystroke_forms (or mode = keystroke) are typed field by field
+        fields = [(locator, "" if value is None else str(value)) for locator, value in fields.items()]
+        mode = "keystroke" if self.form_fill_mode == "keystroke" or form in self.keystroke_forms else "batched"
+        start = time.perf_counter()
+        try:
+            if mode == "keystroke":
+                self._type_form(fields)
+            else:
+                self._set_form(fields)
+            elapsed = time.perf_counter() - start
+            # Change handlers may have re-rendered parts of the form
+            self.element_cache.invalidate("form")
+            FormFillMetrics.default().record(form, mode, len(fields), elapsed)
+            logger.info("Filled {form} ({count} fields, {mode}) in {elapsed:.2f}s",
+                        form=form, count=len(fields), mode=mode, elapsed=elapsed)
+        except Exception as e:
+            logger.error("Failed to fill {form}: {error}", form=form, error=str(e))
+            raise
+    
+    def _type_form(self, fields):
+        from selenium.webdriver.support.ui import Select
+        for locator, value in fields:
+            if self._with_element(locator, lambda element: element.tag_name.lower()) == "select":
+                self._with_element(locator, lambda element: Select(element).select_by_visible_text(value))
+                # The change may reload dependent fields
+                self.wait_utils.wait_for_network_idle()
+            else:
+                self.send_keys_to_element(locator, value)
+    
+    def _set_form(self, fields):
+        if not fields:
+            return
+        self._wait_adaptively(self.wait_utils.wait_for_element_visible, fields[0][0])
+        payload = [{'by': locator[0], 'value': locator[1], 'text': value} for locator, value in fields]
+        index = 0
+        while index is not None:
+            result = self.driver.execute_script(FILL_FORM_SCRIPT, payload, index)
+            if result.get('error'):
+                raise NoSuchElementException(f"{result['error']}: {fields[result['index']][0]}")
+            index = result['next']
+            if index is not None:
+                self.wait_utils.wait_for_network_idle()
+    
+    @profiled("action")
     def get_element_text(self, locator):
         """Gettext"""
         try:
-            element = self.find_element(locator)
-            text = element.text
-            logger.debug(f"Element text: {text}")
+            text = self._with_element(locator, lambda element: element.text)
+            logger.debug("Element text ({length} chars): {preview}", length=len(text), preview=text[:LOG_PREVIEW_CHARS])
             return text
         except Exception as e:
-            logger.error(f"Failed to get text from element: {locator}, Error: {str(e)}")
+            logger.error("Failed to get text from element: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
     def get_element_attribute(self, locator, attribute):
         """Get attribute value"""
         try:
-            element = self.find_element(locator)
-            value = element.get_attribute(attribute)
-            logger.debug(f"Element attribute '{attribute}': {value}")
+            value = self._with_element(locator, lambda element: element.get_attribute(attribute))
+            logger.debug("Element attribute '{attribute}': {preview}", attribute=attribute,
+                         preview=value[:LOG_PREVIEW_CHARS] if isinstance(value, str) else value)
             return value
         except Exception as e:
-            logger.error(f"Failed to get attribute from element: {locator}, Error: {str(e)}")
+            logger.error("Failed to get attribute from element: {locator}, Error: {error}",
+                         locator=locator, error=str(e))
             raise
     
-    def is_element_displayed(self, locator):
-        """Check display"""
+    def is_element_displayed(self, locator, timeout=0):
+        """Check display with one lookup, or waiting up to timeout seconds for it (never the full wait)"""
         try:
-            element = self.find_element(locator)
-            is_displayed = element.is_displayed()
-            logger.debug(f"Element displayed: {is_displayed}")
+            is_displayed = self._displayed_element(locator, timeout) is not None
+            logger.debug("Element displayed: {is_displayed}", is_displayed=is_displayed)
             return is_displayed
         except Exception:
-            logger.debug(f"Element not displayed: {locator}")
+            logger.debug("Element not displayed: {locator}", locator=locator)
             return False
     
-    def is_element_enabled(self, locator):
-        """Check enabled"""
+    def _displayed_element(self, locator, timeout):
+        """Get the displayed element for locator from the cache, one lookup or a wait, keeping it for find_element"""
+        key = ("visible", locator)
+        cached = self.element_cache.peek(key)
+        if cached is not None:
+            try:
+                return cached if cached.is_displayed() else None
+            except StaleElementReferenceException:
+                self.element_cache.stale_hit()
+        if timeout:
+            element = self.wait_utils.wait_for_element_visible(locator, timeout)
+        else:
+            elements = self.driver.find_elements(*locator)
+            if not elements or not elements[0].is_displayed():
+                return None
+            element = elements[0]
+        self.element_cache.put(key, element)
+        return element
+    
+    @profiled("action")
+    def is_present_now(self, locator):
+        """Check presence with a single lookup and no waiting (for negative checks)"""
+        # An element found visible in this generation is present without asking the browser again
+        present = (self.element_cache.peek(("visible", locator)) is not None
+                   or len(self.driver.find_elements(*locator)) > 0)
+        logger.debug("Element present now: {present} {locator}", present=present, locator=locator)
+        return present
+    
+    def is_absent_within(self, locator, timeout):
+        """Check that an element is gone or hidden within timeout seconds"""
         try:
-            element = self.find_element(locator)
-            is_enabled = element.is_enabled()
-            logger.debug(f"Element enabled: {is_enabled}")
+            return self.wait_utils.wait_for_element_to_disappear(locator, timeout)
+        except TimeoutException:
+            logger.debug("Element still displayed after {timeout}s: {locator}", timeout=timeout, locator=locator)
+            return False
+    
+    def is_logged_in(self):
+        """Check the header's account menu for the logout link (it is rendered hidden until opened)"""
+        try:
+            state = self.wait_utils.wait_for_any({'in': EC.presence_of_element_located(self.LOGGED_IN_LINK),
+                                                  'out': EC.presence_of_element_located(self.LOGGED_OUT_LINK)},
+                                                 self.probe_timeout)
+            return state == 'in'
+        except TimeoutException:
+            logger.debug("Header account menu not found")
+            return False
+    
+    def is_element_enabled(self, locator, timeout=0):
+        """Check enabled with one lookup, or waiting up to timeout seconds for the element to show"""
+        try:
+            if timeout:
+                is_enabled = self.wait_utils.wait_for_element_visible(locator, timeout).is_enabled()
+            else:
+                elements = self.driver.find_elements(*locator)
+                is_enabled = bool(elements) and elements[0].is_enabled()
+            logger.debug("Element enabled: {is_enabled}", is_enabled=is_enabled)
             return is_enabled
         except Exception:
-            logger.debug(f"Element not enabled: {locator}")
+            logger.debug("Element not enabled: {locator}", locator=locator)
             return False
     
     def is_element_selected(self, locator):
         """Check select"""
         try:
-            element = self.find_element(locator)
-            is_selected = element.is_selected()
-            logger.debug(f"Element selected: {is_selected}")
+            is_selected = self._with_element(locator, lambda element: element.is_selected())
+            logger.debug("Element selected: {is_selected}", is_selected=is_selected)
             return is_selected
         except Exception:
-            logger.debug(f"Element not selected: {locator}")
+            logger.debug("Element not selected: {locator}", locator=locator)
             return False
     
+    @profiled("action")
     def hover_over_element(self, locator):
         """Hover over element"""
         try:
-            element = self.find_element(locator)
-            self.actions.move_to_element(element).perform()
-            logger.info(f"Hovered over element: {locator}")
+            self._with_element(locator, lambda element: self.actions.move_to_element(element).perform())
+            logger.info("Hovered over element: {locator}", locator=locator)
         except Exception as e:
-            logger.error(f"Failed to hover over element: {locator}, Error: {str(e)}")
+            logger.error("Failed to hover over element: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
     def double_click_element(self, locator):
         """Double click on element"""
         try:
-            element = self.find_element(locator)
-            self.actions.double_click(element).perform()
-            logger.info(f"Double clicked element: {locator}")
+            self._with_element(locator, lambda element: self.actions.double_click(element).perform())
+            self.element_cache.invalidate("click")
+            logger.info("Double clicked element: {locator}", locator=locator)
         except Exception as e:
-            logger.error(f"Failed to double click element: {locator}, Error: {str(e)}")
+            logger.error("Failed to double click element: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
     def right_click_element(self, locator):
         """Right click on element"""
         try:
-            element = self.find_element(locator)
-            self.actions.context_click(element).perform()
-            logger.info(f"Right clicked element: {locator}")
+            self._with_element(locator, lambda element: self.actions.context_click(element).perform())
+            self.element_cache.invalidate("click")
+            logger.info("Right clicked element: {locator}", locator=locator)
         except Exception as e:
-            logger.error(f"Failed to right click element: {locator}, Error: {str(e)}")
+            logger.error("Failed to right click element: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
     def drag_and_drop(self, source_locator, target_locator):
         """Drag and drop element"""
         try:
             source_element = self.find_element(source_locator)
             target_element = self.find_element(target_locator)
             self.actions.drag_and_drop(source_element, target_element).perform()
-            logger.info(f"Dragged element from {source_locator} to {target_locator}")
+            self.element_cache.invalidate("click")
+            logger.info("Dragged element from {source_locator} to {target_locator}",
+                        source_locator=source_locator, target_locator=target_locator)
         except Exception as e:
-            logger.error(f"Failed to drag and drop: {str(e)}")
+            logger.error("Failed to drag and drop: {error}", error=str(e))
             raise
     
+    @profiled("action")
     def scroll_to_element(self, locator):
         """Scroll to element"""
         try:
-            element = self.find_element(locator)
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            logger.info(f"Scrolled to element: {locator}")
+            self._with_element(
+                locator, lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            )
+            logger.info("Scrolled to element: {locator}", locator=locator)
         except Exception as e:
-            logger.error(f"Failed to scroll to element: {locator}, Error: {str(e)}")
+            logger.error("Failed to scroll to element: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
     def scroll_to_top(self):
         """Scroll to top of page"""
         try:
             self.driver.execute_script("window.scrollTo(0, 0);")
             logger.info("Scrolled to top of page")
         except Exception as e:
-            logger.error(f"Failed to scroll to top: {str(e)}")
+            logger.error("Failed to scroll to top: {error}", error=str(e))
             raise
     
+    @profiled("action")
     def scroll_to_bottom(self):
         """Scroll to bottom of page"""
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             logger.info("Scrolled to bottom of page")
         except Exception as e:
-            logger.error(f"Failed to scroll to bottom: {str(e)}")
+            logger.error("Failed to scroll to bottom: {error}", error=str(e))
             raise
     
+    @profiled("action")
     def press_key(self, key):
         """Press a key"""
         try:
@@ -197,78 +515,85 @@ class BasePage:
                 self.actions.send_keys(Keys.SPACE).perform()
             else:
                 self.actions.send_keys(key).perform()
-            logger.info(f"Pressed key: {key}")
+            # ENTER may submit a form, ESCAPE may close a dialog
+            self.element_cache.invalidate("key")
+            logger.info("Pressed key: {key}", key=key)
         except Exception as e:
-            logger.error(f"Failed to press key: {key}, Error: {str(e)}")
+            logger.error("Failed to press key: {key}, Error: {error}", key=key, error=str(e))
             raise
     
+    @profiled("action")
     def select_dropdown_option(self, dropdown_locator, option_text):
         """Select option from dropdown by text"""
         try:
             from selenium.webdriver.support.ui import Select
-            dropdown = self.find_element(dropdown_locator)
-            select = Select(dropdown)
-            select.select_by_visible_text(option_text)
-            logger.info(f"Selected option '{option_text}' from dropdown: {dropdown_locator}")
+            self._with_element(dropdown_locator, lambda dropdown: Select(dropdown).select_by_visible_text(option_text))
+            self.element_cache.invalidate("select")
+            logger.info("Selected option '{option_text}' from dropdown: {dropdown_locator}",
+                        option_text=option_text, dropdown_locator=dropdown_locator)
         except Exception as e:
-            logger.error(f"Failed to select dropdown option: {str(e)}")
+            logger.error("Failed to select dropdown option: {error}", error=str(e))
             raise
     
+    @profiled("action")
     def select_dropdown_option_by_value(self, dropdown_locator, option_value):
         """Select option from dropdown by value"""
         try:
             from selenium.webdriver.support.ui import Select
-            dropdown = self.find_element(dropdown_locator)
-            select = Select(dropdown)
-            select.select_by_value(option_value)
-            logger.info(f"Selected option value '{option_value}' from dropdown: {dropdown_locator}")
+            self._with_element(dropdown_locator, lambda dropdown: Select(dropdown).select_by_value(option_value))
+            self.element_cache.invalidate("select")
+            logger.info("Selected option value '{option_value}' from dropdown: {dropdown_locator}",
+                        option_value=option_value, dropdown_locator=dropdown_locator)
         except Exception as e:
-            logger.error(f"Failed to select dropdown option by value: {str(e)}")
+            logger.error("Failed to select dropdown option by value: {error}", error=str(e))
             raise
     
     def wait_for_text_in_element(self, locator, text):
         """Wait for specific text in element"""
         try:
             self.wait_utils.wait_for_text_to_be_present_in_element(locator, text)
-            logger.info(f"Text '{text}' found in element: {locator}")
+            logger.info("Text '{text}' found in element: {locator}", text=text, locator=locator)
         except Exception as e:
-            logger.error(f"Text '{text}' not found in element: {locator}, Error: {str(e)}")
+            logger.error("Text '{text}' not found in element: {locator}, Error: {error}",
+                         text=text, locator=locator, error=str(e))
             raise
     
     def wait_for_element_to_disappear(self, locator):
         """Wait for element to disappear"""
         try:
             self.wait_utils.wait_for_element_to_disappear(locator)
-            logger.info(f"Element disappeared: {locator}")
+            logger.info("Element disappeared: {locator}", locator=locator)
         except Exception as e:
-            logger.error(f"Element did not disappear: {locator}, Error: {str(e)}")
+            logger.error("Element did not disappear: {locator}, Error: {error}", locator=locator, error=str(e))
             raise
     
+    @profiled("action")
     def switch_to_iframe(self, iframe_locator):
         """Switch to iframe"""
         try:
-            iframe = self.find_element(iframe_locator)
-            self.driver.switch_to.frame(iframe)
-            logger.info(f"Switched to iframe: {iframe_locator}")
+            self._with_element(iframe_locator, self.driver.switch_to.frame)
+            self.element_cache.invalidate("frame")
+            logger.info("Switched to iframe: {iframe_locator}", iframe_locator=iframe_locator)
         except Exception as e:
-            logger.error(f"Failed to switch to iframe: {str(e)}")
+            logger.error("Failed to switch to iframe: {error}", error=str(e))
             raise
     
     def switch_to_default_content(self):
         """Switch back to default content"""
         try:
             self.driver.switch_to.default_content()
+            self.element_cache.invalidate("frame")
             logger.info("Switched to default content")
         except Exception as e:
-            logger.error(f"Failed to switch to default content: {str(e)}")
+            logger.error("Failed to switch to default content: {error}", error=str(e))
             raise
     
+    @profiled("action")
     def upload_file(self, file_input_locator, file_path):
         """Upload file"""
         try:
-            file_input = self.find_element(file_input_locator)
-            file_input.send_keys(file_path)
-            logger.info(f"Uploaded file: {file_path}")
+            self._with_element(file_input_locator, lambda file_input: file_input.send_keys(file_path))
+            logger.info("Uploaded file: {file_path}", file_path=file_path)
         except Exception as e:
-            logger.error(f"Failed to upload file: {str(e)}")
+            logger.error("Failed to upload file: {error}", error=str(e))
             raise
@@ -1,5 +1,7 @@
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from loguru import logger
 
 from tests.pages.base_page import BasePage
@@ -8,6 +10,9 @@ from tests.pages.base_page import BasePage
 class CartPage(BasePage):
     """Shopping cart page class"""
     
+    # Readiness under eager/none page load
+    READY_LOCATOR = (By.CSS_SELECTOR, "#checkout-cart #content")
+    
     # Cart table
     CART_TABLE = (By.CSS_SELECTOR, ".table-responsive table")
     CART_ROWS = (By.CSS_SELECTOR, ".table-responsive tbody tr")
@@ -54,9 +59,7 @@ class CartPage(BasePage):
     def navigate_to_cart(self):
         """Navigate to shopping cart page"""
         try:
-            full_url = self.driver.current_url.split('/')[0] + '//' + self.driver.current_url.split('/')[2] + self.page_url
-            self.driver.get(full_url)
-            self.wait_utils.wait_for_page_load()
+            self.open_page()
             logger.info("Navigated to shopping cart page")
         except Exception as e:
             logger.error(f"Failed to navigate to cart: {str(e)}")
@@ -65,25 +68,14 @@ class CartPage(BasePage):
     def get_cart_items(self):
         """Get list of cart items"""
         try:
-            cart_rows = self.find_elements(self.CART_ROWS)
-            items = []
-            for row in cart_rows:
-                try:
-                    product_name = row.find_element(By.CSS_SELECTOR, "td.text-left a").text
-                    quantity_input = row.find_element(By.CSS_SELECTOR, "input[type='text']")
-                    quantity = quantity_input.get_attribute("value")
-                    price = row.find_element(By.CSS_SELECTOR, "td.text-right").text
-                    total = row.find_elements(By.CSS_SELECTOR, "td.text-right")[-1].text
-                    
-                    items.append({
-                        'product_name': product_name,
-                        'quantity': int(quantity),
-                        'price': price,
-                        'total': total
-                    })
-                except Exception as e:
-                    logger.warning(f"Failed to parse cart row: {str(e)}")
-                    continue
+            rows = self.extract(self.CART_ROWS, {
+                'product_name': "td.text-left a",
+                'quantity': {'selector': "input[type='text']", 'property': "value", 'type': "int"},
+                'price': "td.text-right",
+                'total': {'selector': "td.text-right", 'index': -1}
+            })
+            # Rows without a product link or quantity box are not product rows
+            items = [row for row in rows if row['product_name'] is not None and row['quantity'] is not None]
             
             logger.info(f"Found {len(items)} items in cart")
             return items
@@ -94,9 +86,8 @@ class CartPage(BasePage):
     def get_product_names(self):
         """Get list of product names in cart"""
         try:
-            product_elements = self.find_elements(self.PRODUCT_NAMES)
-            product_names = [element.text for element in product_elements]
-            logger.info(f"Cart product names: {product_names}")
+            product_names = [row['name'] for row in self.extract(self.PRODUCT_NAMES, {'name': None})]
+            logger.info("Cart has {count} product names", count=len(product_names), names=product_names)
             return product_names
         except Exception as e:
             logger.error(f"Failed to get product names: {str(e)}")
@@ -105,15 +96,16 @@ class CartPage(BasePage):
     def update_quantity(self, product_index, new_quantity):
         """Update quantity of specific product"""
         try:
-            quantity_inputs = self.find_elements(self.QUANTITY_INPUTS)
+            quantity_inputs = self.find_cached_elements(self.QUANTITY_INPUTS)
             if product_index < len(quantity_inputs):
                 quantity_inputs[product_index].clear()
                 quantity_inputs[product_index].send_keys(str(new_quantity))
                 
                 # Click update button
-                update_buttons = self.find_elements(self.UPDATE_QUANTITY_BUTTONS)
+                update_buttons = self.find_cached_elements(self.UPDATE_QUANTITY_BUTTONS)
                 if product_index < len(update_buttons):
                     update_buttons[product_index].click()
+                    self.element_cache.invalidate("click")
                 
                 logger.info(f"Updated quantity for product {product_index} to {new_quantity}")
                 return True
@@ -129,7 +121,7 @@ class CartPage(BasePage):
         try:
             remove_buttons = self.find_elements(self.REMOVE_BUTTONS)
             if product_index < len(remove_buttons):
-                remove_buttons[product_index].click()
+                self._click_remove(remove_buttons[product_index])
                 logger.info(f"Removed product {product_index} from cart")
                 return True
             else:
@@ -143,18 +135,32 @@ class CartPage(BasePage):
         """Remove everything from cart"""
         try:
             remove_buttons = self.find_elements(self.REMOVE_BUTTONS)
-            for i in range(len(remove_buttons)):
-                remove_buttons[i].click()
-                # Wait for page to update
-                self.wait_utils.wait_for_page_load()
-                # Refresh remove buttons list
-                remove_buttons = self.find_elements(self.REMOVE_BUTTONS)
+            removed = 0
+            while remove_buttons:
+                self._click_remove(remove_buttons[0])
+                remaining = self.find_elements(self.REMOVE_BUTTONS)
+                if len(remaining) >= len(remove_buttons):
+                    raise AssertionError(f"Cart still has {len(remaining)} items after a removal")
+                remove_buttons = remaining
+                removed += 1
             
-            logger.info("Cleared all items from cart")
+            logger.info(f"Cleared {removed} items from cart")
         except Exception as e:
             logger.error(f"Failed to clear cart: {str(e)}")
             raise
     
+    def _click_remove(self, button):
+        """Click a remove button and wait for the cart page that replaces it"""
+        button.click()
+        # cart.remove() posts the removal and then sets location=, so the network can go idle while the old
+        # document is still up; the clicked button only goes stale once the reloaded cart replaces it
+        try:
+            self.wait_utils.wait.until(EC.staleness_of(button))
+        except TimeoutException:
+            logger.warning("Cart page was not reloaded after a removal")
+        self.element_cache.invalidate("navigation")
+        self.wait_until_ready()
+    
     def get_subtotal(self):
         """Get cart subbtotal"""
         try:
@@ -210,15 +216,34 @@ class CartPage(BasePage):
             self.click_element(self.USE_COUPON_BUTTON)
             self.send_keys_to_element(self.COUPON_INPUT, coupon_code)
             self.click_element(self.COUPON_APPLY_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info(f"applied coupon code: {coupon_code}")
         except Exception as e:
             logger.error(f"Failed to apply coupon code: {str(e)}")
             raise
     
+    def get_coupon_outcome(self):
+        """Wait for the coupon success or error alert and return (outcome, message)"""
+        return self._get_alert_outcome(self.COUPON_SUCCESS_MESSAGE, self.COUPON_ERROR_MESSAGE)
+    
+    def get_gift_certificate_outcome(self):
+        """Wait for the gift certificate success or error alert and return (outcome, message)"""
+        return self._get_alert_outcome(self.GIFT_CERTIFICATE_SUCCESS_MESSAGE, self.GIFT_CERTIFICATE_ERROR_MESSAGE)
+    
+    def _get_alert_outcome(self, success_locator, error_locator):
+        try:
+            outcome = self.wait_utils.wait_for_any({'success': success_locator, 'error': error_locator})
+            message = self.get_element_text(success_locator if outcome == 'success' else error_locator)
+            logger.info(f"Cart {outcome} message: {message}")
+            return outcome, message
+        except Exception as e:
+            logger.error(f"No cart success or error message: {str(e)}")
+            return None, None
+    
     def get_coupon_success_message(self):
         """coupon success mssg"""
         try:
-            if self.is_element_displayed(self.COUPON_SUCCESS_MESSAGE):
+            if self.is_present_now(self.COUPON_SUCCESS_MESSAGE):
                 message = self.get_element_text(self.COUPON_SUCCESS_MESSAGE)
                 logger.info(f"Coupon success mssg: {message}")
                 return message
@@ -230,7 +255,7 @@ class CartPage(BasePage):
     def get_coupon_error_message(self):
         """coupon error mssg"""
         try:
-            if self.is_element_displayed(self.COUPON_ERROR_MESSAGE):
+            if self.is_present_now(self.COUPON_ERROR_MESSAGE):
                 message = self.get_element_text(self.COUPON_ERROR_MESSAGE)
                 logger.info(f"Coupon error mssg: {message}")
                 return message
@@ -245,6 +270,7 @@ class CartPage(BasePage):
             self.click_element(self.USE_GIFT_CERTIFICATE_BUTTON)
             self.send_keys_to_element(self.GIFT_CERTIFICATE_INPUT, gift_certificate_code)
             self.click_element(self.GIFT_CERTIFICATE_APPLY_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info(f"gift certificate: {gift_certificate_code}")
         except Exception as e:
             logger.error(f"Failed gift certificate: {str(e)}")
@@ -253,7 +279,7 @@ class CartPage(BasePage):
     def get_gift_certificate_success_message(self):
         """gift certificate success msg"""
         try:
-            if self.is_element_displayed(self.GIFT_CERTIFICATE_SUCCESS_MESSAGE):
+            if self.is_present_now(self.GIFT_CERTIFICATE_SUCCESS_MESSAGE):
                 message = self.get_element_text(self.GIFT_CERTIFICATE_SUCCESS_MESSAGE)
                 logger.info(f"Gift certificate success msg: {message}")
                 return message
@@ -265,7 +291,7 @@ class CartPage(BasePage):
     def get_gift_certificate_error_message(self):
         """Get gift certificate error message"""
         try:
-            if self.is_element_displayed(self.GIFT_CERTIFICATE_ERROR_MESSAGE):
+            if self.is_present_now(self.GIFT_CERTIFICATE_ERROR_MESSAGE):
                 message = self.get_element_text(self.GIFT_CERTIFICATE_ERROR_MESSAGE)
                 logger.info(f"Gift certificate error message: {message}")
                 return message
@@ -7,6 +7,9 @@ from tests.pages.base_page import BasePage
 class CheckoutPage(BasePage):
     """Checkout page class"""
     
+    # Readiness under eager/none page load
+    READY_LOCATOR = (By.CSS_SELECTOR, "#checkout-checkout #accordion")
+    
     # Billing details
     FIRST_NAME_INPUT = (By.ID, "input-payment-firstname")
     LAST_NAME_INPUT = (By.ID, "input-payment-lastname")
@@ -73,9 +76,7 @@ class CheckoutPage(BasePage):
     def navigate_to_checkout(self):
         """Navigate chqout page"""
         try:
-            full_url = self.driver.current_url.split('/')[0] + '//' + self.driver.current_url.split('/')[2] + self.page_url
-            self.driver.get(full_url)
-            self.wait_utils.wait_for_page_load()
+            self.open_page()
             logger.info("Navigated to chqout page")
         except Exception as e:
             logger.error(f"Failed to navigate to cheqout: {str(e)}")
@@ -84,21 +85,21 @@ class CheckoutPage(BasePage):
     def fill_billing_details(self, billing_data):
         """Fill billingform"""
         try:
-            self.send_keys_to_element(self.FIRST_NAME_INPUT, billing_data.get('first_name', ''))
-            self.send_keys_to_element(self.LAST_NAME_INPUT, billing_data.get('last_name', ''))
-            self.send_keys_to_element(self.COMPANY_INPUT, billing_data.get('company', ''))
-            self.send_keys_to_element(self.ADDRESS_1_INPUT, billing_data.get('address_1', ''))
-            self.send_keys_to_element(self.ADDRESS_2_INPUT, billing_data.get('address_2', ''))
-            self.send_keys_to_element(self.CITY_INPUT, billing_data.get('city', ''))
-            self.send_keys_to_element(self.POSTCODE_INPUT, billing_data.get('postcode', ''))
-            
-            # Select country
+            fields = {
+                self.FIRST_NAME_INPUT: billing_data.get('first_name', ''),
+                self.LAST_NAME_INPUT: billing_data.get('last_name', ''),
+                self.COMPANY_INPUT: billing_data.get('company', ''),
+                self.ADDRESS_1_INPUT: billing_data.get('address_1', ''),
+                self.ADDRESS_2_INPUT: billing_data.get('address_2', ''),
+                self.CITY_INPUT: billing_data.get('city', ''),
+                self.POSTCODE_INPUT: billing_data.get('postcode', '')
+            }
+            # Region options are reloaded for the selected country, so region goes after it
             if billing_data.get('country'):
-                self.select_dropdown_option(self.COUNTRY_SELECT, billing_data['country'])
-            
-            # Select region
+                fields[self.COUNTRY_SELECT] = billing_data['country']
             if billing_data.get('region'):
-                self.select_dropdown_option(self.REGION_SELECT, billing_data['region'])
+                fields[self.REGION_SELECT] = billing_data['region']
+            self.fill_form(fields, form="billing")
             
             logger.info("FilleD billing details")
         except Exception as e:
@@ -108,8 +109,10 @@ class CheckoutPage(BasePage):
     def fill_account_details(self, account_data):
         """Fill account details form"""
         try:
-            self.send_keys_to_element(self.EMAIL_INPUT, account_data.get('email', ''))
-            self.send_keys_to_element(self.TELEPHONE_INPUT, account_data.get('telephone', ''))
+            self.fill_form({
+                self.EMAIL_INPUT: account_data.get('email', ''),
+                self.TELEPHONE_INPUT: account_data.get('telephone', '')
+            }, form="account")
             logger.info("Filled account details")
         except Exception as e:
             logger.error(f"Failed to fill account details: {str(e)}")
@@ -118,21 +121,21 @@ class CheckoutPage(BasePage):
     def fill_delivery_details(self, delivery_data):
         """Fill delivery details form"""
         try:
-            self.send_keys_to_element(self.DELIVERY_FIRST_NAME_INPUT, delivery_data.get('first_name', ''))
-            self.send_keys_to_element(self.DELIVERY_LAST_NAME_INPUT, delivery_data.get('last_name', ''))
-            self.send_keys_to_element(self.DELIVERY_COMPANY_INPUT, delivery_data.get('company', ''))
-            self.send_keys_to_element(self.DELIVERY_ADDRESS_1_INPUT, delivery_data.get('address_1', ''))
-            self.send_keys_to_element(self.DELIVERY_ADDRESS_2_INPUT, delivery_data.get('address_2', ''))
-            self.send_keys_to_element(self.DELIVERY_CITY_INPUT, delivery_data.get('city', ''))
-            self.send_keys_to_element(self.DELIVERY_POSTCODE_INPUT, delivery_data.get('postcode', ''))
-            
-            # Select country
+            fields = {
+                self.DELIVERY_FIRST_NAME_INPUT: delivery_data.get('first_name', ''),
+                self.DELIVERY_LAST_NAME_INPUT: delivery_data.get('last_name', ''),
+                self.DELIVERY_COMPANY_INPUT: delivery_data.get('company', ''),
+                self.DELIVERY_ADDRESS_1_INPUT: delivery_data.get('address_1', ''),
+                self.DELIVERY_ADDRESS_2_INPUT: delivery_data.get('address_2', ''),
+                self.DELIVERY_CITY_INPUT: delivery_data.get('city', ''),
+                self.DELIVERY_POSTCODE_INPUT: delivery_data.get('postcode', '')
+            }
+            # Region options are reloaded for the selected country, so region goes after it
             if delivery_data.get('country'):
-                self.select_dropdown_option(self.DELIVERY_COUNTRY_SELECT, delivery_data['country'])
-            
-            # Select region
+                fields[self.DELIVERY_COUNTRY_SELECT] = delivery_data['country']
             if delivery_data.get('region'):
-                self.select_dropdown_option(self.DELIVERY_REGION_SELECT, delivery_data['region'])
+                fields[self.DELIVERY_REGION_SELECT] = delivery_data['region']
+            self.fill_form(fields, form="delivery")
             
             logger.info("Filled delivery details")
         except Exception as e:
@@ -229,6 +232,7 @@ class CheckoutPage(BasePage):
         """Click continue button"""
         try:
             self.click_element(self.CONTINUE_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info("Clicked continue button")
         except Exception as e:
             logger.error(f"Failed to click continue: {str(e)}")
@@ -238,6 +242,7 @@ class CheckoutPage(BasePage):
         """Click continue shipping button"""
         try:
             self.click_element(self.CONTINUE_SHIPPING_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info("Clicked continue shipping button")
         except Exception as e:
             logger.error(f"Failed to click continue shipping: {str(e)}")
@@ -247,6 +252,7 @@ class CheckoutPage(BasePage):
         """Click continue shipping method button"""
         try:
             self.click_element(self.CONTINUE_SHIPPING_METHOD_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info("Clicked continue shipping method button")
         except Exception as e:
             logger.error(f"Failed to click continue shipping method: {str(e)}")
@@ -256,6 +262,7 @@ class CheckoutPage(BasePage):
         """Click continue payment method button"""
         try:
             self.click_element(self.CONTINUE_PAYMENT_METHOD_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info("Clicked continue payment method button")
         except Exception as e:
             logger.error(f"Failed to click continue payment method: {str(e)}")
@@ -265,6 +272,7 @@ class CheckoutPage(BasePage):
         """Confirm order"""
         try:
             self.click_element(self.CONFIRM_ORDER_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info("Confirmed order")
         except Exception as e:
             logger.error(f"Failed to confirm order: {str(e)}")
@@ -289,7 +297,10 @@ class CheckoutPage(BasePage):
     def get_order_confirmation(self):
         """Get order confirmation message"""
         try:
-            if self.is_element_displayed(self.ORDER_CONFIRMATION):
+            # The checkout page has a title too, so wait the full timeout for the redirect to the success page;
+            # it only starts once the confirm request has returned
+            self.wait_utils.wait_for_url_contains("route=checkout/success")
+            if self.is_absent_within(self.CONFIRM_ORDER_BUTTON, self.probe_timeout):
                 confirmation = self.get_element_text(self.ORDER_CONFIRMATION)
                 logger.info(f"Order confirmation: {confirmation}")
                 return confirmation
@@ -312,7 +323,7 @@ class CheckoutPage(BasePage):
     def get_success_message(self):
         """Get success message"""
         try:
-            if self.is_element_displayed(self.SUCCESS_MESSAGE):
+            if self.is_present_now(self.SUCCESS_MESSAGE):
                 message = self.get_element_text(self.SUCCESS_MESSAGE)
                 logger.info(f"Success message: {message}")
                 return message
@@ -333,27 +344,18 @@ class CheckoutPage(BasePage):
             # Click continue
             self.click_continue()
             
-            # Wait for shipping section
-            self.wait_utils.wait_for_page_load()
-            
             # Check same as billing if delivery data not provided
             self.check_same_as_billing()
             
             # Click continue shipping
             self.click_continue_shipping()
             
-            # Wait for shipping method section
-            self.wait_utils.wait_for_page_load()
-            
             # Select shipping method
             self.select_shipping_method()
             
             # Click continue shipping method
             self.click_continue_shipping_method()
             
-            # Wait for payment method section
-            self.wait_utils.wait_for_page_load()
-            
             # Select payment method
             self.select_payment_method(payment_method)
             
@@ -364,9 +366,6 @@ class CheckoutPage(BasePage):
             # Click continue payment method
             self.click_continue_payment_method()
             
-            # Wait for confirm order section
-            self.wait_utils.wait_for_page_load()
-            
             # Confirm order
             self.confirm_order()
             
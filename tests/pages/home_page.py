@@ -40,6 +40,9 @@ class HomePage(BasePage):
     ADD_TO_WISHLIST_BUTTONS = (By.CSS_SELECTOR, ".product-layout .button-group .btn-default")
     COMPARE_BUTTONS = (By.CSS_SELECTOR, ".product-layout .button-group .btn-default[data-original-title='Compare this Product']")
     
+    # Readiness under eager/none page load
+    READY_LOCATOR = (By.CSS_SELECTOR, "#common-home .product-layout")
+    
     # Carousel
     CAROUSEL_NEXT = (By.CSS_SELECTOR, ".carousel-control.right")
     CAROUSEL_PREV = (By.CSS_SELECTOR, ".carousel-control.left")
@@ -52,8 +55,7 @@ class HomePage(BasePage):
     def navigate_to_home_page(self):
         """Navigate to home page"""
         try:
-            self.driver.get(self.driver.current_url.split('/')[0] + '//' + self.driver.current_url.split('/')[2] + self.page_url)
-            self.wait_utils.wait_for_page_load()
+            self.open_page()
             logger.info("Navigated to home page")
         except Exception as e:
             logger.error(f"Failed to navigate to home page: {str(e)}")
@@ -72,6 +74,7 @@ class HomePage(BasePage):
     def get_cart_items_count(self):
         """Get number of items in cart"""
         try:
+            # Zero-wait: an empty cart has no badge. A displayed badge is cached, so reading it is no second lookup
             if self.is_element_displayed(self.CART_ITEMS_COUNT):
                 count_text = self.get_element_text(self.CART_ITEMS_COUNT)
                 return int(count_text) if count_text.isdigit() else 0
@@ -171,9 +174,8 @@ class HomePage(BasePage):
     def get_product_names(self):
         """Get list of product names"""
         try:
-            product_elements = self.find_elements(self.PRODUCT_NAMES)
-            product_names = [element.text for element in product_elements]
-            logger.info(f"Found product names: {product_names}")
+            product_names = [row['name'] for row in self.extract(self.PRODUCT_NAMES, {'name': None})]
+            logger.info("Found {count} product names", count=len(product_names), names=product_names)
             return product_names
         except Exception as e:
             logger.error(f"Failed to get product names: {str(e)}")
@@ -185,6 +187,7 @@ class HomePage(BasePage):
             add_to_cart_buttons = self.find_elements(self.ADD_TO_CART_BUTTONS)
             if product_index < len(add_to_cart_buttons):
                 add_to_cart_buttons[product_index].click()
+                self.wait_utils.wait_for_network_idle()
                 logger.info(f"Added product {product_index} to cart")
                 return True
             else:
@@ -2,6 +2,7 @@
 Login Page Object Model
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from loguru import logger
 
 from tests.pages.base_page import BasePage
@@ -10,6 +11,9 @@ from tests.pages.base_page import BasePage
 class LoginPage(BasePage):
     """Login page class"""
     
+    # Readiness under eager/none page load
+    READY_LOCATOR = (By.CSS_SELECTOR, "#account-login #input-email")
+    
     # Locators
     EMAIL_INPUT = (By.ID, "input-email")
     PASSWORD_INPUT = (By.ID, "input-password")
@@ -21,6 +25,7 @@ class LoginPage(BasePage):
     SUCCESS_MESSAGE = (By.CLASS_NAME, "alert-success")
     ACCOUNT_DROPDOWN = (By.CSS_SELECTOR, ".dropdown .dropdown-toggle")
     LOGOUT_LINK = (By.LINK_TEXT, "Logout")
+    ACCOUNT_PAGE = (By.ID, "account-account")
     
     def __init__(self, driver, wait_utils, screenshot_utils):
         super().__init__(driver, wait_utils, screenshot_utils)
@@ -29,9 +34,7 @@ class LoginPage(BasePage):
     def navigate_to_login_page(self):
         """Navigate to login page"""
         try:
-            full_url = self.driver.current_url.split('/')[0] + '//' + self.driver.current_url.split('/')[2] + self.page_url
-            self.driver.get(full_url)
-            self.wait_utils.wait_for_page_load()
+            self.open_page()
             logger.info("Navigated to login page")
         except Exception as e:
             logger.error(f"Failed to navigate to login page: {str(e)}")
@@ -105,7 +108,7 @@ class LoginPage(BasePage):
     def get_error_message(self):
         """Get error message text"""
         try:
-            if self.is_element_displayed(self.ERROR_MESSAGE):
+            if self.is_present_now(self.ERROR_MESSAGE):
                 error_text = self.get_element_text(self.ERROR_MESSAGE)
                 logger.info(f"Error message: {error_text}")
                 return error_text
@@ -117,7 +120,7 @@ class LoginPage(BasePage):
     def get_success_message(self):
         """Get success message text"""
         try:
-            if self.is_element_displayed(self.SUCCESS_MESSAGE):
+            if self.is_present_now(self.SUCCESS_MESSAGE):
                 success_text = self.get_element_text(self.SUCCESS_MESSAGE)
                 logger.info(f"Success message: {success_text}")
                 return success_text
@@ -129,8 +132,8 @@ class LoginPage(BasePage):
     def is_login_successful(self):
         """Check if login was successful"""
         try:
-            # Check if account dropdown is visible (indicates successful login)
-            return self.is_element_displayed(self.ACCOUNT_DROPDOWN)
+            # The account dropdown is rendered for visitors too; only the account page proves the login
+            return self.wait_for_login_outcome() == "success"
         except Exception as e:
             logger.error(f"Failed to check login status: {str(e)}")
             return False
@@ -138,8 +141,7 @@ class LoginPage(BasePage):
     def login(self, email, password, remember_me=False):
         """Complete login process"""
         try:
-            self.enter_email(email)
-            self.enter_password(password)
+            self.fill_form({self.EMAIL_INPUT: email, self.PASSWORD_INPUT: password}, form="login")
             
             if remember_me:
                 self.check_remember_me()
@@ -147,7 +149,7 @@ class LoginPage(BasePage):
             self.click_login_button()
             
             # Wait for login to complete
-            if self.is_login_successful():
+            if self.wait_for_login_outcome() == "success":
                 logger.info("Login successful")
                 return True
             else:
@@ -158,6 +160,14 @@ class LoginPage(BasePage):
             logger.error(f"Login process failed: {str(e)}")
             raise
     
+    def wait_for_login_outcome(self):
+        """Wait for the account page or the error alert, whichever comes first"""
+        try:
+            return self.wait_utils.wait_for_any({'success': self.ACCOUNT_PAGE, 'error': self.ERROR_MESSAGE})
+        except TimeoutException:
+            logger.warning("Login ended in neither the account page nor an error")
+            return None
+    
     def logout(self):
         """Logout from account"""
         try:
@@ -166,24 +176,18 @@ class LoginPage(BasePage):
             
             # Click logout link
             self.click_element(self.LOGOUT_LINK)
+            self.wait_utils.wait_for_url_contains("route=account/logout")
             
             logger.info("Logged out successfully")
         except Exception as e:
             logger.error(f"Failed to logout: {str(e)}")
             raise
     
-    def is_logged_in(self):
-        """Check if user is logged in"""
-        try:
-            return self.is_element_displayed(self.ACCOUNT_DROPDOWN)
-        except Exception:
-            return False
-    
     def clear_login_form(self):
         """Clear login form fields"""
         try:
-            self.find_element(self.EMAIL_INPUT).clear()
-            self.find_element(self.PASSWORD_INPUT).clear()
+            self._with_element(self.EMAIL_INPUT, lambda element: element.clear())
+            self._with_element(self.PASSWORD_INPUT, lambda element: element.clear())
             logger.info("Cleared login form")
         except Exception as e:
             logger.error(f"Failed to clear login form: {str(e)}")
@@ -10,6 +10,9 @@ from tests.pages.base_page import BasePage
 class ProductPage(BasePage):
     """Product page class"""
     
+    # Readiness under eager/none page load
+    READY_LOCATOR = (By.CSS_SELECTOR, "#product-product #button-cart")
+    
     # Product details
     PRODUCT_NAME = (By.CSS_SELECTOR, "h1")
     PRODUCT_PRICE = (By.CSS_SELECTOR, ".price-new, .price")
@@ -104,6 +107,7 @@ class ProductPage(BasePage):
                 self.set_quantity(quantity)
             
             self.click_element(self.ADD_TO_CART_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info(f"Added {quantity} items to cart")
         except Exception as e:
             logger.error(f"Failed to add to cart: {str(e)}")
@@ -193,15 +197,29 @@ class ProductPage(BasePage):
             
             # Submit review
             self.click_element(self.REVIEW_SUBMIT_BUTTON)
+            self.wait_utils.wait_for_network_idle()
             logger.info(f"Submitted review with rating {rating}")
         except Exception as e:
             logger.error(f"Failed to write review: {str(e)}")
             raise
     
+    def get_review_outcome(self):
+        """Wait for the review success or error alert and return (outcome, message)"""
+        try:
+            outcome = self.wait_utils.wait_for_any({'success': self.REVIEW_SUCCESS_MESSAGE,
+                                                    'error': self.REVIEW_ERROR_MESSAGE})
+            locator = self.REVIEW_SUCCESS_MESSAGE if outcome == 'success' else self.REVIEW_ERROR_MESSAGE
+            message = self.get_element_text(locator)
+            logger.info(f"Review {outcome} message: {message}")
+            return outcome, message
+        except Exception as e:
+            logger.error(f"No review success or error message: {str(e)}")
+            return None, None
+    
     def get_review_success_message(self):
         """Get review success message"""
         try:
-            if self.is_element_displayed(self.REVIEW_SUCCESS_MESSAGE):
+            if self.is_present_now(self.REVIEW_SUCCESS_MESSAGE):
                 message = self.get_element_text(self.REVIEW_SUCCESS_MESSAGE)
                 logger.info(f"Review success message: {message}")
                 return message
@@ -213,7 +231,7 @@ class ProductPage(BasePage):
     def get_review_error_message(self):
         """Get review error message"""
         try:
-            if self.is_element_displayed(self.REVIEW_ERROR_MESSAGE):
+            if self.is_present_now(self.REVIEW_ERROR_MESSAGE):
                 message = self.get_element_text(self.REVIEW_ERROR_MESSAGE)
                 logger.info(f"Review error message: {message}")
                 return message
@@ -235,9 +253,8 @@ class ProductPage(BasePage):
     def get_related_product_names(self):
         """Get names of related products"""
         try:
-            product_elements = self.find_elements(self.RELATED_PRODUCT_NAMES)
-            product_names = [element.text for element in product_elements]
-            logger.info(f"Related product names: {product_names}")
+            product_names = [row['name'] for row in self.extract(self.RELATED_PRODUCT_NAMES, {'name': None})]
+            logger.info("Found {count} related product names", count=len(product_names), names=product_names)
             return product_names
         except Exception as e:
             logger.error(f"Failed to get related product names: {str(e)}")
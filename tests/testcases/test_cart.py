@@ -82,13 +82,10 @@ class TestCart:
             logger.error(f"Add multiple products test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items()
     def test_update_product_quantity(self):
         """Test updating product quantity in cart"""
         try:
-            # Add product to cart first
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -110,13 +107,10 @@ class TestCart:
             logger.error(f"Update quantity test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items()
     def test_remove_product_from_cart(self):
         """Test removing product from cart"""
         try:
-            # Add product to cart first
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -138,14 +132,10 @@ class TestCart:
             logger.error(f"Remove product test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items(43, 40, 33)
     def test_clear_cart(self):
         """Test clearing entire cart"""
         try:
-            # Add multiple products to cart
-            self.home_page.navigate_to_home_page()
-            for i in range(3):
-                self.home_page.add_product_to_cart(i)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -162,13 +152,10 @@ class TestCart:
             logger.error(f"Clear cart test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items()
     def test_cart_price_calculation(self):
         """Test cart price calculation"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -188,13 +175,10 @@ class TestCart:
             logger.error(f"Price calculation test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items()
     def test_coupon_code_application(self):
         """Test applying coupon code"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -202,13 +186,9 @@ class TestCart:
             test_coupon = "TEST123"
             self.cart_page.apply_coupon_code(test_coupon)
             
-            # Check for success or error message
-            success_message = self.cart_page.get_coupon_success_message()
-            error_message = self.cart_page.get_coupon_error_message()
-            
             # Either success or error message should be displayed
-            assert success_message is not None or error_message is not None, \
-                "Coupon application should show a message"
+            outcome, message = self.cart_page.get_coupon_outcome()
+            assert outcome is not None, "Coupon application should show a message"
             
             logger.info("Coupon code application test passed")
             
@@ -217,13 +197,10 @@ class TestCart:
             logger.error(f"Coupon code test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items()
     def test_gift_certificate_application(self):
         """Test applying gift certificate"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -231,13 +208,9 @@ class TestCart:
             test_gift_cert = "GIFT123"
             self.cart_page.apply_gift_certificate(test_gift_cert)
             
-            # Check for success or error message
-            success_message = self.cart_page.get_gift_certificate_success_message()
-            error_message = self.cart_page.get_gift_certificate_error_message()
-            
             # Either success or error message should be displayed
-            assert success_message is not None or error_message is not None, \
-                "Gift certificate application should show a message"
+            outcome, message = self.cart_page.get_gift_certificate_outcome()
+            assert outcome is not None, "Gift certificate application should show a message"
             
             logger.info("Gift certificate application test passed")
             
@@ -246,13 +219,10 @@ class TestCart:
             logger.error(f"Gift certificate test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items()
     def test_continue_shopping(self):
         """Test continue shopping functionality"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -270,13 +240,10 @@ class TestCart:
             logger.error(f"Continue shopping test failed: {str(e)}")
             raise
     
+    @pytest.mark.cart_items()
     def test_checkout_navigation(self):
         """Test checkout navigation"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart
             self.cart_page.navigate_to_cart()
             
@@ -11,6 +11,8 @@ from tests.pages.login_page import LoginPage
 from utils.data_utils import DataUtils
 
 
+# Every test here is about checkout, so the cart is seeded over HTTP instead of through the UI
+@pytest.mark.cart_items()
 class TestCheckout:
     """Test class for checkout functionality"""
     
@@ -29,10 +31,6 @@ class TestCheckout:
     def test_guest_checkout(self):
         """Test guest checkout process"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart and proceed to checkout
             self.cart_page.navigate_to_cart()
             self.cart_page.click_checkout()
@@ -72,17 +70,11 @@ class TestCheckout:
             logger.error(f"Guest checkout test failed: {str(e)}")
             raise
     
-    def test_logged_in_user_checkout(self, test_config):
+    def test_logged_in_user_checkout(self, test_config, authenticated_session):
         """Test checkout for logged in user"""
         try:
-            # Login first
-            self.login_page.navigate_to_login_page()
+            # The browser starts logged in from the cached session, with the product in the cart
             credentials = test_config.get_valid_credentials()
-            self.login_page.login(credentials['username'], credentials['password'])
-            
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
             
             # Navigate to cart and proceed to checkout
             self.cart_page.navigate_to_cart()
@@ -127,10 +119,6 @@ class TestCheckout:
     def test_different_payment_methods(self, payment_method):
         """Test different payment methods"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart and proceed to checkout
             self.cart_page.navigate_to_cart()
             self.cart_page.click_checkout()
@@ -171,10 +159,6 @@ class TestCheckout:
     def test_checkout_with_different_delivery_address(self):
         """Test checkout with different delivery address"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart and proceed to checkout
             self.cart_page.navigate_to_cart()
             self.cart_page.click_checkout()
@@ -203,9 +187,6 @@ class TestCheckout:
             self.checkout_page.fill_account_details(account_data)
             self.checkout_page.click_continue()
             
-            # Wait for shipping section
-            self.wait_utils.wait_for_page_load()
-            
             # Uncheck same as billing
             self.checkout_page.uncheck_same_as_billing()
             
@@ -224,17 +205,14 @@ class TestCheckout:
             self.checkout_page.click_continue_shipping()
             
             # Continue with rest of checkout
-            self.wait_utils.wait_for_page_load()
             self.checkout_page.select_shipping_method()
             self.checkout_page.click_continue_shipping_method()
             
-            self.wait_utils.wait_for_page_load()
             self.checkout_page.select_payment_method()
             self.checkout_page.accept_terms_and_conditions()
             self.checkout_page.accept_privacy_policy()
             self.checkout_page.click_continue_payment_method()
             
-            self.wait_utils.wait_for_page_load()
             self.checkout_page.confirm_order()
             
             # Verify order confirmation
@@ -251,10 +229,6 @@ class TestCheckout:
     def test_checkout_validation_errors(self):
         """Test checkout form validation"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart and proceed to checkout
             self.cart_page.navigate_to_cart()
             self.cart_page.click_checkout()
@@ -279,10 +253,6 @@ class TestCheckout:
     def test_checkout_with_newsletter_subscription(self):
         """Test checkout with newsletter subscription"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart and proceed to checkout
             self.cart_page.navigate_to_cart()
             self.cart_page.click_checkout()
@@ -311,22 +281,18 @@ class TestCheckout:
             self.checkout_page.fill_account_details(account_data)
             self.checkout_page.click_continue()
             
-            self.wait_utils.wait_for_page_load()
             self.checkout_page.check_same_as_billing()
             self.checkout_page.click_continue_shipping()
             
-            self.wait_utils.wait_for_page_load()
             self.checkout_page.select_shipping_method()
             self.checkout_page.click_continue_shipping_method()
             
-            self.wait_utils.wait_for_page_load()
             self.checkout_page.select_payment_method()
             self.checkout_page.accept_terms_and_conditions()
             self.checkout_page.accept_privacy_policy()
             self.checkout_page.subscribe_to_newsletter()
             self.checkout_page.click_continue_payment_method()
             
-            self.wait_utils.wait_for_page_load()
             self.checkout_page.confirm_order()
             
             # Verify order confirmation
@@ -343,10 +309,6 @@ class TestCheckout:
     def test_checkout_order_total_calculation(self):
         """Test order total calculation during checkout"""
         try:
-            # Add product to cart
-            self.home_page.navigate_to_home_page()
-            self.home_page.add_product_to_cart(0)
-            
             # Navigate to cart and get total
             self.cart_page.navigate_to_cart()
             cart_total = self.cart_page.get_total()
@@ -9,6 +9,7 @@ from tests.pages.home_page import HomePage
 from utils.data_utils import DataUtils
 
 
+@pytest.mark.login_ui
 class TestLogin:
     """Test class for login functionality"""
     
@@ -22,6 +23,7 @@ class TestLogin:
         self.home_page = HomePage(driver, wait_utils, screenshot_utils)
         self.data_utils = DataUtils()
     
+    @pytest.mark.command_budget(40)
     def test_valid_login(self, test_config):
         """Test valid login"""
         try:
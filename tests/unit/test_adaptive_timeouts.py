@@ -0,0 +1,88 @@
+"""
+AdaptiveTimeouts Unit Tests
+"""
+import json
+
+from utils.adaptive_timeouts import AdaptiveTimeouts
+
+
+class TestAdaptiveTimeouts:
+    """Learned timeout = percentile x safety factor, clamped to [min, max]"""
+    
+    def timeouts(self, tmp_path, samples=None, **kwargs):
+        """Create enabled adaptive timeouts over a store holding samples"""
+        store = tmp_path / "timeouts.json"
+        if samples is not None:
+            store.write_text(json.dumps(samples), encoding="utf-8")
+        options = {'percentile': 95, 'safety_factor': 3.0, 'min_timeout': 2, 'max_timeout': 30, 'min_samples': 5}
+        options.update(kwargs)
+        return AdaptiveTimeouts(enabled=True, store_path=store, **options)
+    
+    def test_default_until_enough_samples(self, tmp_path):
+        """Test the default timeout is used below min_samples"""
+        timeouts = self.timeouts(tmp_path, {'Page:id=x': [1.0, 1.0, 1.0, 1.0]})
+        assert timeouts.timeout_for('Page:id=x', 20) == 20
+        assert timeouts.timeout_for('Page:id=unknown', 20) == 20
+    
+    def test_percentile_times_safety_factor(self, tmp_path):
+        """Test the learned timeout is p95 of the samples times the safety factor"""
+        samples = [0.1 * n for n in range(1, 21)]
+        timeouts = self.timeouts(tmp_path, {'Page:id=x': samples})
+        # p95 of 20 samples is the 19th smallest (1.9s)
+        assert timeouts.timeout_for('Page:id=x', 20) == 5.7
+    
+    def test_clamped_to_min_and_max(self, tmp_path):
+        """Test fast locators get min_timeout and slow ones max_timeout"""
+        timeouts = self.timeouts(tmp_path, {'fast': [0.01] * 10, 'slow': [20.0] * 10})
+        assert timeouts.timeout_for('fast', 20) == 2
+        assert timeouts.timeout_for('slow', 20) == 30
+    
+    def test_disabled_always_returns_default(self, tmp_path):
+        """Test disabled adaptive timeouts ignore history"""
+        store = tmp_path / "timeouts.json"
+        store.write_text(json.dumps({'slow': [20.0] * 10}), encoding="utf-8")
+        timeouts = AdaptiveTimeouts(enabled=False, store_path=store)
+        assert timeouts.timeout_for('slow', 20) == 20
+    
+    def test_save_merges_and_keeps_newest_samples(self, tmp_path):
+        """Test saving appends this run's samples and trims to max_samples"""
+        timeouts = self.timeouts(tmp_path, {'key': [1.0, 2.0, 3.0]}, max_samples=4)
+        timeouts.record('key', 4.0, 20)
+        timeouts.record('key', 5.0, 20)
+        timeouts.save()
+        stored = json.loads((tmp_path / "timeouts.json").read_text(encoding="utf-8"))
+        assert stored == {'key': [2.0, 3.0, 4.0, 5.0]}
+    
+    def test_outlier_when_over_half_of_learned_timeout(self, tmp_path):
+        """Test a wait using more than half its timeout is reported as an outlier"""
+        timeouts = self.timeouts(tmp_path, {'key': [1.0] * 5})
+        timeouts.record('key', 1.0, 3.0)
+        timeouts.record('key', 2.0, 3.0)
+        assert [outlier['seconds'] for outlier in timeouts.report()['outliers']] == [2.0]
+    
+    def test_timeout_widens_learned_timeout_once_per_run(self, tmp_path):
+        """Test a timeout doubles the learned timeout once, however often the locator times out"""
+        timeouts = self.timeouts(tmp_path, {'key': [1.0] * 50})
+        assert timeouts.timeout_for('key', 20) == 3
+        timeouts.record_timeout('key', 3)
+        assert timeouts.timeout_for('key', 20) == 6
+        timeouts.record_timeout('key', 6)
+        assert timeouts.timeout_for('key', 20) == 6
+    
+    def test_widening_never_passes_default(self, tmp_path):
+        """Test a widened learned timeout stops at the default"""
+        timeouts = self.timeouts(tmp_path, {'key': [5.0] * 10})
+        timeouts.record_timeout('key', 15)
+        assert timeouts.timeout_for('key', 20) == 20
+    
+    def test_only_timeouts_never_above_default(self, tmp_path):
+        """Test a locator that only ever times out keeps the default, in this run and the next"""
+        timeouts = self.timeouts(tmp_path, min_samples=2)
+        for _ in range(10):
+            timeout = timeouts.timeout_for('broken', 20)
+            assert timeout <= 20
+            timeouts.record_timeout('broken', timeout)
+        timeouts.save()
+        assert not (tmp_path / "timeouts.json").exists()
+        assert self.timeouts(tmp_path, min_samples=2).timeout_for('broken', 20) == 20
+        assert len(timeouts.report()['timeouts']) == 10
@@ -0,0 +1,96 @@
+"""
+CartApi Unit Tests
+"""
+import pytest
+
+from utils.cart_api import CartApi
+
+
+# Header cart dropdown as OpenCart 3 renders it (common/cart/info), two lines
+CART_INFO_HTML = """
+<ul class="dropdown-menu pull-right">
+  <li><table class="table table-striped">
+    <tr><td class="text-left"><a href="#">MacBook</a></td>
+        <td class="text-center"><button type="button" onclick="cart.remove('17');" title="Remove"
+            class="btn btn-danger btn-xs"><i class="fa fa-times"></i></button></td></tr>
+    <tr><td class="text-left"><a href="#">iPhone</a></td>
+        <td class="text-center"><button type="button" onclick="cart.remove('23');" title="Remove"
+            class="btn btn-danger btn-xs"><i class="fa fa-times"></i></button></td></tr>
+    <tr><td class="text-left">Gift</td>
+        <td class="text-center"><button type="button" onclick="voucher.remove('5');"></button></td></tr>
+  </table></li>
+</ul>
+"""
+
+
+class FakeResponse:
+    """The parts of requests.Response CartApi reads"""
+    
+    def __init__(self, text="", json_body=None):
+        self.text = text
+        self.json_body = json_body
+    
+    def json(self):
+        return self.json_body
+
+
+class TestCartApi:
+    """Cart seeding, cart key parsing and cleanup without a storefront"""
+    
+    @pytest.fixture
+    def cart_api(self, monkeypatch):
+        """CartApi whose requests are answered from self.responses and recorded in self.requests"""
+        self.requests = []
+        self.responses = {}
+        api = CartApi("https://shop.test")
+        
+        def request(method, route, **kwargs):
+            self.requests.append((method, route, kwargs.get('data')))
+            return self.responses[route]
+        monkeypatch.setattr(api, "_request", request)
+        return api
+    
+    def test_cart_keys_parsed_from_header_cart(self, cart_api):
+        """Test only cart.remove keys are read, vouchers are not"""
+        self.responses[CartApi.INFO_ROUTE] = FakeResponse(CART_INFO_HTML)
+        assert cart_api.get_cart_keys() == ['17', '23']
+    
+    def test_cart_keys_deduplicated_in_order(self, cart_api):
+        """Test a key rendered twice (e.g. mobile and desktop menus) is removed once"""
+        self.responses[CartApi.INFO_ROUTE] = FakeResponse(CART_INFO_HTML + CART_INFO_HTML)
+        assert cart_api.get_cart_keys() == ['17', '23']
+    
+    def test_empty_cart_has_no_keys(self, cart_api):
+        """Test the empty-cart dropdown yields no keys"""
+        self.responses[CartApi.INFO_ROUTE] = FakeResponse('<p class="text-center">Your shopping cart is empty!</p>')
+        assert cart_api.get_cart_keys() == []
+    
+    def test_clear_removes_every_line_once(self, cart_api):
+        """Test clearing posts one remove per cart line"""
+        self.responses[CartApi.INFO_ROUTE] = FakeResponse(CART_INFO_HTML)
+        self.responses[CartApi.REMOVE_ROUTE] = FakeResponse(json_body={})
+        assert cart_api.clear() == 2
+        removes = [data for method, route, data in self.requests if route == CartApi.REMOVE_ROUTE]
+        assert removes == [{'key': '17'}, {'key': '23'}]
+    
+    def test_seed_posts_each_product(self, cart_api):
+        """Test seeding posts product_id and quantity per product"""
+        self.responses[CartApi.ADD_ROUTE] = FakeResponse(json_body={'success': "Added", 'total': "2 item(s)"})
+        cart_api.seed([(43, 1), (40, 2)])
+        assert [data for _, _, data in self.requests] == [{'product_id': 43, 'quantity': 1},
+                                                         {'product_id': 40, 'quantity': 2}]
+    
+    def test_seed_fails_for_product_with_required_options(self, cart_api):
+        """Test a redirect answer (required options) fails the seeding"""
+        self.responses[CartApi.ADD_ROUTE] = FakeResponse(json_body={'redirect': "https://shop.test/product"})
+        with pytest.raises(ValueError, match="product 42 was not added"):
+            cart_api.seed([(42, 1)])
+    
+    def test_initial_cookies_continue_session(self):
+        """Test cookies passed in (e.g. a cached login) are sent and handed back in WebDriver format"""
+        api = CartApi("https://shop.test", cookies=[{'name': 'OCSESSID', 'value': 'abc', 'domain': 'shop.test',
+                                                     'path': '/', 'secure': True, 'httpOnly': False,
+                                                     'expiry': None}])
+        cookie = api.get_cookies()[0]
+        assert (cookie['name'], cookie['value'], cookie['domain'], cookie['path']) == \
+            ('OCSESSID', 'abc', 'shop.test', '/')
@@ -0,0 +1,65 @@
+"""
+command_budget Marker Unit Tests
+"""
+import pytest
+
+from utils.command_metrics import CommandRecorder
+
+
+class FakeItem:
+    """The parts of a pytest item the budget checks read"""
+
+    def __init__(self, marker=None, name="test_checkout"):
+        self.marker = marker
+        self.nodeid = f"tests/testcases/test_checkout.py::{name}"
+
+    def get_closest_marker(self, name):
+        return self.marker if name == "command_budget" else None
+
+
+class TestCommandBudget:
+    """Limit parsing, budget checks against recorded commands and detection of markers without a limit"""
+
+    @pytest.fixture(autouse=True)
+    def recorder(self):
+        """Recorder with a test in progress"""
+        self.recorder = CommandRecorder()
+        self.recorder.begin("test_checkout")
+
+    def record(self, count):
+        for _ in range(count):
+            self.recorder._record("findElement", 0.002)
+
+    @pytest.mark.parametrize("marker, limit", [
+        (pytest.mark.command_budget(40).mark, 40),
+        (pytest.mark.command_budget(max_commands=25).mark, 25),
+        (pytest.mark.command_budget().mark, None)
+    ])
+    def test_limit_from_args_or_kwargs(self, marker, limit):
+        """Test the limit is read positionally or as max_commands"""
+        assert CommandRecorder.budget_limit(marker) == limit
+
+    def test_within_budget(self):
+        """Test a test using exactly its budget is within it"""
+        self.record(40)
+        assert self.recorder.budget_failure(40) is None
+
+    def test_over_budget(self):
+        """Test going over the budget gives a failure naming both counts"""
+        self.record(41)
+        assert self.recorder.budget_failure(40) == "WebDriver command budget exceeded: 41 commands (budget 40)"
+
+    def test_budget_counts_current_test_only(self):
+        """Test commands of the previous test do not count against the next one"""
+        self.record(41)
+        self.recorder.end()
+        self.recorder.begin("test_next")
+        self.record(5)
+        assert self.recorder.budget_failure(40) is None
+
+    def test_unbounded_markers_found(self):
+        """Test only markers without a limit are reported, by node id"""
+        items = [FakeItem(pytest.mark.command_budget(40).mark, "test_bounded"),
+                 FakeItem(pytest.mark.command_budget().mark, "test_unbounded"),
+                 FakeItem()]
+        assert CommandRecorder.unbounded_budgets(items) == ["tests/testcases/test_checkout.py::test_unbounded"]
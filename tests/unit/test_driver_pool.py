@@ -0,0 +1,161 @@
+"""
+DriverPool Unit Tests
+"""
+import pytest
+
+from utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for the pool's reset"""
+    
+    def __init__(self, fail_reset=False):
+        self.fail_reset = fail_reset
+        self.window_handles = ["main"]
+        self.switch_to = self
+        self.cleared_cookies = 0
+    
+    def window(self, handle):
+        pass
+    
+    def execute_script(self, script):
+        if self.fail_reset:
+            raise RuntimeError("session lost")
+    
+    def execute_cdp_cmd(self, command, params):
+        self.cleared_cookies += 1
+
+
+class FakeWatchdog:
+    """Reports a browser over the memory threshold on demand"""
+    
+    def __init__(self):
+        self.over_threshold = False
+    
+    def exceeds_rss(self, manager):
+        return self.over_threshold
+
+
+class FakeManager:
+    """Stands in for DriverManager: one browser, quit tracked"""
+    
+    def __init__(self, driver, watchdog):
+        self.driver = driver
+        self.watchdog = watchdog
+        self.startup_time = 0.5
+        self.quit = False
+        self.drained = 0
+    
+    def collect_resource_stats(self):
+        self.drained += 1
+    
+    def quit_driver(self):
+        self.quit = True
+
+
+class FakeLauncher:
+    """Hands out fake managers the way BrowserLauncher hands out pre-warmed browsers"""
+    
+    def __init__(self, fail_reset=False):
+        self.fail_reset = fail_reset
+        self.watchdog = FakeWatchdog()
+        self.managers = []
+    
+    def acquire(self):
+        manager = FakeManager(FakeDriver(self.fail_reset), self.watchdog)
+        self.managers.append(manager)
+        return manager
+    
+    def stats(self):
+        return {'launched': len(self.managers)}
+
+
+class TestDriverPool:
+    """Reuse, reset and retirement of pooled browsers"""
+    
+    def pool(self, launcher, **kwargs):
+        return DriverPool(launcher=launcher, **kwargs)
+    
+    def test_reuses_browser_between_leases(self):
+        """Test a released browser is reset and leased again"""
+        launcher = FakeLauncher()
+        pool = self.pool(launcher)
+        driver = pool.acquire()
+        pool.release(driver)
+        assert pool.acquire() is driver
+        assert pool.created == 1
+        assert driver.cleared_cookies == 1
+        assert launcher.managers[0].drained == 1
+    
+    def test_retires_after_max_uses(self):
+        """Test a browser is quit once it has served max_uses leases"""
+        launcher = FakeLauncher()
+        pool = self.pool(launcher, max_uses=2)
+        for _ in range(2):
+            driver = pool.acquire()
+            pool.release(driver)
+        assert launcher.managers[0].quit
+        assert pool.retired == 1
+        assert pool.acquire() is not driver
+        assert pool.created == 2
+    
+    def test_retires_crashed_browser(self):
+        """Test a crashed browser is quit, not reset"""
+        launcher = FakeLauncher()
+        pool = self.pool(launcher)
+        driver = pool.acquire()
+        pool.release(driver, crashed=True)
+        assert launcher.managers[0].quit
+        assert driver.cleared_cookies == 0
+        assert pool.stats()['retired'] == 1
+    
+    def test_retires_when_reset_fails(self):
+        """Test a browser that cannot be reset is not handed to the next test"""
+        launcher = FakeLauncher(fail_reset=True)
+        pool = self.pool(launcher)
+        driver = pool.acquire()
+        pool.release(driver)
+        assert launcher.managers[0].quit
+        assert pool.acquire() is not driver
+    
+    def test_retires_over_memory_threshold(self):
+        """Test a browser over the RSS threshold is recycled"""
+        launcher = FakeLauncher()
+        pool = self.pool(launcher)
+        driver = pool.acquire()
+        launcher.watchdog.over_threshold = True
+        pool.release(driver)
+        assert launcher.managers[0].quit
+    
+    def test_restart_isolation_uses_each_browser_once(self):
+        """Test restart isolation retires every browser after one lease"""
+        launcher = FakeLauncher()
+        pool = self.pool(launcher, isolation="restart", max_uses=20)
+        assert pool.max_uses == 1
+        driver = pool.acquire()
+        pool.release(driver)
+        assert launcher.managers[0].quit
+    
+    def test_release_of_unknown_driver_is_ignored(self):
+        """Test releasing a driver twice does not retire or reuse it again"""
+        launcher = FakeLauncher()
+        pool = self.pool(launcher)
+        driver = pool.acquire()
+        pool.release(driver, crashed=True)
+        pool.release(driver, crashed=True)
+        assert pool.retired == 1
+    
+    def test_close_quits_idle_and_leased_browsers(self):
+        """Test closing the pool quits every browser it owns"""
+        launcher = FakeLauncher()
+        pool = self.pool(launcher)
+        idle = pool.acquire()
+        pool.acquire()
+        pool.release(idle)
+        pool.close()
+        assert all(manager.quit for manager in launcher.managers)
+    
+    def test_rejects_unknown_isolation(self):
+        """Test an unsupported isolation mode fails fast"""
+        with pytest.raises(ValueError):
+            DriverPool(isolation="fork")
@@ -0,0 +1,149 @@
+"""
+LocatorValidator Unit Tests
+"""
+from pathlib import Path
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from utils.config_reader import ConfigReader
+from utils.locator_validator import LocatorValidator, page_classes
+
+
+def probe(count, tag="input", element_type="text", cost_us=10.0, candidates=()):
+    """Result of PROBE_SCRIPT for one snapshot"""
+    first = {'tag': tag, 'type': element_type, 'id': None, 'name': None, 'text': ''} if count else None
+    return {'count': count, 'first': first, 'cost_us': cost_us,
+            'candidates': [{'by': by, 'value': value, 'cost_us': cost} for by, value, cost in candidates]}
+
+
+class TestLocatorVerdicts:
+    """Classification of a locator from its probes across snapshots"""
+
+    @pytest.fixture(autouse=True)
+    def validator(self):
+        """Validator that never touches a driver"""
+        self.validator = LocatorValidator(driver=None)
+
+    def verdict(self, name, probes, collection=False, locator=(By.ID, "x")):
+        return self.validator._verdict(name, locator, probes, collection)
+
+    def test_no_match_in_any_snapshot_is_a_problem(self):
+        """Test a locator no snapshot matches fails the run"""
+        result = self.verdict("EMAIL_INPUT", [probe(0), probe(0)])
+        assert result['problems'] == ["matches nothing in any snapshot"]
+
+    def test_match_in_one_state_is_enough(self):
+        """Test an alert found only in its own state snapshot passes"""
+        result = self.verdict("ERROR_MESSAGE", [probe(0), probe(1, tag="div", element_type=None)])
+        assert result['problems'] == []
+        assert result['matches'] == [0, 1]
+
+    def test_several_matches_for_a_single_element(self):
+        """Test a single-element locator that matches several elements is a problem"""
+        result = self.verdict("SEARCH_BUTTON", [probe(3, tag="button")])
+        assert result['problems'] == ["matches 3 elements, first one is used"]
+
+    def test_several_matches_for_a_collection(self):
+        """Test collections may match several elements"""
+        assert self.verdict("REMOVE_BUTTONS", [probe(3, tag="button")], collection=True)['problems'] == []
+
+    @pytest.mark.parametrize("name, tag, element_type, problem", [
+        ("EMAIL_INPUT", "div", None, "matches a div, expected input"),
+        ("CART_BUTTON", "div", None, "matches a div, expected button"),
+        ("AGREE_CHECKBOX", "input", "radio", "matches a input[type=radio], expected checkbox"),
+        ("COUNTRY_SELECT", "select", None, None),
+        ("LOGIN_BUTTON", "input", "submit", None),
+    ])
+    def test_element_kind_from_name_suffix(self, name, tag, element_type, problem):
+        """Test the matched element must fit the locator's name suffix"""
+        result = self.verdict(name, [probe(1, tag=tag, element_type=element_type)])
+        assert result['problems'] == ([problem] if problem else [])
+
+    def test_invalid_locator(self):
+        """Test a selector the browser rejects is reported once, without further checks"""
+        result = self.verdict("EMAIL_INPUT", [{'error': "SyntaxError: bad selector"}, probe(1)])
+        assert result['problems'] == ["invalid locator: SyntaxError: bad selector"]
+        assert 'matches' not in result
+
+
+class TestSelectorSuggestions:
+    """Cheaper equivalent selectors, agreed on by every snapshot"""
+
+    @pytest.fixture(autouse=True)
+    def validator(self):
+        self.validator = LocatorValidator(driver=None)
+
+    def test_suggests_cheapest_common_candidate(self):
+        """Test the cheapest candidate found in every matching snapshot is suggested with its speedup"""
+        probes = [probe(1, cost_us=40.0, candidates=[("id", "input-email", 5.0), ("css selector", "input.a", 8.0)]),
+                  probe(1, cost_us=40.0, candidates=[("id", "input-email", 3.0), ("css selector", "input.a", 1.0)])]
+        suggestion = self.validator._suggestion(probes, 40.0)
+        # Medians: id 4.0, css 4.5
+        assert suggestion == {'locator': ["id", "input-email"], 'cost_us': 4.0, 'speedup': 10.0}
+
+    def test_candidate_missing_from_a_snapshot_is_not_equivalent(self):
+        """Test a candidate that did not find the same elements everywhere is never suggested"""
+        probes = [probe(1, candidates=[("id", "a", 1.0)]), probe(1, candidates=[("name", "a", 1.0)])]
+        assert self.validator._suggestion(probes, 40.0) is None
+
+    def test_snapshots_without_matches_do_not_veto(self):
+        """Test states where the element is absent are left out of the comparison"""
+        probes = [probe(0), probe(1, candidates=[("id", "a", 1.0)])]
+        assert self.validator._suggestion(probes, 40.0)['locator'] == ["id", "a"]
+
+    def test_marginal_speedup_is_not_suggested(self):
+        """Test a candidate must beat the current locator by MIN_SPEEDUP"""
+        assert self.validator._suggestion([probe(1, candidates=[("id", "a", 9.0)])], 10.0) is None
+
+    def test_strategy_costs_are_medians_per_strategy(self):
+        """Test strategy costs group validated locators by strategy and skip invalid ones"""
+        results = {'Page': {'A': {'locator': ["id", "a"], 'cost_us': 1.0},
+                            'B': {'locator': ["id", "b"], 'cost_us': 3.0},
+                            'C': {'locator': ["xpath", "//c"], 'cost_us': 20.0},
+                            'D': {'locator': ["xpath", "//d["], 'problems': ["invalid locator: x"]}}}
+        assert LocatorValidator.strategy_costs(results) == {
+            'id': {'locators': 2, 'median_us': 2.0},
+            'xpath': {'locators': 1, 'median_us': 20.0},
+        }
+
+
+class TestPageLocators:
+    """Which locators are checked, and against which snapshots"""
+
+    def test_header_locators_belong_to_base_page_only(self):
+        """Test BasePage's header locators are not re-checked for every page"""
+        pages = page_classes()
+        assert "LOGGED_IN_LINK" in LocatorValidator.collect_locators(pages['BasePage'])
+        assert "LOGGED_IN_LINK" not in LocatorValidator.collect_locators(pages['HomePage'])
+        assert "SEARCH_INPUT" in LocatorValidator.collect_locators(pages['HomePage'])
+
+    def test_collections_and_readiness_may_match_several(self):
+        """Test find_elements/extract targets and READY_LOCATOR are treated as collections"""
+        collections = LocatorValidator.collection_locators(page_classes()['CartPage'])
+        assert {"REMOVE_BUTTONS", "CART_ROWS", "QUANTITY_INPUTS", "READY_LOCATOR"} <= collections
+        assert "COUPON_INPUT" not in collections
+
+    def test_snapshots_per_page_state(self, tmp_path):
+        """Test a page gets its own state snapshots and BasePage gets every snapshot"""
+        for name in ("HomePage", "HomePage_cart", "LoginPage_error"):
+            (tmp_path / f"{name}.html").write_text("<html></html>")
+        validator = LocatorValidator(None, tmp_path)
+        pages = page_classes()
+        assert [path.stem for path in validator.snapshots_for(pages['HomePage'])] == ["HomePage", "HomePage_cart"]
+        assert len(validator.snapshots_for(pages['BasePage'])) == 3
+        assert validator.snapshots_for(pages['CartPage']) == []
+
+    def test_snapshot_dir_is_relative_to_repo(self, tmp_path, monkeypatch):
+        """Test the configured snapshot directory does not depend on the working directory"""
+        monkeypatch.chdir(tmp_path)
+        snapshot_dir = Path(ConfigReader().get_snapshot_dir())
+        assert snapshot_dir == Path(__file__).resolve().parents[2] / "tests" / "data" / "snapshots"
+
+    @pytest.mark.parametrize("name", sorted(page_classes()))
+    def test_captured_snapshots_cover_every_page(self, name):
+        """Test committed live captures, when there are any, cover every page class"""
+        validator = LocatorValidator(None, ConfigReader().get_snapshot_dir())
+        if not any(validator.snapshot_dir.glob("*.html")):
+            pytest.skip("no captured snapshots committed (python -m utils.locator_validator --capture)")
+        assert validator.snapshots_for(page_classes()[name])
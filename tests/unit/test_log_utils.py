@@ -0,0 +1,92 @@
+"""
+Log Utilities Unit Tests
+"""
+import json
+import pytest
+from loguru import logger
+
+from utils.log_utils import RingBufferSink, format_entry, merge_worker_logs
+
+
+class FakeTarget:
+    """Collects records replayed into it, like the worker's file sink"""
+    
+    def __init__(self):
+        self.records = []
+    
+    def replay(self, records):
+        self.records.extend(records)
+
+
+class TestRingBufferSink:
+    """Per-test buffering: bounded memory, kept only when asked"""
+    
+    @pytest.fixture
+    def buffer(self):
+        """Ring buffer of 3 records attached to loguru for the test"""
+        self.target = FakeTarget()
+        buffer = RingBufferSink(capacity=3, target=self.target)
+        handler_id = logger.add(buffer, level="DEBUG", format="{message}")
+        yield buffer
+        logger.remove(handler_id)
+    
+    def log(self, count):
+        for n in range(count):
+            logger.debug("record {n}", n=n)
+    
+    def test_kept_buffer_reports_dropped_records(self, buffer):
+        """Test only the last capacity records are kept, behind a header counting the dropped ones"""
+        buffer.begin("test_a")
+        self.log(5)
+        text = buffer.end(keep=True)
+        lines = text.splitlines()
+        assert lines[0] == "... 2 earlier records dropped (buffer holds 3)"
+        assert [line.rsplit(" - ", 1)[1] for line in lines[1:]] == ["record 2", "record 3", "record 4"]
+        assert [record['message'] for record in self.target.records] == ["record 2", "record 3", "record 4"]
+    
+    def test_no_header_when_nothing_dropped(self, buffer):
+        """Test a buffer within capacity has no dropped header"""
+        buffer.begin("test_a")
+        self.log(2)
+        assert not buffer.end(keep=True).startswith("...")
+    
+    def test_discarded_buffer_writes_nothing(self, buffer):
+        """Test a passing test's records never reach the target"""
+        buffer.begin("test_a")
+        self.log(2)
+        assert buffer.end(keep=False) is None
+        assert self.target.records == []
+        assert not buffer.active
+    
+    def test_records_outside_a_test_are_not_buffered(self, buffer):
+        """Test records logged between tests are ignored, and each test starts empty"""
+        self.log(2)
+        buffer.begin("test_a")
+        self.log(1)
+        buffer.end(keep=False)
+        self.log(2)
+        buffer.begin("test_b")
+        logger.debug("only this")
+        text = buffer.end(keep=True)
+        assert len(text.splitlines()) == 1 and text.rstrip().endswith("only this")
+
+
+class TestMergeWorkerLogs:
+    """Merging per-worker JSON-lines logs into one time-ordered log"""
+    
+    def entry(self, timestamp, worker, message):
+        return {'time': f"2026-01-01T00:00:0{timestamp}.000000+00:00", 'timestamp': timestamp, 'level': "INFO",
+                'worker': worker, 'name': "tests", 'function': "test", 'line': 1, 'message': message,
+                'extra': {}, 'exception': None}
+    
+    def test_merges_in_time_order(self, tmp_path):
+        """Test entries from every worker file are interleaved by timestamp"""
+        for worker, timestamps in (("gw0", [1, 3]), ("gw1", [2, 4])):
+            with open(tmp_path / f"test_{worker}.jsonl", 'w', encoding='utf-8') as file:
+                for timestamp in timestamps:
+                    file.write(json.dumps(self.entry(timestamp, worker, f"{worker} at {timestamp}")) + "\n")
+        assert merge_worker_logs(tmp_path, tmp_path) == 4
+        merged = [json.loads(line)['message'] for line in (tmp_path / "test.jsonl").read_text().splitlines()]
+        assert merged == ["gw0 at 1", "gw1 at 2", "gw0 at 3", "gw1 at 4"]
+        text = (tmp_path / "test.log").read_text().splitlines()
+        assert text[0] == format_entry(self.entry(1, "gw0", "gw0 at 1")).rstrip("\n")
@@ -0,0 +1,79 @@
+"""
+RetryPolicy Unit Tests
+"""
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
+
+from utils.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Backoff bounds and retry/give-up decisions"""
+    
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Record delays instead of sleeping"""
+        self.sleeps = []
+        monkeypatch.setattr("utils.retry_policy.time.sleep", self.sleeps.append)
+    
+    def flaky(self, failures, error=StaleElementReferenceException):
+        """Action that raises error for its first failures calls"""
+        calls = []
+        
+        def action():
+            calls.append(1)
+            if len(calls) <= failures:
+                raise error("flaky")
+            return "done"
+        return action, calls
+    
+    @pytest.mark.parametrize("attempt", [1, 2, 3, 10])
+    def test_backoff_stays_within_jitter_and_cap(self, attempt):
+        """Test delays are the capped exponential delay reduced by at most the jitter fraction"""
+        policy = RetryPolicy(base_delay=0.1, max_delay=1.0, multiplier=2.0, jitter=0.5)
+        expected = min(1.0, 0.1 * 2 ** (attempt - 1))
+        for _ in range(200):
+            delay = policy.backoff(attempt)
+            assert expected * 0.5 <= delay <= expected
+    
+    def test_backoff_without_jitter_is_exact(self):
+        """Test zero jitter gives the plain exponential delay"""
+        policy = RetryPolicy(base_delay=0.1, max_delay=1.0, multiplier=2.0, jitter=0)
+        assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4, 5)] == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0])
+    
+    def test_recovers_from_transient_exception(self):
+        """Test a step that fails twice succeeds on its third attempt"""
+        policy = RetryPolicy(jitter=0)
+        action, calls = self.flaky(2)
+        assert policy.run(action) == "done"
+        assert len(calls) == 3
+        assert self.sleeps == pytest.approx([0.1, 0.2])
+        assert policy.stats()['recovered_steps'] == 1
+        assert policy.stats()['retries_by_exception'] == {'StaleElementReferenceException': 2}
+    
+    def test_gives_up_after_allowed_attempts(self):
+        """Test the rule's attempt count bounds the retries"""
+        policy = RetryPolicy(jitter=0, rules={StaleElementReferenceException: 2})
+        action, calls = self.flaky(5)
+        with pytest.raises(StaleElementReferenceException):
+            policy.run(action)
+        assert len(calls) == 2
+        assert policy.stats()['exhausted_steps'] == 1
+    
+    def test_unlisted_exception_is_not_retried(self):
+        """Test exceptions without a rule are raised on the first attempt"""
+        policy = RetryPolicy()
+        action, calls = self.flaky(1, NoSuchElementException)
+        with pytest.raises(NoSuchElementException):
+            policy.run(action)
+        assert len(calls) == 1
+        assert self.sleeps == []
+    
+    def test_deadline_stops_retries(self):
+        """Test no retry starts whose delay would pass the deadline"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=1.0, jitter=0, deadline=0.5,
+                             rules={StaleElementReferenceException: 5})
+        action, calls = self.flaky(5)
+        with pytest.raises(StaleElementReferenceException):
+            policy.run(action)
+        assert len(calls) == 1
@@ -0,0 +1,134 @@
+"""
+Per-locator timeouts learned from how long elements took to become ready in earlier runs
+"""
+import json
+import math
+import threading
+from pathlib import Path
+from filelock import FileLock
+from loguru import logger
+
+
+class AdaptiveTimeouts:
+    """Derives each (page, locator) timeout from a high percentile of its observed wait times"""
+
+    _default = None
+
+    def __init__(self, enabled=False, store_path=".wait_history/timeouts.json", percentile=95, safety_factor=3.0,
+                 min_timeout=2, max_timeout=30, min_samples=5, max_samples=50):
+        self.enabled = enabled
+        self.store_path = Path(store_path)
+        self.percentile = percentile
+        self.safety_factor = safety_factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self.history = self._load() if enabled else {}
+        self.new_samples = {}
+        self.outliers = []
+        self.timeouts = []
+        self.widened = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Create adaptive timeouts from [ADAPTIVE_TIMEOUTS] settings"""
+        return cls(
+            enabled=config.is_adaptive_timeouts_enabled(),
+            store_path=config.get_adaptive_timeouts_store(),
+            percentile=config.get_adaptive_timeouts_percentile(),
+            safety_factor=config.get_adaptive_timeouts_safety_factor(),
+            min_timeout=config.get_adaptive_timeouts_min(),
+            max_timeout=config.get_adaptive_timeouts_max(),
+            min_samples=config.get_adaptive_timeouts_min_samples()
+        )
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide adaptive timeouts built from config.ini"""
+        if cls._default is None:
+            from utils.config_reader import ConfigReader
+            cls._default = cls.from_config(ConfigReader())
+        return cls._default
+
+    def timeout_for(self, key, default):
+        """Get the learned timeout for key, or default until enough history exists"""
+        if not self.enabled:
+            return default
+        samples = self.history.get(key, [])
+        if len(samples) < self.min_samples:
+            return default
+        learned = self._percentile(samples) * self.safety_factor
+        if key in self.widened and default is not None:
+            # One doubling per run after a timeout, never past the default a broken locator would wait anyway
+            learned = min(learned * 2, max(learned, default))
+        return round(min(self.max_timeout, max(self.min_timeout, learned)), 2)
+
+    def record(self, key, seconds, timeout):
+        """Record how long key took to become ready under the given timeout"""
+        if not self.enabled:
+            return
+        with self._lock:
+            # Used over half of a learned timeout: close to failing, worth looking at
+            if len(self.history.get(key, [])) >= self.min_samples and seconds > timeout / 2:
+                self.outliers.append({'key': key, 'seconds': round(seconds, 3), 'timeout_s': timeout})
+            self._add_sample(key, seconds)
+
+    def record_timeout(self, key, timeout):
+        """Record a wait on key that ran out of time"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.timeouts.append({'key': key, 'timeout_s': timeout})
+            # Audit only: a timeout is no duration sample, and a locator that never appears must keep failing fast
+            self.widened[key] = 1
+        logger.warning(f"Wait for {key} timed out after {timeout}s")
+
+    def save(self):
+        """Merge this process's samples into the shared store"""
+        if not self.enabled or not self.new_samples:
+            return
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            with FileLock(str(self.store_path) + ".lock"):
+                history = self._load()
+                for key, samples in self.new_samples.items():
+                    history[key] = (history.get(key, []) + samples)[-self.max_samples:]
+                with open(self.store_path, 'w', encoding='utf-8') as file:
+                    json.dump(history, file, indent=1, sort_keys=True)
+            logger.debug(f"Saved wait history for {len(self.new_samples)} locators to {self.store_path}")
+        except Exception as e:
+            logger.error(f"Failed to save wait history: {str(e)}")
+
+    def report(self):
+        """Get learned timeouts per locator plus this run's outliers and timeouts"""
+        learned = {}
+        for key in sorted(set(self.history) | set(self.new_samples)):
+            samples = self.history.get(key, [])
+            learned[key] = {
+                'samples': len(samples),
+                f'p{self.percentile}_s': round(self._percentile(samples), 3) if samples else None,
+                'timeout_s': self.timeout_for(key, None),
+                'this_run_max_s': max(self.new_samples.get(key, [0])),
+            }
+        return {'learned': learned, 'outliers': self.outliers, 'timeouts': self.timeouts}
+
+    def _add_sample(self, key, seconds):
+        self.new_samples.setdefault(key, []).append(round(seconds, 3))
+        self.history[key] = (self.history.get(key, []) + [round(seconds, 3)])[-self.max_samples:]
+
+    def _percentile(self, samples):
+        ordered = sorted(samples)
+        index = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+    def _load(self):
+        if not self.store_path.exists():
+            return {}
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable wait history {self.store_path}: {str(e)}")
+            return {}
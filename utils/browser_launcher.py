@@ -0,0 +1,96 @@
+"""
+Browser launcher that keeps spare sessions started ahead of demand
+"""
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+
+from utils.driver_manager import DriverManager
+
+
+class BrowserLauncher:
+    """Starts spare browser sessions in the background so tests get a ready one"""
+
+    def __init__(self, browser="chrome", headless=True, spares=1, driver_options=None):
+        self.browser = browser
+        self.headless = headless
+        self.driver_options = driver_options or {}
+        self.spares = max(0, spares)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, self.spares),
+                                            thread_name_prefix="browser-launcher")
+        self._spares = deque()
+        self.cold_start_times = []
+        self.warm_handoff_times = []
+        self.background_start_times = []
+
+    def start(self):
+        """Begin starting the configured number of spare sessions"""
+        missing = self.spares - len(self._spares)
+        for _ in range(missing):
+            self._launch_async()
+        if missing > 0:
+            logger.debug(f"Starting {missing} spare {self.browser} session(s)")
+
+    def acquire(self):
+        """Return a DriverManager whose driver is ready, replacing it in the background"""
+        manager = None
+        start = time.perf_counter()
+        if self._spares:
+            future = self._spares.popleft()
+            try:
+                manager = future.result()
+                elapsed = time.perf_counter() - start
+                self.warm_handoff_times.append(elapsed)
+                logger.debug(f"Warm handoff of {self.browser} session in {elapsed:.3f}s")
+            except Exception as e:
+                logger.warning(f"Spare {self.browser} session failed to start: {str(e)}")
+
+        if manager is None:
+            start = time.perf_counter()
+            manager = DriverManager(browser=self.browser, headless=self.headless, **self.driver_options)
+            manager.get_driver()
+            elapsed = time.perf_counter() - start
+            self.cold_start_times.append(elapsed)
+            logger.debug(f"Cold start of {self.browser} session in {elapsed:.3f}s")
+
+        self.start()
+        return manager
+
+    def close(self):
+        """Stop launching and quit any unused spare sessions"""
+        while self._spares:
+            future = self._spares.popleft()
+            try:
+                future.result().quit_driver()
+            except Exception as e:
+                logger.warning(f"Failed to quit spare session: {str(e)}")
+        self._executor.shutdown(wait=True)
+        logger.info(f"Browser launcher closed: {self.stats()}")
+
+    def stats(self):
+        """Get cold-start vs warm-handoff timings"""
+        return {
+            'spares': self.spares,
+            'cold_starts': len(self.cold_start_times),
+            'cold_start_avg_s': self._average(self.cold_start_times),
+            'warm_handoffs': len(self.warm_handoff_times),
+            'warm_handoff_avg_s': self._average(self.warm_handoff_times),
+            'warm_handoff_max_s': max(self.warm_handoff_times, default=0.0),
+            'background_start_avg_s': self._average(self.background_start_times),
+        }
+
+    def _launch_async(self):
+        """Start one spare session on the background executor"""
+        self._spares.append(self._executor.submit(self._launch))
+
+    def _launch(self):
+        start = time.perf_counter()
+        manager = DriverManager(browser=self.browser, headless=self.headless, **self.driver_options)
+        manager.get_driver()
+        self.background_start_times.append(time.perf_counter() - start)
+        return manager
+
+    @staticmethod
+    def _average(values):
+        return sum(values) / len(values) if values else 0.0
@@ -0,0 +1,133 @@
+"""
+Template browser profiles copied to tmpfs for each session
+"""
+import atexit
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from filelock import FileLock
+from loguru import logger
+
+
+class ProfileTemplates:
+    """Builds one tuned profile per browser and hands out fast tmpfs copies of it"""
+
+    # Chromium flags that keep a template profile from doing first-run work
+    CHROMIUM_ARGUMENTS = [
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-component-update",
+        "--disable-background-networking",
+        "--disable-sync",
+    ]
+
+    CHROMIUM_PREFERENCES = {
+        "browser": {"check_default_browser": False},
+        "profile": {"exit_type": "Normal", "exited_cleanly": True},
+        "credentials_enable_service": False,
+        "translate": {"enabled": False},
+        "download": {"prompt_for_download": False},
+    }
+
+    FIREFOX_PREFERENCES = {
+        "browser.shell.checkDefaultBrowser": False,
+        "browser.startup.page": 0,
+        "browser.startup.homepage_override.mstone": "ignore",
+        "browser.aboutwelcome.enabled": False,
+        "startup.homepage_welcome_url": "about:blank",
+        "datareporting.policy.dataSubmissionEnabled": False,
+        "toolkit.telemetry.reportingpolicy.firstRun": False,
+        "app.update.auto": False,
+        "extensions.update.enabled": False,
+        "browser.cache.disk.enable": True,
+    }
+
+    _default = None
+
+    def __init__(self, enabled=False, template_dir=".profile_templates", session_dir="/dev/shm",
+                 disk_cache_mb=32):
+        self.enabled = enabled
+        self.template_dir = Path(template_dir)
+        self.session_dir = session_dir if os.path.isdir(session_dir) else tempfile.gettempdir()
+        self.disk_cache_mb = disk_cache_mb
+        self._session_profiles = set()
+        atexit.register(self.remove_all)
+
+    @classmethod
+    def from_config(cls, config):
+        """Create templates from [PROFILES] settings"""
+        return cls(
+            enabled=config.is_profile_template_enabled(),
+            template_dir=config.get_profile_template_dir(),
+            session_dir=config.get_profile_session_dir(),
+            disk_cache_mb=config.get_profile_disk_cache_mb()
+        )
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide profile templates built from config.ini"""
+        if cls._default is None:
+            from utils.config_reader import ConfigReader
+            cls._default = cls.from_config(ConfigReader())
+        return cls._default
+
+    def create_session_profile(self, browser):
+        """Copy the browser's template into a fresh session directory"""
+        template = self._build_template(browser)
+        session_profile = tempfile.mkdtemp(prefix=f"{browser}-profile-", dir=self.session_dir)
+        shutil.copytree(template, session_profile, dirs_exist_ok=True)
+        self._session_profiles.add(session_profile)
+        logger.debug(f"Session profile created: {session_profile}")
+        return session_profile
+
+    def get_chromium_arguments(self, profile_dir):
+        """Get Chrome/Edge arguments that start from a session profile"""
+        return [f"--user-data-dir={profile_dir}",
+                f"--disk-cache-size={self.disk_cache_mb * 1024 * 1024}",
+                *self.CHROMIUM_ARGUMENTS]
+
+    def remove(self, profile_dir):
+        """Delete a session profile copy"""
+        if profile_dir in self._session_profiles:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            self._session_profiles.discard(profile_dir)
+            logger.debug(f"Session profile removed: {profile_dir}")
+
+    def remove_all(self):
+        """Delete every session profile still on disk (worker exit)"""
+        for profile_dir in list(self._session_profiles):
+            self.remove(profile_dir)
+
+    def _build_template(self, browser):
+        """Build the browser's template once, shared by all workers"""
+        family = "firefox" if browser == "firefox" else "chromium"
+        template = self.template_dir / family
+        self.template_dir.mkdir(parents=True, exist_ok=True)
+        with FileLock(str(self.template_dir / f"{family}.lock")):
+            if not template.exists():
+                building = self.template_dir / f"{family}.building"
+                shutil.rmtree(building, ignore_errors=True)
+                building.mkdir()
+                if family == "firefox":
+                    self._write_firefox_template(building)
+                else:
+                    self._write_chromium_template(building)
+                os.replace(building, template)
+                logger.info(f"Built {family} profile template: {template}")
+        return template
+
+    def _write_chromium_template(self, profile_dir):
+        (profile_dir / "Default").mkdir()
+        with open(profile_dir / "Default" / "Preferences", 'w', encoding='utf-8') as file:
+            json.dump(self.CHROMIUM_PREFERENCES, file)
+        # Presence of this sentinel tells Chrome first-run has already happened
+        (profile_dir / "First Run").touch()
+
+    def _write_firefox_template(self, profile_dir):
+        preferences = dict(self.FIREFOX_PREFERENCES)
+        preferences["browser.cache.disk.capacity"] = self.disk_cache_mb * 1024
+        with open(profile_dir / "user.js", 'w', encoding='utf-8') as file:
+            for name, value in preferences.items():
+                file.write(f'user_pref("{name}", {json.dumps(value)});\n')
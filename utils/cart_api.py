@@ -0,0 +1,113 @@
+"""
+Cart seeding and cleanup through the storefront's cart endpoints instead of the UI
+"""
+import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+from utils.session_cache import SessionCache
+
+
+class CartApi:
+    """One storefront session whose cart is filled and emptied over HTTP, then handed to the browser"""
+
+    ADD_ROUTE = "index.php?route=checkout/cart/add"
+    REMOVE_ROUTE = "index.php?route=checkout/cart/remove"
+    INFO_ROUTE = "index.php?route=common/cart/info"
+
+    # The header cart dropdown renders one cart.remove('<cart_id>') per line
+    CART_KEY_PATTERN = re.compile(r"cart\.remove\('(\d+)'\)")
+
+    # Connections are pooled across every test of the worker; cookie jars stay per session
+    _adapter = None
+    _lock = threading.Lock()
+    totals = {'seeded_items': 0, 'cleared_items': 0, 'requests': 0, 'seconds': 0.0}
+
+    def __init__(self, base_url, cookies=None, timeout=10, pool_size=4):
+        self.base_url = base_url.rstrip('/') + '/'
+        self.timeout = timeout
+        self._http = requests.Session()
+        adapter = self._get_adapter(pool_size)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        for cookie in cookies or []:
+            self._http.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'])
+
+    @classmethod
+    def from_config(cls, config, cookies=None):
+        """Create a cart session from [CART_API] settings, optionally continuing an existing session"""
+        return cls(
+            base_url=config.get_base_url(),
+            cookies=cookies,
+            timeout=config.get_cart_api_timeout(),
+            pool_size=config.get_cart_api_pool_size()
+        )
+
+    @classmethod
+    def _get_adapter(cls, pool_size):
+        with cls._lock:
+            if cls._adapter is None:
+                cls._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            return cls._adapter
+
+    def seed(self, products):
+        """Add (product_id, quantity) pairs to the cart"""
+        try:
+            for product_id, quantity in products:
+                response = self._request("post", self.ADD_ROUTE, data={'product_id': product_id,
+                                                                      'quantity': quantity})
+                result = response.json()
+                # Products with required options answer with a redirect to their page instead of adding
+                if 'success' not in result:
+                    raise ValueError(f"product {product_id} was not added: {result.get('error') or result}")
+            self._count('seeded_items', sum(quantity for _, quantity in products))
+            logger.info("Seeded cart with {count} products over HTTP", count=len(products), products=products)
+        except Exception as e:
+            logger.error(f"Failed to seed cart: {str(e)}")
+            raise
+
+    def get_cart_keys(self):
+        """Get the cart_id of every line in the cart"""
+        response = self._request("get", self.INFO_ROUTE)
+        return list(dict.fromkeys(self.CART_KEY_PATTERN.findall(response.text)))
+
+    def clear(self):
+        """Remove every line with one request each (the UI reloads the cart after every removal)"""
+        try:
+            keys = self.get_cart_keys()
+            for key in keys:
+                self._request("post", self.REMOVE_ROUTE, data={'key': key})
+            self._count('cleared_items', len(keys))
+            logger.debug("Cleared {count} cart lines over HTTP", count=len(keys))
+            return len(keys)
+        except Exception as e:
+            logger.error(f"Failed to clear cart: {str(e)}")
+            raise
+
+    def get_cookies(self):
+        """Get this session's cookies in WebDriver format, for the browser to continue it"""
+        return [SessionCache.to_selenium_cookie(cookie) for cookie in self._http.cookies]
+
+    @classmethod
+    def stats(cls):
+        """Get worker-wide seeding counts and time spent on cart requests"""
+        with cls._lock:
+            return {**cls.totals, 'seconds': round(cls.totals['seconds'], 3)}
+
+    def _request(self, method, route, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = self._http.request(method, self.base_url + route, timeout=self.timeout, **kwargs)
+            response.raise_for_status()
+            return response
+        finally:
+            with self._lock:
+                self.totals['requests'] += 1
+                self.totals['seconds'] += time.perf_counter() - start
+
+    def _count(self, name, value):
+        with self._lock:
+            self.totals[name] += value
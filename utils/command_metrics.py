@@ -0,0 +1,131 @@
+"""
+WebDriver command counting and latency histograms per test
+"""
+import threading
+import time
+from loguru import logger
+
+
+class CommandRecorder:
+    """Wraps a driver's command executor and records every round trip of the current test"""
+
+    # Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    _default = None
+
+    def __init__(self):
+        self.current_test = None
+        self._commands = []
+        self._lock = threading.Lock()
+        self.tests = {}
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide recorder"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def attach(self, driver):
+        """Route a driver's commands through the recorder (once per driver)"""
+        executor = driver.command_executor
+        if getattr(executor, "_command_recorder", None) is self:
+            return
+        original_execute = executor.execute
+
+        def execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                self._record(command, time.perf_counter() - start)
+
+        executor.execute = execute
+        executor._command_recorder = self
+
+    def begin(self, test_id):
+        """Start recording commands for a test"""
+        with self._lock:
+            self.current_test = test_id
+            self._commands = []
+
+    def command_count(self):
+        """Get the number of commands recorded for the current test so far"""
+        with self._lock:
+            return len(self._commands)
+
+    def end(self):
+        """Stop recording and return the current test's summary"""
+        with self._lock:
+            test_id, commands = self.current_test, self._commands
+            self.current_test = None
+            self._commands = []
+        if test_id is None:
+            return None
+        summary = self.summarize(commands)
+        self.tests[test_id] = summary
+        logger.info(f"{summary['total_commands']} WebDriver commands in {summary['total_ms']}ms")
+        return summary
+
+    def report(self):
+        """Get per-test summaries plus worker totals"""
+        by_command = {}
+        for summary in self.tests.values():
+            for command, stats in summary['by_command'].items():
+                totals = by_command.setdefault(command, {'count': 0, 'total_ms': 0.0})
+                totals['count'] += stats['count']
+                totals['total_ms'] = round(totals['total_ms'] + stats['total_ms'], 2)
+        return {
+            'totals': {
+                'tests': len(self.tests),
+                'total_commands': sum(s['total_commands'] for s in self.tests.values()),
+                'total_ms': round(sum(s['total_ms'] for s in self.tests.values()), 2),
+                'by_command': by_command,
+            },
+            'tests': self.tests,
+        }
+
+    def budget_failure(self, budget):
+        """Get the failure message if the current test made more commands than budget, else None"""
+        used = self.command_count()
+        if used > budget:
+            return f"WebDriver command budget exceeded: {used} commands (budget {budget})"
+        return None
+
+    @staticmethod
+    def budget_limit(marker):
+        """Get a command_budget marker's limit (None if it was given none)"""
+        return marker.args[0] if marker.args else marker.kwargs.get("max_commands")
+
+    @classmethod
+    def unbounded_budgets(cls, items):
+        """Get the node ids of items whose command_budget marker has no limit"""
+        return [item.nodeid for item in items
+                if item.get_closest_marker("command_budget") is not None
+                and cls.budget_limit(item.get_closest_marker("command_budget")) is None]
+
+    @classmethod
+    def summarize(cls, commands):
+        """Build totals and a latency histogram from (command, seconds) pairs"""
+        labels = [f"<={bound}ms" for bound in cls.BUCKETS_MS] + [f">{cls.BUCKETS_MS[-1]}ms"]
+        histogram = dict.fromkeys(labels, 0)
+        by_command = {}
+        for command, seconds in commands:
+            latency_ms = seconds * 1000
+            bucket = next((i for i, bound in enumerate(cls.BUCKETS_MS) if latency_ms <= bound), len(cls.BUCKETS_MS))
+            histogram[labels[bucket]] += 1
+            stats = by_command.setdefault(command, {'count': 0, 'total_ms': 0.0})
+            stats['count'] += 1
+            stats['total_ms'] = round(stats['total_ms'] + latency_ms, 2)
+        return {
+            'total_commands': len(commands),
+            'total_ms': round(sum(seconds for _, seconds in commands) * 1000, 2),
+            'histogram': histogram,
+            'by_command': by_command,
+        }
+
+    def _record(self, command, seconds):
+        with self._lock:
+            if self.current_test is not None:
+                self._commands.append((command, seconds))
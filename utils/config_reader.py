@@ -2,6 +2,7 @@
 Configuration Reader for handling config files
 """
 import configparser
+import json
 import os
 from pathlib import Path
 from loguru import logger
@@ -48,6 +49,10 @@ class ConfigReader:
         """Get page load timeout"""
         return self.config.getint('ENVIRONMENT', 'page_load_timeout')
     
+    def get_page_load_strategy(self):
+        """Get page load strategy (normal, eager or none)"""
+        return self.config.get('ENVIRONMENT', 'page_load_strategy', fallback='normal')
+    
     def get_valid_credentials(self):
         """Get valid login credentials"""
         return {
@@ -88,4 +93,220 @@ class ConfigReader:
     
     def get_html_report_path(self):
         """Get HTML report directory path"""
-        return self.config.get('REPORTING', 'html_report')
\ No newline at end of file
+        return self.config.get('REPORTING', 'html_report')
+    
+    def is_driver_pool_enabled(self):
+        """Check if browsers are reused across tests"""
+        return self.config.getboolean('DRIVER_POOL', 'enabled', fallback=False)
+    
+    def get_driver_pool_max_uses(self):
+        """Get number of tests a pooled browser serves before it is retired"""
+        return self.config.getint('DRIVER_POOL', 'max_uses', fallback=20)
+    
+    def get_isolation_mode(self):
+        """Get isolation between tests sharing a browser (reset, context or restart)"""
+        return self.config.get('DRIVER_POOL', 'isolation', fallback='reset')
+    
+    def get_prewarm_spares(self):
+        """Get number of spare browser sessions started ahead of demand"""
+        return self.config.getint('DRIVER_POOL', 'prewarm_spares', fallback=0)
+    
+    def get_driver_version(self, browser):
+        """Get pinned driver version for a browser (empty for latest)"""
+        return self.config.get('DRIVERS', f'{browser}_version', fallback='')
+    
+    def get_driver_path(self, browser):
+        """Get explicit driver binary path for a browser (empty to resolve)"""
+        return self.config.get('DRIVERS', f'{browser}_path', fallback='')
+    
+    def get_driver_cache_dir(self):
+        """Get directory of the resolved driver cache"""
+        return self.config.get('DRIVERS', 'cache_dir', fallback='.driver_cache')
+    
+    def is_driver_offline(self):
+        """Check if driver resolution must not use the network"""
+        return self.config.getboolean('DRIVERS', 'offline', fallback=False)
+    
+    def get_quit_timeout(self):
+        """Get hard timeout for driver quit() in seconds"""
+        return self.config.getint('WATCHDOG', 'quit_timeout', fallback=15)
+    
+    def get_max_browser_rss_mb(self):
+        """Get browser memory (MB) above which a pooled browser is recycled, 0 to disable"""
+        return self.config.getint('WATCHDOG', 'max_browser_rss_mb', fallback=0)
+    
+    def is_resource_blocking_enabled(self):
+        """Check if configured resources are blocked in the browser"""
+        return self.config.getboolean('PERFORMANCE', 'block_resources', fallback=False)
+    
+    def get_blocked_resource_types(self):
+        """Get resource types to block (image, font, media, stylesheet)"""
+        return self._get_list('PERFORMANCE', 'blocked_resource_types')
+    
+    def get_blocked_url_patterns(self):
+        """Get URL wildcard patterns to block"""
+        return self._get_list('PERFORMANCE', 'blocked_url_patterns')
+    
+    def _get_list(self, section, option):
+        """Get a comma separated option as a list"""
+        value = self.config.get(section, option, fallback='')
+        return [item.strip() for item in value.split(',') if item.strip()]
+    
+    def is_profile_template_enabled(self):
+        """Check if browsers start from a copied template profile"""
+        return self.config.getboolean('PROFILES', 'use_template', fallback=False)
+    
+    def get_profile_template_dir(self):
+        """Get directory holding the per-browser profile templates"""
+        return self.config.get('PROFILES', 'template_dir', fallback='.profile_templates')
+    
+    def get_profile_session_dir(self):
+        """Get tmpfs directory for per-session profile copies"""
+        return self.config.get('PROFILES', 'session_dir', fallback='/dev/shm')
+    
+    def get_profile_disk_cache_mb(self):
+        """Get browser disk cache size for template profiles in MB"""
+        return self.config.getint('PROFILES', 'disk_cache_mb', fallback=32)
+    
+    def get_remote_settings(self):
+        """Get Selenium Grid URL, browser, extra capabilities and connection pool size"""
+        return {
+            'grid_url': self.config.get('REMOTE', 'grid_url', fallback='http://localhost:4444'),
+            'browser_name': self.config.get('REMOTE', 'browser_name', fallback='chrome'),
+            'capabilities': json.loads(self.config.get('REMOTE', 'capabilities', fallback='{}') or '{}'),
+            'pool_size': self.get_remote_pool_size()
+        }
+    
+    def get_remote_pool_size(self):
+        """Get the grid connection pool size: [REMOTE] pool_size if set, else the xdist worker count"""
+        pool_size = self.config.get('REMOTE', 'pool_size', fallback='').strip()
+        if pool_size:
+            return int(pool_size)
+        return int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    
+    def get_wait_mode(self):
+        """Get wait mode: poll (WebDriverWait) or event (MutationObserver)"""
+        return self.config.get('WAITS', 'mode', fallback='poll')
+    
+    def get_network_quiet_ms(self):
+        """Get how long the network must stay idle before a network-idle wait returns"""
+        return self.config.getint('WAITS', 'network_quiet_ms', fallback=100)
+    
+    def get_probe_timeout(self):
+        """Get the short bound for checks that expect an element to be missing or already there (seconds)"""
+        return self.config.getfloat('WAITS', 'probe_timeout', fallback=2)
+    
+    def is_adaptive_timeouts_enabled(self):
+        """Check if per-locator timeouts are learned from wait history"""
+        return self.config.getboolean('ADAPTIVE_TIMEOUTS', 'enabled', fallback=False)
+    
+    def get_adaptive_timeouts_store(self):
+        """Get the wait history file shared by all runs and workers"""
+        return self.config.get('ADAPTIVE_TIMEOUTS', 'store_path', fallback='.wait_history/timeouts.json')
+    
+    def get_adaptive_timeouts_percentile(self):
+        """Get the percentile of observed wait times a timeout is based on"""
+        return self.config.getint('ADAPTIVE_TIMEOUTS', 'percentile', fallback=95)
+    
+    def get_adaptive_timeouts_safety_factor(self):
+        """Get the multiplier applied to the percentile"""
+        return self.config.getfloat('ADAPTIVE_TIMEOUTS', 'safety_factor', fallback=3.0)
+    
+    def get_adaptive_timeouts_min(self):
+        """Get the lower bound for a learned timeout in seconds"""
+        return self.config.getfloat('ADAPTIVE_TIMEOUTS', 'min_timeout', fallback=2)
+    
+    def get_adaptive_timeouts_max(self):
+        """Get the upper bound for a learned timeout in seconds"""
+        return self.config.getfloat('ADAPTIVE_TIMEOUTS', 'max_timeout', fallback=30)
+    
+    def get_adaptive_timeouts_min_samples(self):
+        """Get how many observations a locator needs before its timeout is learned"""
+        return self.config.getint('ADAPTIVE_TIMEOUTS', 'min_samples', fallback=5)
+    
+    def get_retry_base_delay(self):
+        """Get the first retry delay in seconds"""
+        return self.config.getfloat('RETRY', 'base_delay', fallback=0.1)
+    
+    def get_retry_max_delay(self):
+        """Get the longest delay between retries in seconds"""
+        return self.config.getfloat('RETRY', 'max_delay', fallback=1.0)
+    
+    def get_retry_multiplier(self):
+        """Get the backoff multiplier between retries"""
+        return self.config.getfloat('RETRY', 'multiplier', fallback=2.0)
+    
+    def get_retry_jitter(self):
+        """Get the fraction of each delay that is randomised"""
+        return self.config.getfloat('RETRY', 'jitter', fallback=0.5)
+    
+    def get_retry_deadline(self):
+        """Get the overall time limit for retrying one step in seconds"""
+        return self.config.getfloat('RETRY', 'deadline', fallback=10.0)
+    
+    def get_retry_rules(self):
+        """Get {exception name: attempts} for exceptions worth retrying"""
+        rules = {}
+        for rule in self._get_list('RETRY', 'rules'):
+            name, _, attempts = rule.partition(':')
+            rules[name.strip()] = int(attempts or 3)
+        return rules
+    
+    def get_form_fill_mode(self):
+        """Get form fill mode: batched (one script per form) or keystroke (send_keys per field)"""
+        return self.config.get('FORMS', 'mode', fallback='batched')
+    
+    def get_keystroke_forms(self):
+        """Get forms that are always typed with real keystrokes"""
+        return self._get_list('FORMS', 'keystroke_forms')
+    
+    def is_element_cache_enabled(self):
+        """Check if page objects reuse resolved elements within a page generation"""
+        return self.config.getboolean('ELEMENT_CACHE', 'enabled', fallback=True)
+    
+    def get_snapshot_dir(self):
+        """Get the directory of HTML page snapshots used for offline locator validation, relative to the repo"""
+        return str(self.config_path.parent.parent / self.config.get('LOCATORS', 'snapshot_dir',
+                                                                    fallback='tests/data/snapshots'))
+    
+    def get_log_dir(self):
+        """Get the directory of per-worker log files"""
+        return self.config.get('LOGGING', 'log_dir', fallback='tests/reports/logs')
+    
+    def get_log_level(self):
+        """Get the lowest level written to the log files"""
+        return self.config.get('LOGGING', 'level', fallback='DEBUG')
+    
+    def get_console_log_level(self):
+        """Get the lowest level written to the console"""
+        return self.config.get('LOGGING', 'console_level', fallback='INFO')
+    
+    def get_test_log_buffer_size(self):
+        """Get how many records of a running test are kept in memory (0 logs every test to disk)"""
+        return self.config.getint('LOGGING', 'test_buffer_size', fallback=2000)
+    
+    def is_session_cache_enabled(self):
+        """Check if logged-in sessions are cached on disk and shared by workers"""
+        return self.config.getboolean('SESSION_CACHE', 'enabled', fallback=True)
+    
+    def get_session_cache_store(self):
+        """Get the path of the shared session cookie store"""
+        return self.config.get('SESSION_CACHE', 'store_path', fallback='.session_cache/sessions.json')
+    
+    def get_session_revalidate_after(self):
+        """Get how long a validated session is reused by a process before it is checked again (seconds)"""
+        return self.config.getint('SESSION_CACHE', 'revalidate_after', fallback=60)
+    
+    def get_cart_seed_products(self):
+        """Get the default products seeded into cart_items tests as (product_id, quantity) pairs"""
+        products = self.config.get('CART_API', 'seed_products', fallback='43:1')
+        return [tuple(int(part) for part in item.split(':')) if ':' in item else (int(item), 1)
+                for item in products.replace(' ', '').split(',') if item]
+    
+    def get_cart_api_timeout(self):
+        """Get the timeout of cart API requests (seconds)"""
+        return self.config.getint('CART_API', 'timeout', fallback=10)
+    
+    def get_cart_api_pool_size(self):
+        """Get how many keep-alive connections cart API requests share"""
+        return self.config.getint('CART_API', 'pool_size', fallback=4)
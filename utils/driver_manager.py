@@ -2,45 +2,77 @@
 Driver Manager for handling different browsers
 """
 import os
+import time
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from loguru import logger
 
+from utils.driver_resolver import DriverResolver
+from utils.driver_watchdog import DriverWatchdog
+from utils.resource_blocker import ResourceBlocker
+from utils.browser_profiles import ProfileTemplates
+from utils.grid_connection import GridConnection
+from utils.wait_utils import NETWORK_TRACKER_SCRIPT
+
 
 class DriverManager:
     """Manages WebDriver instances for different browsers"""
     
-    def __init__(self, browser="chrome", headless=False):
+    # Browsers whose per-test isolation can use CDP browser contexts
+    CONTEXT_ISOLATION_BROWSERS = ("chrome",)
+    
+    PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+    
+    def __init__(self, browser="chrome", headless=False, resolver=None, watchdog=None, resource_blocker=None,
+                 page_load_strategy="normal", page_load_timeout=30, profile_templates=None, remote_settings=None):
+        if page_load_strategy not in self.PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"Unsupported page load strategy: {page_load_strategy}")
         self.browser = browser.lower()
         self.headless = headless
+        self.page_load_strategy = page_load_strategy
+        self.page_load_timeout = page_load_timeout
+        self.resolver = resolver or DriverResolver.default()
+        self.watchdog = watchdog or DriverWatchdog.default()
+        self.resource_blocker = resource_blocker or ResourceBlocker.default()
+        self.profile_templates = profile_templates or ProfileTemplates.default()
+        self.remote_settings = remote_settings
+        self.profile_dir = None
+        self.startup_time = None
         self.driver = None
+        self.default_window = None
         
     def get_driver(self):
         """Initialize and return WebDriver instance"""
         try:
+            start = time.perf_counter()
             if self.browser == "chrome":
                 self.driver = self._get_chrome_driver()
             elif self.browser == "firefox":
                 self.driver = self._get_firefox_driver()
             elif self.browser == "edge":
                 self.driver = self._get_edge_driver()
+            elif self.browser == "remote":
+                self.driver = self._get_remote_driver()
             else:
                 raise ValueError(f"Unsupported browser: {self.browser}")
             
-            # Set timeouts
-            self.driver.implicitly_wait(10)
-            self.driver.set_page_load_timeout(30)
+            self.watchdog.track(self)
+            self.resource_blocker.enable(self.driver, self.browser)
+            self.install_network_tracker()
+            
+            # Explicit waits only: an implicit wait would stack under every WaitUtils poll
+            self.driver.set_page_load_timeout(self.page_load_timeout)
             self.driver.maximize_window()
             
-            logger.info(f"Successfully initialized {self.browser} driver")
+            self.startup_time = time.perf_counter() - start
+            profile_mode = "template profile" if self.profile_dir else "fresh profile"
+            logger.info(f"Successfully initialized {self.browser} driver ({self.page_load_strategy} page load, "
+                        f"{profile_mode}) in {self.startup_time:.2f}s")
             return self.driver
             
         except Exception as e:
@@ -49,7 +81,46 @@ class DriverManager:
     
     def _get_chrome_driver(self):
         """Initialize Chrome driver"""
+        service = ChromeService(self.resolver.resolve("chrome"))
+        return webdriver.Chrome(service=service, options=self._get_chrome_options())
+    
+    def _get_firefox_driver(self):
+        """Initialize Firefox driver"""
+        service = FirefoxService(self.resolver.resolve("firefox"))
+        return webdriver.Firefox(service=service, options=self._get_firefox_options())
+    
+    def _get_edge_driver(self):
+        """Initialize Edge driver"""
+        service = EdgeService(self.resolver.resolve("edge"))
+        return webdriver.Edge(service=service, options=self._get_edge_options())
+    
+    def _get_remote_driver(self):
+        """Initialize Remote driver on a Selenium Grid"""
+        settings = self.remote_settings
+        if settings is None:
+            from utils.config_reader import ConfigReader
+            settings = ConfigReader().get_remote_settings()
+        
+        option_builders = {
+            "chrome": self._get_chrome_options,
+            "firefox": self._get_firefox_options,
+            "edge": self._get_edge_options
+        }
+        if settings['browser_name'] not in option_builders:
+            raise ValueError(f"Unsupported remote browser: {settings['browser_name']}")
+        
+        # Profiles and CDP blocking live on the grid host, so only portable options are sent
+        options = option_builders[settings['browser_name']](local=False)
+        for name, value in settings['capabilities'].items():
+            options.set_capability(name, value)
+        
+        connection = GridConnection.shared(settings['grid_url'], pool_size=settings['pool_size'])
+        return webdriver.Remote(command_executor=connection, options=options)
+    
+    def _get_chrome_options(self, local=True):
+        """Build Chrome options"""
         options = ChromeOptions()
+        options.page_load_strategy = self.page_load_strategy
         
         if self.headless:
             options.add_argument("--headless")
@@ -63,38 +134,114 @@ class DriverManager:
         options.add_argument("--disable-logging")
         options.add_argument("--disable-web-security")
         options.add_argument("--allow-running-insecure-content")
-        
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        if local:
+            self.resource_blocker.configure_chromium_options(options)
+            self._use_chromium_template(options)
+        return options
     
-    def _get_firefox_driver(self):
-        """Initialize Firefox driver"""
+    def _get_firefox_options(self, local=True):
+        """Build Firefox options"""
         options = FirefoxOptions()
+        options.page_load_strategy = self.page_load_strategy
         
         if self.headless:
             options.add_argument("--headless")
         
         options.add_argument("--width=1920")
         options.add_argument("--height=1080")
-        
-        service = FirefoxService(GeckoDriverManager().install())
-        return webdriver.Firefox(service=service, options=options)
+        self.resource_blocker.configure_firefox_options(options)
+        if local and self.profile_templates.enabled:
+            self.profile_dir = self.profile_templates.create_session_profile("firefox")
+            options.add_argument("-profile")
+            options.add_argument(self.profile_dir)
+        return options
     
-    def _get_edge_driver(self):
-        """Initialize Edge driver"""
+    def _get_edge_options(self, local=True):
+        """Build Edge options"""
         options = EdgeOptions()
+        options.page_load_strategy = self.page_load_strategy
         
         if self.headless:
             options.add_argument("--headless")
         
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-extensions")
-        
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        return webdriver.Edge(service=service, options=options)
+        if local:
+            self.resource_blocker.configure_chromium_options(options, "edge")
+            self._use_chromium_template(options)
+        return options
+    
+    def _use_chromium_template(self, options):
+        """Start Chrome/Edge from a tmpfs copy of the template profile"""
+        if self.profile_templates.enabled:
+            self.profile_dir = self.profile_templates.create_session_profile(self.browser)
+            for argument in self.profile_templates.get_chromium_arguments(self.profile_dir):
+                options.add_argument(argument)
+    
+    def supports_context_isolation(self):
+        """Check if isolated browser contexts are available for this browser"""
+        return self.browser in self.CONTEXT_ISOLATION_BROWSERS
+    
+    def open_isolated_context(self):
+        """Create a fresh browser context and switch to a new tab inside it"""
+        try:
+            if self.default_window is None:
+                self.default_window = self.driver.current_window_handle
+            context = self.driver.execute_cdp_cmd("Target.createBrowserContext", {})
+            context_id = context["browserContextId"]
+            target = self.driver.execute_cdp_cmd("Target.createTarget", {
+                "url": "about:blank",
+                "browserContextId": context_id,
+                "width": 1920,
+                "height": 1080
+            })
+            # ChromeDriver window handles are the DevTools target ids
+            self.driver.switch_to.window(target["targetId"])
+            self.resource_blocker.enable(self.driver, self.browser)
+            self.install_network_tracker()
+            logger.debug(f"Opened isolated browser context: {context_id}")
+            return context_id
+        except Exception as e:
+            logger.error(f"Failed to open isolated browser context: {str(e)}")
+            raise
+    
+    def close_isolated_context(self, context_id):
+        """Dispose a browser context and return to the default tab"""
+        try:
+            self.driver.switch_to.window(self.default_window)
+            self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+            logger.debug(f"Disposed isolated browser context: {context_id}")
+        except Exception as e:
+            logger.error(f"Failed to dispose browser context {context_id}: {str(e)}")
+            raise
+    
+    def install_network_tracker(self):
+        """Instrument XHR/fetch on every new document so network-idle waits see requests from page start"""
+        if self.browser not in ResourceBlocker.CHROMIUM_BROWSERS:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_SCRIPT})
+        except Exception as e:
+            logger.error(f"Failed to install network tracker: {str(e)}")
+            raise
+    
+    def set_resource_blocking(self, enabled):
+        """Turn configured resource blocking on or off for the current tab"""
+        if enabled:
+            self.resource_blocker.enable(self.driver, self.browser)
+        else:
+            self.resource_blocker.disable(self.driver, self.browser)
+    
+    def collect_resource_stats(self):
+        """Get blocked/loaded request counts since the last call"""
+        return self.resource_blocker.collect(self.driver, self.browser)
     
     def quit_driver(self):
         """Quit the driver instance"""
         if self.driver:
-            self.driver.quit()
-            logger.info("Driver quit successfully")
\ No newline at end of file
+            self.watchdog.quit(self)
+            self.driver = None
+            logger.info("Driver quit successfully")
+        if self.profile_dir:
+            self.profile_templates.remove(self.profile_dir)
+            self.profile_dir = None
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""
+Driver pool for reusing WebDriver instances across tests
+"""
+import time
+from loguru import logger
+
+from utils.driver_manager import DriverManager
+
+
+class PooledDriver:
+    """A pooled browser together with the manager that owns it"""
+
+    def __init__(self, manager, driver):
+        self.manager = manager
+        self.driver = driver
+        self.uses = 0
+        self.context_id = None
+
+
+class DriverPool:
+    """Keeps browsers alive for the whole worker and lends them to tests
+
+    Isolation between leases is one of:
+        reset   - clear cookies, storage and extra windows of the shared browser
+        context - open a fresh CDP browser context per lease (Chrome only)
+        restart - start a new browser for every lease
+    """
+
+    ISOLATION_MODES = ("reset", "context", "restart")
+
+    def __init__(self, browser="chrome", headless=False, max_uses=20, launcher=None, isolation="reset",
+                 driver_options=None):
+        if isolation not in self.ISOLATION_MODES:
+            raise ValueError(f"Unsupported isolation mode: {isolation}")
+        if isolation == "context" and browser.lower() not in DriverManager.CONTEXT_ISOLATION_BROWSERS:
+            logger.info(f"Browser contexts are unavailable for {browser}, falling back to restarts")
+            isolation = "restart"
+
+        self.browser = browser
+        self.headless = headless
+        self.isolation = isolation
+        self.max_uses = 1 if isolation == "restart" else max(1, max_uses)
+        self.launcher = launcher
+        self.driver_options = driver_options or {}
+        self._idle = []
+        self._leased = {}
+        self.lease_times = []
+        self.reset_times = []
+        self.startup_times = []
+        self.created = 0
+        self.retired = 0
+
+    def acquire(self):
+        """Lease a ready driver, starting a new browser if none is idle"""
+        start = time.perf_counter()
+        if self._idle:
+            entry = self._idle.pop()
+        else:
+            entry = self._create()
+        if self.isolation == "context":
+            try:
+                entry.context_id = entry.manager.open_isolated_context()
+            except Exception:
+                self._retire(entry, "context creation failed")
+                raise
+        self._leased[id(entry.driver)] = entry
+        elapsed = time.perf_counter() - start
+        self.lease_times.append(elapsed)
+        logger.debug(f"Leased {self.browser} driver in {elapsed:.3f}s (use {entry.uses + 1}/{self.max_uses})")
+        return entry.driver
+
+    def get_manager(self, driver):
+        """Get the DriverManager owning a leased driver"""
+        return self._leased[id(driver)].manager
+
+    def release(self, driver, crashed=False):
+        """Return a driver to the pool, retiring it when worn out or broken"""
+        entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            logger.warning("Released a driver that was not leased from the pool")
+            return
+        entry.uses += 1
+
+        if crashed:
+            self._retire(entry, "crashed")
+        elif entry.uses >= self.max_uses:
+            self._retire(entry, f"reached {self.max_uses} uses")
+        elif entry.manager.watchdog.exceeds_rss(entry.manager):
+            self._retire(entry, "memory threshold exceeded")
+        elif self._reset(entry):
+            self._idle.append(entry)
+        else:
+            self._retire(entry, "reset failed")
+
+    def close(self):
+        """Quit every browser owned by the pool"""
+        for entry in self._idle + list(self._leased.values()):
+            self._retire(entry, "pool closed")
+        self._idle = []
+        self._leased = {}
+        logger.info(f"Driver pool closed: {self.stats()}")
+
+    def stats(self):
+        """Get lease/reset latency statistics"""
+        return {
+            'browser': self.browser,
+            'isolation': self.isolation,
+            'max_uses': self.max_uses,
+            'created': self.created,
+            'retired': self.retired,
+            'leases': len(self.lease_times),
+            'lease_avg_s': self._average(self.lease_times),
+            'lease_max_s': max(self.lease_times, default=0.0),
+            'resets': len(self.reset_times),
+            'reset_avg_s': self._average(self.reset_times),
+            'reset_max_s': max(self.reset_times, default=0.0),
+            'startup_avg_s': self._average(self.startup_times),
+            'launcher': self.launcher.stats() if self.launcher else None,
+        }
+
+    def _create(self):
+        """Start a new browser, taking a pre-warmed one when available"""
+        if self.launcher:
+            manager = self.launcher.acquire()
+            driver = manager.driver
+        else:
+            manager = DriverManager(browser=self.browser, headless=self.headless, **self.driver_options)
+            driver = manager.get_driver()
+        self.created += 1
+        if manager.startup_time is not None:
+            self.startup_times.append(manager.startup_time)
+        return PooledDriver(manager, driver)
+
+    def _reset(self, entry):
+        """Clear cookies, storage and extra windows between leases"""
+        start = time.perf_counter()
+        driver = entry.driver
+        try:
+            # The performance log is per browser, not per context; whatever the last test left in it
+            # (e.g. a failed test whose stats were never collected) must not be billed to the next lease
+            entry.manager.collect_resource_stats()
+            if entry.context_id:
+                # Disposing the context drops its cookies, storage and tabs
+                entry.manager.close_isolated_context(entry.context_id)
+                entry.context_id = None
+                self.reset_times.append(time.perf_counter() - start)
+                return True
+
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per origin; the suite only visits the configured storefront
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            else:
+                driver.delete_all_cookies()
+
+            elapsed = time.perf_counter() - start
+            self.reset_times.append(elapsed)
+            logger.debug(f"Reset pooled driver in {elapsed:.3f}s")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled driver: {str(e)}")
+            return False
+
+    def _retire(self, entry, reason):
+        """Quit a pooled browser"""
+        try:
+            entry.manager.quit_driver()
+        except Exception as e:
+            logger.warning(f"Failed to quit retired driver: {str(e)}")
+        self.retired += 1
+        logger.info(f"Retired {self.browser} driver after {entry.uses} uses ({reason})")
+
+    @staticmethod
+    def _average(values):
+        return sum(values) / len(values) if values else 0.0
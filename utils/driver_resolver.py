@@ -0,0 +1,121 @@
+"""
+Driver resolver with an offline, file-locked cache of driver binaries
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+from filelock import FileLock
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+from loguru import logger
+
+
+class DriverResolver:
+    """Resolves driver binaries once and shares them across xdist workers"""
+
+    BINARY_NAMES = {
+        "chrome": "chromedriver",
+        "firefox": "geckodriver",
+        "edge": "msedgedriver",
+    }
+
+    _default = None
+
+    def __init__(self, cache_dir=".driver_cache", versions=None, paths=None, offline=False):
+        self.cache_dir = Path(cache_dir)
+        self.versions = versions or {}
+        self.paths = paths or {}
+        self.offline = offline
+        self.cache_file = self.cache_dir / "drivers.json"
+        self.lock = FileLock(str(self.cache_dir / "drivers.lock"))
+        self.hits = 0
+        self.misses = 0
+        self._resolved = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Create resolver from [DRIVERS] settings"""
+        return cls(
+            cache_dir=config.get_driver_cache_dir(),
+            versions={browser: config.get_driver_version(browser) for browser in cls.BINARY_NAMES},
+            paths={browser: config.get_driver_path(browser) for browser in cls.BINARY_NAMES},
+            offline=config.is_driver_offline()
+        )
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide resolver built from config.ini"""
+        if cls._default is None:
+            from utils.config_reader import ConfigReader
+            cls._default = cls.from_config(ConfigReader())
+        return cls._default
+
+    def resolve(self, browser):
+        """Return the driver binary path for a browser"""
+        browser = browser.lower()
+        if browser not in self.BINARY_NAMES:
+            raise ValueError(f"Unsupported browser: {browser}")
+
+        # A pinned path needs no lookup at all
+        if self.paths.get(browser):
+            return self.paths[browser]
+
+        key = f"{browser}:{self.versions.get(browser) or 'latest'}"
+        if key in self._resolved:
+            return self._resolved[key]
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            cache = self._read_cache()
+            path = cache.get(key)
+            if path and os.path.exists(path):
+                self.hits += 1
+                logger.info(f"Driver cache hit for {key}: {path}")
+            else:
+                self.misses += 1
+                logger.info(f"Driver cache miss for {key}, resolving")
+                path = self._install(browser)
+                cache[key] = path
+                self._write_cache(cache)
+
+        self._resolved[key] = path
+        return path
+
+    def _install(self, browser):
+        """Resolve a driver binary, without network access when offline"""
+        if self.offline:
+            path = shutil.which(self.BINARY_NAMES[browser])
+            if not path:
+                raise FileNotFoundError(
+                    f"No cached {self.BINARY_NAMES[browser]} and offline mode is on; "
+                    f"set [DRIVERS] {browser}_path or warm the cache online first"
+                )
+            return path
+
+        version = self.versions.get(browser) or None
+        cache_manager = DriverCacheManager(root_dir=str(self.cache_dir))
+        if browser == "chrome":
+            manager = ChromeDriverManager(driver_version=version, cache_manager=cache_manager)
+        elif browser == "firefox":
+            manager = GeckoDriverManager(version=version, cache_manager=cache_manager)
+        else:
+            manager = EdgeChromiumDriverManager(version=version, cache_manager=cache_manager)
+        return manager.install()
+
+    def _read_cache(self):
+        """Read resolved paths from the on-disk cache"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_cache(self, cache):
+        """Write resolved paths to the on-disk cache"""
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(cache, file, indent=4)
+        os.replace(tmp_file, self.cache_file)
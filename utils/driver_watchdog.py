@@ -0,0 +1,163 @@
+"""
+Watchdog for driver and browser processes spawned by DriverManager
+"""
+import atexit
+import threading
+import psutil
+from loguru import logger
+
+
+class DriverWatchdog:
+    """Tracks driver/browser PIDs, bounds quit() and reaps orphaned processes"""
+
+    # How long processes that are still shutting down after quit() get before they count as leaked
+    REAP_GRACE_SECONDS = 2
+
+    _default = None
+
+    def __init__(self, quit_timeout=15, max_browser_rss_mb=0):
+        self.quit_timeout = quit_timeout
+        self.max_browser_rss_mb = max_browser_rss_mb
+        self._tracked = {}
+        self._lock = threading.Lock()
+        self.reaped = []
+        self.quit_timeouts = 0
+        self.rss_recycles = 0
+        atexit.register(self.reap_all)
+
+    @classmethod
+    def from_config(cls, config):
+        """Create watchdog from [WATCHDOG] settings"""
+        return cls(
+            quit_timeout=config.get_quit_timeout(),
+            max_browser_rss_mb=config.get_max_browser_rss_mb()
+        )
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide watchdog built from config.ini"""
+        if cls._default is None:
+            from utils.config_reader import ConfigReader
+            cls._default = cls.from_config(ConfigReader())
+        return cls._default
+
+    def track(self, manager):
+        """Record the driver service and browser processes of a manager"""
+        pids = self._process_tree(manager.driver)
+        with self._lock:
+            self._tracked[id(manager)] = {'browser': manager.browser, 'pids': pids}
+        logger.debug(f"Tracking {len(pids)} {manager.browser} process(es): {sorted(pids)}")
+
+    def quit(self, manager):
+        """Quit a driver with a hard timeout, then kill anything left behind"""
+        with self._lock:
+            entry = self._tracked.pop(id(manager), None)
+        if entry:
+            # Pick up renderer/helper processes started since tracking
+            entry['pids'].update(self._process_tree(manager.driver))
+
+        thread = threading.Thread(target=self._safe_quit, args=(manager.driver,), daemon=True)
+        thread.start()
+        thread.join(self.quit_timeout)
+        timed_out = thread.is_alive()
+        if timed_out:
+            self.quit_timeouts += 1
+            logger.warning(f"{manager.browser} quit() did not finish within {self.quit_timeout}s")
+
+        if entry:
+            self._reap(entry, "quit timeout" if timed_out else "straggler")
+
+    def browser_rss_mb(self, manager):
+        """Get resident memory of a manager's driver and browser processes in MB"""
+        total = 0
+        for pid in self._process_tree(manager.driver):
+            try:
+                total += psutil.Process(pid).memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def exceeds_rss(self, manager):
+        """Check if a browser has grown past the configured RSS threshold"""
+        if self.max_browser_rss_mb <= 0:
+            return False
+        rss_mb = self.browser_rss_mb(manager)
+        if rss_mb > self.max_browser_rss_mb:
+            self.rss_recycles += 1
+            logger.info(f"{manager.browser} RSS {rss_mb:.0f}MB exceeds {self.max_browser_rss_mb}MB")
+            return True
+        return False
+
+    def reap_all(self):
+        """Kill every process still tracked (teardown and worker exit)"""
+        with self._lock:
+            entries = list(self._tracked.values())
+            self._tracked.clear()
+        for entry in entries:
+            self._reap(entry, "worker exit")
+
+    def stats(self):
+        """Get a summary of what the watchdog reaped"""
+        return {
+            'quit_timeout_s': self.quit_timeout,
+            'quit_timeouts': self.quit_timeouts,
+            'rss_recycles': self.rss_recycles,
+            'reaped_count': len(self.reaped),
+            'reaped': self.reaped,
+        }
+
+    def _reap(self, entry, reason):
+        """Give tracked processes that are still running a moment to exit, then kill and count survivors"""
+        processes = list(self._live_processes(entry['pids']))
+        if not processes:
+            # The usual case after a clean quit(): the whole tree is already gone
+            return
+        _, alive = psutil.wait_procs(processes, timeout=self.REAP_GRACE_SECONDS)
+        for process in alive:
+            try:
+                # Exited (or became a zombie) right at the deadline: not a leak
+                if not self._is_live(process):
+                    continue
+                name = process.name()
+                process.kill()
+            except psutil.Error:
+                continue
+            self.reaped.append({'pid': process.pid, 'name': name, 'browser': entry['browser'], 'reason': reason})
+            logger.warning(f"Reaped {name} (pid {process.pid}): {reason}")
+
+    @classmethod
+    def _live_processes(cls, pids):
+        """Get the tracked processes that still run (guarding against PID reuse by unrelated processes)"""
+        for pid, create_time in pids.items():
+            try:
+                process = psutil.Process(pid)
+                if process.create_time() == create_time and cls._is_live(process):
+                    yield process
+            except psutil.Error:
+                continue
+
+    @staticmethod
+    def _is_live(process):
+        try:
+            return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+
+    @staticmethod
+    def _safe_quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Driver quit raised: {str(e)}")
+
+    @staticmethod
+    def _process_tree(driver):
+        """Get {pid: create_time} for the driver service and its descendants"""
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None:
+            return {}
+        try:
+            root = psutil.Process(process.pid)
+            return {p.pid: p.create_time() for p in [root] + root.children(recursive=True)}
+        except psutil.Error:
+            return {}
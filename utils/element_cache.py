@@ -0,0 +1,97 @@
+"""
+Resolved WebElements per locator, valid for one page generation of a driver
+"""
+import threading
+from loguru import logger
+
+
+class ElementCache:
+    """Caches element lookups for one page generation, ended by navigation, actions and page-changing waits"""
+
+    # Hits cost no round trip. Changes made behind the page objects' back (driver.back() in a test, an AJAX
+    # re-render) are caught lazily: the cached element raises StaleElementReferenceException when used, and
+    # BasePage re-resolves it once through stale_hit()
+
+    # Successful waits that mean the page changed under any cached element
+    INVALIDATING_WAITS = ("page_load", "network_idle", "url", "gone")
+
+    _lock = threading.Lock()
+    totals = {'hits': 0, 'misses': 0, 'stale_hits': 0, 'invalidations': {}}
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.generation = 0
+        self._elements = {}
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the cache shared by every page object on this driver"""
+        cache = getattr(driver, "_element_cache", None)
+        if cache is None:
+            from utils.config_reader import ConfigReader
+            cache = cls(ConfigReader().is_element_cache_enabled())
+            driver._element_cache = cache
+        return cache
+
+    def get(self, key, resolve):
+        """Get the cached value for key in this generation, calling resolve() on a miss"""
+        if not self.enabled:
+            return resolve()
+        if key in self._elements:
+            self._count('hits')
+            return self._elements[key]
+        self._count('misses')
+        value = resolve()
+        # An empty result may fill in later without any signal, so it is not kept
+        if value:
+            self._elements[key] = value
+        return value
+
+    def put(self, key, value):
+        """Keep a value resolved outside get() (e.g. by a zero-wait probe) for the rest of the generation"""
+        if self.enabled and value:
+            self._elements[key] = value
+
+    def peek(self, key):
+        """Get the cached value for key without resolving it (None when not cached)"""
+        if not self.enabled:
+            return None
+        if key not in self._elements:
+            self._count('misses')
+            return None
+        self._count('hits')
+        return self._elements[key]
+
+    def invalidate(self, reason):
+        """Start a new generation, dropping every cached element"""
+        self.generation += 1
+        if self._elements:
+            logger.debug(f"Element cache generation {self.generation} ({reason}), dropped {len(self._elements)}")
+            self._elements = {}
+        with self._lock:
+            self.totals['invalidations'][reason] = self.totals['invalidations'].get(reason, 0) + 1
+
+    def stale_hit(self):
+        """Record that a cached element had gone stale and start a new generation"""
+        self._count('stale_hits')
+        self.invalidate("stale")
+
+    def on_wait(self, event):
+        """WaitUtils listener: waits that saw the page change end the generation"""
+        if event['success'] and event['kind'] in self.INVALIDATING_WAITS:
+            self.invalidate(event['kind'])
+
+    @classmethod
+    def stats(cls):
+        """Get worker-wide hit/miss counts; every hit saved a lookup (and, for find_element, a visibility check)"""
+        with cls._lock:
+            lookups = cls.totals['hits'] + cls.totals['misses']
+            return {
+                **cls.totals,
+                'invalidations': dict(cls.totals['invalidations']),
+                'hit_rate': round(cls.totals['hits'] / lookups, 3) if lookups else 0.0,
+            }
+
+    def _count(self, name):
+        with self._lock:
+            self.totals[name] += 1
@@ -0,0 +1,60 @@
+"""
+Timing of batched form fills against the per-field keystroke cost seen in the same run
+"""
+import threading
+
+
+class FormFillMetrics:
+    """Records each fill_form call and estimates the time batching saved per form"""
+
+    _default = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.forms = {}
+        self.keystroke_fields = 0
+        self.keystroke_seconds = 0.0
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide form fill metrics"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def record_keystroke_field(self, seconds):
+        """Record one field typed with real keystrokes (wait, find, clear, send_keys)"""
+        with self._lock:
+            self.keystroke_fields += 1
+            self.keystroke_seconds += seconds
+
+    def record(self, form, mode, fields, seconds):
+        """Record one fill of form with the given mode and number of fields"""
+        with self._lock:
+            stats = self.forms.setdefault(form, {}).setdefault(mode, {'fills': 0, 'fields': 0, 'seconds': 0.0})
+            stats['fills'] += 1
+            stats['fields'] += fields
+            stats['seconds'] += seconds
+
+    def keystroke_cost(self):
+        """Get the mean seconds per keystroke-typed field, or None before any was typed"""
+        return self.keystroke_seconds / self.keystroke_fields if self.keystroke_fields else None
+
+    def report(self):
+        """Get per-form fill times and the estimated time saved by batched fills"""
+        per_field = self.keystroke_cost()
+        forms = {}
+        for form, modes in self.forms.items():
+            forms[form] = {}
+            for mode, stats in modes.items():
+                entry = {'fills': stats['fills'], 'fields': stats['fields'],
+                         'mean_s': round(stats['seconds'] / stats['fills'], 3)}
+                if mode == "batched" and per_field is not None:
+                    # What the same fields would have cost typed one by one in this run
+                    entry['saved_s'] = round(per_field * stats['fields'] - stats['seconds'], 3)
+                forms[form][mode] = entry
+        return {
+            'keystroke_s_per_field': round(per_field, 3) if per_field is not None else None,
+            'total_saved_s': round(sum(modes.get('batched', {}).get('saved_s', 0) for modes in forms.values()), 3),
+            'forms': forms,
+        }
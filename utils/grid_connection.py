@@ -0,0 +1,77 @@
+"""
+Keep-alive command transport to a local Selenium Grid
+"""
+import time
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from loguru import logger
+
+
+class GridConnection(RemoteConnection):
+    """Pooled keep-alive connection that records per-command round-trip latency"""
+
+    # Round-trip latencies of every grid command in this process, by command name and by test
+    latencies = {}
+    test_latencies = {}
+    current_test = None
+
+    # One connection per process, shared by every Remote driver the process creates
+    _shared = {}
+
+    def __init__(self, remote_server_addr, pool_size=1):
+        # Must be set before RemoteConnection builds its connection manager
+        self.pool_size = max(1, pool_size)
+        super().__init__(remote_server_addr, keep_alive=True)
+        logger.debug(f"Grid connection to {remote_server_addr} with pool size {self.pool_size}")
+
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        # Keep up to pool_size sockets open instead of urllib3's default of one
+        manager.connection_pool_kw.update({"maxsize": self.pool_size, "block": False})
+        return manager
+
+    @classmethod
+    def shared(cls, remote_server_addr, pool_size=1):
+        """Get this process's connection to the grid, creating it on first use"""
+        if remote_server_addr not in cls._shared:
+            cls._shared[remote_server_addr] = cls(remote_server_addr, pool_size)
+        return cls._shared[remote_server_addr]
+
+    def execute(self, command, params):
+        start = time.perf_counter()
+        try:
+            return super().execute(command, params)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.latencies.setdefault(command, []).append(elapsed)
+            if self.current_test is not None:
+                self.test_latencies.setdefault(self.current_test, []).append(elapsed)
+
+    @classmethod
+    def begin_test(cls, test_id):
+        """Attribute the following commands to a test"""
+        GridConnection.current_test = test_id
+
+    @classmethod
+    def end_test(cls):
+        """Stop attributing commands and return the test's latency summary (None if it sent none)"""
+        test_id, GridConnection.current_test = GridConnection.current_test, None
+        values = cls.test_latencies.get(test_id)
+        return cls._summarize(values) if values else None
+
+    @classmethod
+    def latency_summary(cls):
+        """Get count, mean and p95 round-trip latency (ms) per command and per test"""
+        return {
+            'commands': {command: cls._summarize(values) for command, values in sorted(cls.latencies.items())},
+            'tests': {test_id: cls._summarize(values) for test_id, values in cls.test_latencies.items()},
+        }
+
+    @staticmethod
+    def _summarize(values):
+        ordered = sorted(values)
+        return {
+            'count': len(ordered),
+            'mean_ms': round(1000 * sum(ordered) / len(ordered), 2),
+            'p95_ms': round(1000 * ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 2),
+            'total_ms': round(1000 * sum(ordered), 2),
+        }
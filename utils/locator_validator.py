@@ -0,0 +1,391 @@
+"""
+Offline locator validation against saved HTML snapshots of each page, with per-strategy lookup cost
+
+Usage:
+    python -m utils.locator_validator --capture      # save snapshots from the live site (needs network)
+    python -m utils.locator_validator [--pages CartPage LoginPage] [--repeat 200]
+"""
+import argparse
+import inspect
+import re
+import statistics
+import sys
+from pathlib import Path
+from selenium.webdriver.common.by import By
+from loguru import logger
+
+from utils.config_reader import ConfigReader
+from utils.driver_manager import DriverManager
+from utils.report_utils import write_worker_report
+
+
+# Serialises the current DOM without scripts so a snapshot renders the same state offline
+SNAPSHOT_SCRIPT = """
+var clone = document.documentElement.cloneNode(true);
+Array.prototype.forEach.call(clone.querySelectorAll('script'), function (el) { el.remove(); });
+return '<!DOCTYPE html>\\n' + clone.outerHTML;
+"""
+
+# Resolves a locator the way the driver would, times it in the browser and proposes equivalent selectors
+PROBE_SCRIPT = """
+var by = arguments[0], value = arguments[1], repeat = arguments[2];
+
+function lookup(by, value) {
+    if (by === 'xpath') {
+        var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        return nodes;
+    }
+    if (by === 'link text' || by === 'partial link text') {
+        return Array.prototype.filter.call(document.getElementsByTagName('a'), function (a) {
+            var text = (a.innerText || a.textContent).trim();
+            return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+        });
+    }
+    if (by === 'tag name') return Array.prototype.slice.call(document.getElementsByTagName(value));
+    var selectors = {'id': '#' + CSS.escape(value), 'class name': '.' + CSS.escape(value),
+                     'name': '[name="' + value + '"]', 'css selector': value};
+    return Array.prototype.slice.call(document.querySelectorAll(selectors[by]));
+}
+
+function cost(by, value) {
+    var start = performance.now();
+    for (var i = 0; i < repeat; i++) lookup(by, value);
+    return (performance.now() - start) * 1000 / repeat;
+}
+
+function sameSet(found, els) {
+    return found.length === els.length && els.every(function (el, i) { return found[i] === el; });
+}
+
+function describe(el) {
+    return {tag: el.tagName.toLowerCase(), type: el.getAttribute('type'), id: el.id || null,
+            name: el.getAttribute('name'), text: (el.innerText || el.value || '').trim().slice(0, 40)};
+}
+
+function candidates(els) {
+    var out = [], el = els[0];
+    if (els.length === 1 && el.id) out.push(['id', el.id]);
+    if (els.length === 1 && el.getAttribute('name')) out.push(['name', el.getAttribute('name')]);
+    var classes = Array.prototype.filter.call(el.classList, function (c) {
+        return els.every(function (other) { return other.classList.contains(c); });
+    });
+    var tagged = el.tagName.toLowerCase() + classes.map(function (c) { return '.' + CSS.escape(c); }).join('');
+    out.push(['css selector', tagged]);
+    for (var parent = el.parentElement; parent; parent = parent.parentElement) {
+        if (parent.id) {
+            out.push(['css selector', '#' + CSS.escape(parent.id) + ' ' + tagged]);
+            break;
+        }
+    }
+    return out.filter(function (c) {
+        return !(c[0] === by && c[1] === value) && sameSet(lookup(c[0], c[1]), els);
+    }).map(function (c) { return {by: c[0], value: c[1], cost_us: cost(c[0], c[1])}; });
+}
+
+var els;
+try {
+    els = lookup(by, value);
+} catch (e) {
+    return {error: String(e)};
+}
+return {
+    count: els.length,
+    first: els.length ? describe(els[0]) : null,
+    cost_us: cost(by, value),
+    candidates: els.length ? candidates(els) : []
+};
+"""
+
+
+class LocatorValidator:
+    """Checks page object locators against HTML snapshots and times each lookup strategy"""
+
+    # Locator name suffix -> (allowed tags, required type attribute)
+    EXPECTED_ELEMENTS = {
+        "_INPUT": (("input", "textarea"), None),
+        "_SELECT": (("select",), None),
+        "_BUTTON": (("button", "input", "a"), None),
+        "_LINK": (("a",), None),
+        "_TAB": (("a",), None),
+        "_CHECKBOX": (("input",), "checkbox"),
+        "_RADIO": (("input",), "radio"),
+    }
+
+    # A suggestion must be at least this much faster than the current locator
+    MIN_SPEEDUP = 1.2
+
+    STRATEGIES = {value for name, value in vars(By).items() if not name.startswith("_") and isinstance(value, str)}
+
+    def __init__(self, driver, snapshot_dir="tests/data/snapshots", repeat=200):
+        self.driver = driver
+        self.snapshot_dir = Path(snapshot_dir)
+        self.repeat = repeat
+
+    @classmethod
+    def collect_locators(cls, page_class):
+        """Get {attribute name: locator tuple} defined on a page class itself"""
+        # Locators inherited from BasePage (the header) are validated once, as BasePage's own
+        return {name: value for name, value in vars(page_class).items()
+                if name.isupper() and isinstance(value, tuple) and len(value) == 2
+                and value[0] in cls.STRATEGIES and isinstance(value[1], str)}
+
+    @staticmethod
+    def collection_locators(page_class):
+        """Get locator names the page reads as collections (find_elements or extract), or where any match will do"""
+        source = inspect.getsource(page_class)
+        # wait_until_ready only needs the first match to be visible
+        return set(re.findall(r"(?:find_elements|find_cached_elements|extract)\(self\.([A-Z0-9_]+)", source)) | {
+            "READY_LOCATOR"}
+
+    def capture(self, page_class, url=None, name=None, ready=None):
+        """Save a page as a snapshot for page_class: url once ready() returns, or the current page if url is None"""
+        if url is not None:
+            self.driver.get(url)
+        if ready is not None:
+            ready()
+        html = self.driver.execute_script(SNAPSHOT_SCRIPT)
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_dir / f"{name or page_class.__name__}.html"
+        path.write_text(html, encoding="utf-8")
+        logger.info(f"Captured {page_class.__name__} snapshot: {path}")
+        return path
+
+    def snapshots_for(self, page_class):
+        """Get every snapshot of a page class (one file per captured state); BasePage is on every page"""
+        pattern = "*.html" if page_class.__name__ == "BasePage" else f"{page_class.__name__}*.html"
+        return sorted(self.snapshot_dir.glob(pattern))
+
+    def validate(self, page_class):
+        """Check each locator of page_class in all of its snapshots"""
+        snapshots = self.snapshots_for(page_class)
+        if not snapshots:
+            logger.warning(f"No snapshots for {page_class.__name__} in {self.snapshot_dir}; run with --capture")
+            return None
+        locators = self.collect_locators(page_class)
+        probes = {name: [] for name in locators}
+        for snapshot in snapshots:
+            self.driver.get(snapshot.resolve().as_uri())
+            for name, (by, value) in locators.items():
+                probes[name].append(self.driver.execute_script(PROBE_SCRIPT, by, value, self.repeat))
+        collections = self.collection_locators(page_class)
+        return {name: self._verdict(name, locators[name], probes[name], name in collections) for name in locators}
+
+    def _verdict(self, name, locator, probes, collection):
+        result = {'locator': list(locator), 'problems': []}
+        errors = [probe['error'] for probe in probes if 'error' in probe]
+        if errors:
+            result['problems'].append(f"invalid locator: {errors[0]}")
+            return result
+        counts = [probe['count'] for probe in probes]
+        result['matches'] = counts
+        result['cost_us'] = round(statistics.median(probe['cost_us'] for probe in probes), 2)
+        # Alerts and error messages appear only in some states; those states have their own
+        # <Page>_<state>.html snapshots, so a locator no snapshot matches is dead or broken
+        if max(counts) == 0:
+            result['problems'].append("matches nothing in any snapshot")
+        elif not collection and max(counts) > 1:
+            result['problems'].append(f"matches {max(counts)} elements, first one is used")
+        first = next((probe['first'] for probe in probes if probe['first']), None)
+        result['problems'].extend(self._element_problems(name, first))
+        suggestion = self._suggestion(probes, result.get('cost_us'))
+        if suggestion:
+            result['suggestion'] = suggestion
+        return result
+
+    def _element_problems(self, name, element):
+        if element is None:
+            return []
+        for suffix, (tags, element_type) in self.EXPECTED_ELEMENTS.items():
+            if name.endswith(suffix):
+                if element['tag'] not in tags or (element_type and element['type'] != element_type):
+                    kind = element['tag'] + (f"[type={element['type']}]" if element['type'] else "")
+                    return [f"matches a {kind}, expected {suffix.strip('_').lower()}"]
+                break
+        return []
+
+    def _suggestion(self, probes, cost_us):
+        # Only selectors that found the same elements in every snapshot are equivalent
+        per_snapshot = [{(c['by'], c['value']): c['cost_us'] for c in probe['candidates']}
+                        for probe in probes if probe['count']]
+        if not per_snapshot or not cost_us:
+            return None
+        common = set.intersection(*(set(candidates) for candidates in per_snapshot))
+        if not common:
+            return None
+        costs = {key: statistics.median(candidates[key] for candidates in per_snapshot) for key in common}
+        best = min(costs, key=costs.get)
+        if costs[best] * self.MIN_SPEEDUP > cost_us:
+            return None
+        return {'locator': list(best), 'cost_us': round(costs[best], 2), 'speedup': round(cost_us / costs[best], 1)}
+
+    @staticmethod
+    def strategy_costs(results):
+        """Get the median lookup cost per strategy across validated locators"""
+        by_strategy = {}
+        for page in results.values():
+            for result in page.values():
+                if 'cost_us' in result:
+                    by_strategy.setdefault(result['locator'][0], []).append(result['cost_us'])
+        return {strategy: {'locators': len(costs), 'median_us': round(statistics.median(costs), 2)}
+                for strategy, costs in sorted(by_strategy.items())}
+
+
+def page_classes():
+    """Get the page object classes, keyed by name"""
+    from tests.pages.base_page import BasePage
+    from tests.pages.home_page import HomePage
+    from tests.pages.login_page import LoginPage
+    from tests.pages.product_page import ProductPage
+    from tests.pages.cart_page import CartPage
+    from tests.pages.checkout_page import CheckoutPage
+    return {page.__name__: page for page in (BasePage, HomePage, LoginPage, ProductPage, CartPage, CheckoutPage)}
+
+
+def capture_snapshots(validator, config, product_path):
+    """Capture each page in every state its locators target: alerts, the empty cart and each checkout step"""
+    from utils.wait_utils import WaitUtils
+    pages = page_classes()
+    driver = validator.driver
+    wait_utils = WaitUtils(driver, config.get_explicit_wait())
+    home, login, product, cart, checkout = (pages[name](driver, wait_utils, None) for name in
+                                            ("HomePage", "LoginPage", "ProductPage", "CartPage", "CheckoutPage"))
+    base_url = config.get_base_url().rstrip('/')
+    valid, invalid = config.get_valid_credentials(), config.get_invalid_credentials()
+
+    validator.capture(pages['HomePage'], base_url + '/', ready=home.wait_until_ready)
+
+    login_url = base_url + '/index.php?route=account/login'
+    validator.capture(pages['LoginPage'], login_url, ready=login.wait_until_ready)
+    login.login(invalid['username'], invalid['password'])
+    validator.capture(pages['LoginPage'], name="LoginPage_error")
+    # A password reset request lands back on the login page with the success alert
+    driver.get(base_url + '/index.php?route=account/forgotten')
+    driver.find_element(By.ID, "input-email").send_keys(valid['username'])
+    driver.find_element(By.CSS_SELECTOR, "#content form [type='submit']").click()
+    validator.capture(pages['LoginPage'], name="LoginPage_success",
+                      ready=lambda: wait_utils.wait_for_element_visible(pages['LoginPage'].SUCCESS_MESSAGE))
+    driver.get(login_url)
+    login.login(valid['username'], valid['password'])
+    validator.capture(pages['LoginPage'], name="LoginPage_account")
+    login.logout()
+
+    product_url = base_url + product_path
+    validator.capture(pages['ProductPage'], product_url, ready=product.wait_until_ready)
+    product.click_main_image()
+    validator.capture(pages['ProductPage'], name="ProductPage_zoom",
+                      ready=lambda: wait_utils.wait_for_element_visible(pages['ProductPage'].ZOOM_IMAGE))
+    driver.get(product_url)
+    product.write_review("Snapshot", "too short")
+    validator.capture(pages['ProductPage'], name="ProductPage_review_error", ready=product.get_review_outcome)
+    driver.get(product_url)
+    product.add_to_cart()
+    validator.capture(pages['ProductPage'], name="ProductPage_added",
+                      ready=lambda: wait_utils.wait_for_element_visible(pages['ProductPage'].REVIEW_SUCCESS_MESSAGE))
+
+    validator.capture(pages['HomePage'], base_url + '/', name="HomePage_cart", ready=home.wait_until_ready)
+
+    cart_url = base_url + '/index.php?route=checkout/cart'
+    validator.capture(pages['CartPage'], cart_url, ready=cart.wait_until_ready)
+    cart.update_quantity(0, 2)
+    validator.capture(pages['CartPage'], name="CartPage_updated",
+                      ready=lambda: wait_utils.wait_for_element_visible(pages['CartPage'].COUPON_SUCCESS_MESSAGE))
+    cart.apply_coupon_code("SNAPSHOT")
+    validator.capture(pages['CartPage'], name="CartPage_coupon_error", ready=cart.get_coupon_outcome)
+
+    # The checkout steps load over AJAX after the page itself, so each state waits for its step
+    def billing_form_loaded():
+        checkout.wait_until_ready()
+        wait_utils.wait_for_network_idle()
+        wait_utils.wait_for_element_visible(pages['CheckoutPage'].FIRST_NAME_INPUT)
+    validator.capture(pages['CheckoutPage'], base_url + '/index.php?route=checkout/checkout',
+                      ready=billing_form_loaded)
+    checkout.click_continue()
+    validator.capture(pages['CheckoutPage'], name="CheckoutPage_errors",
+                      ready=lambda: wait_utils.wait_for_element_visible(pages['CheckoutPage'].ERROR_MESSAGES))
+    checkout.fill_billing_details({'first_name': "Snap", 'last_name': "Shot", 'address_1': "1 Test Street",
+                                   'city': "Test City", 'postcode': "12345", 'country': "United States",
+                                   'region': "California"})
+    checkout.fill_account_details({'email': "snapshot@example.com", 'telephone': "1234567890"})
+    checkout.click_continue()
+    checkout.check_same_as_billing()
+    checkout.click_continue_shipping()
+    checkout.select_shipping_method()
+    checkout.click_continue_shipping_method()
+    checkout.select_payment_method()
+    checkout.accept_terms_and_conditions()
+    checkout.click_continue_payment_method()
+    validator.capture(pages['CheckoutPage'], name="CheckoutPage_confirm",
+                      ready=lambda: wait_utils.wait_for_element_visible(pages['CheckoutPage'].CONFIRM_ORDER_BUTTON))
+    checkout.confirm_order()
+    validator.capture(pages['CheckoutPage'], name="CheckoutPage_success", ready=checkout.get_order_confirmation)
+
+    # The order emptied the cart
+    validator.capture(pages['CartPage'], cart_url, name="CartPage_empty",
+                      ready=lambda: wait_utils.wait_for_element_visible(pages['CartPage'].EMPTY_CART_MESSAGE))
+
+
+def main():
+    """Validate locators offline, or capture fresh snapshots"""
+    config = ConfigReader()
+    parser = argparse.ArgumentParser(description="Validate page object locators against HTML snapshots")
+    parser.add_argument("--capture", action="store_true", help="Capture snapshots from the live site first")
+    parser.add_argument("--snapshots", default=config.get_snapshot_dir(), help="Snapshot directory")
+    parser.add_argument("--pages", nargs="+", help="Page classes to validate (default: all)")
+    parser.add_argument("--product-path", default="/index.php?route=product/product&product_id=40",
+                        help="Product page captured for ProductPage")
+    parser.add_argument("--repeat", type=int, default=200, help="Lookups per timing")
+    parser.add_argument("--browser", default=config.get_browser(), help="Browser to use")
+    args = parser.parse_args()
+
+    # Snapshots must come from the live site; without any there is nothing to check locators against
+    if not args.capture and not any(Path(args.snapshots).glob("*.html")):
+        print(f"⏭ No snapshots in {args.snapshots}; locator validation skipped (run with --capture)")
+        sys.exit(0)
+
+    manager = DriverManager(args.browser, headless=True)
+    validator = LocatorValidator(manager.get_driver(), args.snapshots, args.repeat)
+    try:
+        if args.capture:
+            capture_snapshots(validator, config, args.product_path)
+        pages = page_classes()
+        results = {}
+        skipped = []
+        for name in args.pages or pages:
+            page_result = validator.validate(pages[name])
+            if page_result is None:
+                skipped.append(name)
+            else:
+                results[name] = page_result
+    finally:
+        manager.quit_driver()
+
+    problems = 0
+    print("🔎 Locator validation")
+    print("=" * 40)
+    for page in skipped:
+        print(f"⏭ {page}: no snapshots in {args.snapshots}, skipped (run with --capture)")
+    for page, page_result in results.items():
+        for name, result in page_result.items():
+            locator = f"{result['locator'][0]}={result['locator'][1]}"
+            for problem in result['problems']:
+                problems += 1
+                print(f"❌ {page}.{name} ({locator}): {problem}")
+            if 'suggestion' in result:
+                suggestion = result['suggestion']
+                print(f"💡 {page}.{name}: {suggestion['locator'][0]}={suggestion['locator'][1]} "
+                      f"is {suggestion['speedup']}x cheaper than {locator}")
+    print("\nStrategy            Locators   Median lookup (µs)")
+    costs = LocatorValidator.strategy_costs(results)
+    for strategy, stats in costs.items():
+        print(f"{strategy:<18} {stats['locators']:>9}   {stats['median_us']:>10.2f}")
+    write_worker_report(config.get_report_path(), "locator_validation",
+                        {'problems': problems, 'strategy_costs': costs, 'pages': results,
+                         'skipped_pages': skipped})
+    print(f"\n{problems} problem(s) in {sum(len(page) for page in results.values())} locators")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
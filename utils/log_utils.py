@@ -0,0 +1,181 @@
+"""
+Logging setup: queue-backed structured sinks per xdist worker, merged into one log after the run
+"""
+import collections
+import json
+import queue
+import sys
+import threading
+import traceback
+from pathlib import Path
+from loguru import logger
+
+from utils.report_utils import get_worker_id
+
+
+class QueueSink:
+    """loguru sink that only queues the record; a background thread formats and writes it"""
+
+    # Callers pay for building the record and one queue put; string formatting, JSON encoding and
+    # file I/O happen on the writer thread. loguru's own enqueue=True pickles every record through a
+    # multiprocessing pipe, which is slower than writing synchronously for a single process.
+
+    _sinks = []
+
+    def __init__(self, stream, serialize=False, close=False):
+        self.stream = stream
+        self.serialize = serialize
+        self.close = close
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        QueueSink._sinks.append(self)
+
+    def write(self, message):
+        """Called by loguru for every record that passes the sink's level"""
+        self._queue.put(message.record)
+
+    def replay(self, records):
+        """Queue records captured elsewhere (e.g. a failed test's buffer) for writing"""
+        for record in records:
+            self._queue.put(record)
+
+    def drain(self):
+        """Block until every record queued so far has been written"""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def stop(self):
+        """Write what is queued and stop the writer (loguru calls this on logger.remove())"""
+        self._queue.put(None)
+        self._thread.join()
+        if self.close:
+            self.stream.close()
+        if self in QueueSink._sinks:
+            QueueSink._sinks.remove(self)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                self.stream.flush()
+                item.set()
+                continue
+            entry = to_entry(item)
+            self.stream.write(json.dumps(entry, default=str) + "\n" if self.serialize else format_entry(entry))
+
+
+class RingBufferSink:
+    """loguru sink that keeps only the current test's last records in memory"""
+
+    def __init__(self, capacity=2000, target=None):
+        self.capacity = capacity
+        self.target = target
+        self.test_id = None
+        self.total = 0
+        self._records = collections.deque(maxlen=capacity)
+
+    @property
+    def active(self):
+        """Check if a test is being buffered"""
+        return self.test_id is not None
+
+    def write(self, message):
+        """Called by loguru for every record that passes the sink's level"""
+        if self.test_id is not None:
+            self._records.append(message.record)
+            self.total += 1
+
+    def begin(self, test_id):
+        """Start buffering a test's records, dropping the previous test's"""
+        self._records.clear()
+        self.total = 0
+        self.test_id = test_id
+
+    def end(self, keep):
+        """Stop buffering; when keep, write the buffer to the target sink and return it as text"""
+        records, dropped = list(self._records), self.total - len(self._records)
+        self._records.clear()
+        self.test_id = None
+        if not keep:
+            return None
+        if self.target is not None:
+            self.target.replay(records)
+        header = f"... {dropped} earlier records dropped (buffer holds {self.capacity})\n" if dropped else ""
+        return header + "".join(format_entry(to_entry(record)) for record in records)
+
+
+def to_entry(record):
+    """Get the structured form of a loguru record"""
+    exception = record['exception']
+    return {
+        'time': record['time'].isoformat(),
+        'timestamp': record['time'].timestamp(),
+        'level': record['level'].name,
+        'worker': record['extra'].get('worker', get_worker_id()),
+        'name': record['name'],
+        'function': record['function'],
+        'line': record['line'],
+        'message': record['message'],
+        'extra': {key: value for key, value in record['extra'].items() if key != 'worker'},
+        'exception': "".join(traceback.format_exception(exception.type, exception.value, exception.traceback))
+        if exception else None,
+    }
+
+
+def format_entry(entry):
+    """Format a structured entry as a text log line"""
+    line = (f"{entry['time'][:23].replace('T', ' ')} | {entry['level']: <8} | {entry['worker']: <8} | "
+            f"{entry['name']}:{entry['function']}:{entry['line']} - {entry['message']}\n")
+    return line + (entry['exception'] or "")
+
+
+def configure_logging(log_dir, level="DEBUG", console_level="INFO", test_buffer_size=0):
+    """Replace the default sinks with a queued console sink and this worker's own JSON-lines file"""
+    # One file per worker means no two processes write or rotate the same file. With a test buffer,
+    # records logged during a test go to memory instead and reach the file only if the test fails;
+    # the returned RingBufferSink (or None) is driven by the pytest hooks
+    worker = get_worker_id()
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    logger.remove()
+    logger.configure(extra={'worker': worker})
+    logger.add(QueueSink(sys.stderr), level=console_level, format="{message}")
+    file = open(log_dir / f"test_{worker}.jsonl", 'w', encoding='utf-8')
+    file_sink = QueueSink(file, serialize=True, close=True)
+    if not test_buffer_size:
+        logger.add(file_sink, level=level, format="{message}")
+        return None
+    test_buffer = RingBufferSink(test_buffer_size, target=file_sink)
+    logger.add(file_sink, level=level, format="{message}", filter=lambda record: not test_buffer.active)
+    logger.add(test_buffer, level=level, format="{message}")
+    return test_buffer
+
+
+def flush_logs():
+    """Wait until every queued sink has written its records"""
+    for sink in list(QueueSink._sinks):
+        sink.drain()
+
+
+def merge_worker_logs(log_dir, output_dir):
+    """Merge every worker's JSON-lines log, in time order, into test.log and test.jsonl"""
+    try:
+        entries = []
+        for path in sorted(Path(log_dir).glob("test_*.jsonl")):
+            with open(path, 'r', encoding='utf-8') as file:
+                entries.extend(json.loads(line) for line in file if line.strip())
+        entries.sort(key=lambda entry: entry['timestamp'])
+        output_dir = Path(output_dir)
+        with open(output_dir / "test.log", 'w', encoding='utf-8') as text_file, \
+                open(output_dir / "test.jsonl", 'w', encoding='utf-8') as json_file:
+            for entry in entries:
+                text_file.write(format_entry(entry))
+                json_file.write(json.dumps(entry) + "\n")
+        return len(entries)
+    except Exception as e:
+        logger.error("Failed to merge worker logs: {error}", error=str(e))
+        return 0
@@ -0,0 +1,27 @@
+"""
+Report utilities for per-worker run summaries
+"""
+import json
+import os
+from pathlib import Path
+from loguru import logger
+
+
+def get_worker_id():
+    """Get the xdist worker id ("master" when not running under xdist)"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def write_worker_report(report_dir, name, data):
+    """Write a JSON summary for the current worker and return its path"""
+    try:
+        report_dir = Path(report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        filepath = report_dir / f"{name}_{get_worker_id()}.json"
+        with open(filepath, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=4)
+        logger.debug(f"Worker report written: {filepath}")
+        return filepath
+    except Exception as e:
+        logger.error(f"Failed to write worker report {name}: {str(e)}")
+        return None
@@ -0,0 +1,122 @@
+"""
+Resource blocking for images, fonts and third-party requests
+"""
+import json
+from loguru import logger
+
+
+class ResourceBlocker:
+    """Blocks page resources no assertion needs and reports what was blocked"""
+
+    # URL patterns for resource types (CDP blocks by URL, not by type)
+    RESOURCE_TYPE_PATTERNS = {
+        "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"],
+        "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+        "media": ["*.mp4*", "*.webm*", "*.ogg*", "*.mp3*"],
+        "stylesheet": ["*.css*"],
+    }
+
+    # Firefox has no URL blocking API; resource types map to prefs instead
+    FIREFOX_PREFS = {
+        "image": {"permissions.default.image": 2},
+        "font": {"gfx.downloadable_fonts.enabled": False},
+        "media": {"media.autoplay.default": 5},
+    }
+
+    CHROMIUM_BROWSERS = ("chrome", "edge")
+
+    _default = None
+
+    def __init__(self, enabled=False, resource_types=None, url_patterns=None):
+        self.enabled = enabled
+        self.resource_types = resource_types or []
+        self.url_patterns = url_patterns or []
+
+    @classmethod
+    def from_config(cls, config):
+        """Create blocker from [PERFORMANCE] settings"""
+        return cls(
+            enabled=config.is_resource_blocking_enabled(),
+            resource_types=config.get_blocked_resource_types(),
+            url_patterns=config.get_blocked_url_patterns()
+        )
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide blocker built from config.ini"""
+        if cls._default is None:
+            from utils.config_reader import ConfigReader
+            cls._default = cls.from_config(ConfigReader())
+        return cls._default
+
+    def get_blocked_patterns(self):
+        """Get every URL pattern to block"""
+        patterns = list(self.url_patterns)
+        for resource_type in self.resource_types:
+            patterns.extend(self.RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        return patterns
+
+    # Vendor prefix of the logging preferences capability per Chromium browser
+    LOGGING_PREFS_CAPABILITIES = {"chrome": "goog:loggingPrefs", "edge": "ms:loggingPrefs"}
+
+    def configure_chromium_options(self, options, browser="chrome"):
+        """Enable the performance log used to count blocked requests"""
+        if self.enabled:
+            options.set_capability(self.LOGGING_PREFS_CAPABILITIES[browser], {"performance": "ALL"})
+
+    def configure_firefox_options(self, options):
+        """Apply blocking prefs for Firefox"""
+        if not self.enabled:
+            return
+        for resource_type in self.resource_types:
+            for name, value in self.FIREFOX_PREFS.get(resource_type, {}).items():
+                options.set_preference(name, value)
+        if self.url_patterns:
+            logger.info("Firefox cannot block URL patterns; only resource types are blocked")
+
+    def enable(self, driver, browser):
+        """Start blocking on the current tab"""
+        if self.enabled and browser in self.CHROMIUM_BROWSERS:
+            self._set_blocked_urls(driver, self.get_blocked_patterns())
+
+    def disable(self, driver, browser):
+        """Stop blocking on the current tab (for tests that need every resource)"""
+        if not self.enabled:
+            return
+        if browser in self.CHROMIUM_BROWSERS:
+            self._set_blocked_urls(driver, [])
+        else:
+            logger.warning(f"Resource blocking cannot be lifted at runtime for {browser}")
+
+    def collect(self, driver, browser):
+        """Drain the performance log and summarise blocked and loaded requests"""
+        stats = {'blocked_requests': 0, 'blocked_by_type': {}, 'loaded_requests': 0, 'loaded_bytes': 0}
+        if not self.enabled or browser not in self.CHROMIUM_BROWSERS:
+            return stats
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"Performance log unavailable: {str(e)}")
+            return stats
+
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message.get("method") == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                resource_type = params.get("type", "Other")
+                stats['blocked_requests'] += 1
+                stats['blocked_by_type'][resource_type] = stats['blocked_by_type'].get(resource_type, 0) + 1
+            elif message.get("method") == "Network.loadingFinished":
+                stats['loaded_requests'] += 1
+                stats['loaded_bytes'] += int(params.get("encodedDataLength", 0))
+        return stats
+
+    @staticmethod
+    def _set_blocked_urls(driver, patterns):
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            logger.debug(f"Blocked URL patterns set: {len(patterns)}")
+        except Exception as e:
+            logger.error(f"Failed to set blocked URLs: {str(e)}")
+            raise
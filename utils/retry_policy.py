@@ -0,0 +1,112 @@
+"""
+Retry policy with exponential backoff, jitter, an overall deadline and per-exception rules
+"""
+import random
+import threading
+import time
+from selenium.common import exceptions as selenium_exceptions
+from loguru import logger
+
+
+class RetryPolicy:
+    """Retries a single step on transient exceptions instead of rerunning the whole test"""
+
+    # Exception type -> attempts allowed for it; anything else is raised immediately
+    DEFAULT_RULES = {
+        selenium_exceptions.StaleElementReferenceException: 3,
+        selenium_exceptions.ElementClickInterceptedException: 3,
+        selenium_exceptions.ElementNotInteractableException: 2,
+    }
+
+    _default = None
+
+    def __init__(self, base_delay=0.1, max_delay=1.0, multiplier=2.0, jitter=0.5, deadline=10.0, rules=None):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.rules = dict(self.DEFAULT_RULES if rules is None else rules)
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.by_exception = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Create policy from [RETRY] settings"""
+        rules = {}
+        for name, attempts in config.get_retry_rules().items():
+            exception = getattr(selenium_exceptions, name, None)
+            if exception is None:
+                logger.warning(f"Unknown exception in [RETRY] rules: {name}")
+                continue
+            rules[exception] = attempts
+        return cls(
+            base_delay=config.get_retry_base_delay(),
+            max_delay=config.get_retry_max_delay(),
+            multiplier=config.get_retry_multiplier(),
+            jitter=config.get_retry_jitter(),
+            deadline=config.get_retry_deadline(),
+            rules=rules or None
+        )
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide retry policy built from config.ini"""
+        if cls._default is None:
+            from utils.config_reader import ConfigReader
+            cls._default = cls.from_config(ConfigReader())
+        return cls._default
+
+    def run(self, action, description="step"):
+        """Call action until it succeeds, a rule is exhausted or the deadline passes"""
+        start = time.perf_counter()
+        attempt = 1
+        while True:
+            try:
+                result = action()
+            except Exception as e:
+                allowed = self._attempts_for(e)
+                if allowed is None:
+                    raise
+                delay = self.backoff(attempt)
+                if attempt >= allowed or time.perf_counter() - start + delay > self.deadline:
+                    with self._lock:
+                        self.exhausted += 1
+                    logger.warning(f"Giving up on {description} after {attempt} attempt(s): {type(e).__name__}")
+                    raise
+                with self._lock:
+                    self.retries += 1
+                    self.by_exception[type(e).__name__] = self.by_exception.get(type(e).__name__, 0) + 1
+                logger.debug(f"Retrying {description} in {delay:.2f}s after {type(e).__name__} "
+                             f"(attempt {attempt}/{allowed})")
+                time.sleep(delay)
+                attempt += 1
+                continue
+            if attempt > 1:
+                with self._lock:
+                    self.recovered += 1
+                logger.info(f"Recovered {description} on attempt {attempt}")
+            return result
+
+    def backoff(self, attempt):
+        """Get the delay before the next attempt, with jitter"""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def stats(self):
+        """Get retry counts for the report"""
+        return {
+            'retries': self.retries,
+            'recovered_steps': self.recovered,
+            'exhausted_steps': self.exhausted,
+            'retries_by_exception': self.by_exception,
+        }
+
+    def _attempts_for(self, error):
+        for exception, attempts in self.rules.items():
+            if isinstance(error, exception):
+                return attempts
+        return None
@@ -0,0 +1,162 @@
+"""
+Logged-in session cookies shared by all tests and xdist workers through a file-locked cache
+"""
+import json
+import re
+import threading
+import time
+from pathlib import Path
+import requests
+from filelock import FileLock
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+
+
+class SessionCache:
+    """Logs each account in once over HTTP and hands its cookies to every browser that needs them"""
+
+    LOGIN_ROUTE = "index.php?route=account/login"
+    ACCOUNT_ROUTE = "index.php?route=account/account"
+
+    _default = None
+
+    def __init__(self, base_url, enabled=True, store_path=".session_cache/sessions.json", revalidate_after=60,
+                 timeout=10):
+        self.base_url = base_url.rstrip('/') + '/'
+        self.enabled = enabled
+        self.store_path = Path(store_path)
+        self.revalidate_after = revalidate_after
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._http = requests.Session()
+        self._validated = {}
+        self.logins = 0
+        self.hits = 0
+
+    @classmethod
+    def from_config(cls, config):
+        """Create the cache from [SESSION_CACHE] settings"""
+        return cls(
+            base_url=config.get_base_url(),
+            enabled=config.is_session_cache_enabled(),
+            store_path=config.get_session_cache_store(),
+            revalidate_after=config.get_session_revalidate_after()
+        )
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide session cache built from config.ini"""
+        if cls._default is None:
+            from utils.config_reader import ConfigReader
+            cls._default = cls.from_config(ConfigReader())
+        return cls._default
+
+    def get_cookies(self, username, password):
+        """Get valid session cookies for an account, logging in only if the cached session expired"""
+        if not self.enabled:
+            return self._login(username, password)
+        with self._lock:
+            cached = self._validated.get(username)
+            # Recently checked by this process: no request at all
+            if cached and time.time() - cached[0] < self.revalidate_after:
+                self.hits += 1
+                return cached[1]
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            # Held across the login so concurrent workers wait for one login instead of each doing it
+            with FileLock(str(self.store_path) + ".lock"):
+                store = self._load()
+                cookies = store.get(username, {}).get('cookies')
+                if cookies and self.is_valid(cookies):
+                    self.hits += 1
+                else:
+                    cookies = self._login(username, password)
+                    store[username] = {'cookies': cookies, 'saved_at': time.time()}
+                    self._save(store)
+            self._validated[username] = (time.time(), cookies)
+            return cookies
+
+    def is_valid(self, cookies):
+        """Check a session with one request: the account page redirects to login once it expires"""
+        try:
+            response = self._http.get(self.base_url + self.ACCOUNT_ROUTE, allow_redirects=False, timeout=self.timeout,
+                                      cookies={cookie['name']: cookie['value'] for cookie in cookies})
+            return response.status_code == 200
+        except requests.RequestException as e:
+            logger.warning(f"Could not validate cached session: {str(e)}")
+            return False
+
+    def invalidate(self, username):
+        """Forget that an account's session was recently validated, so the next use checks it with the site"""
+        with self._lock:
+            self._validated.pop(username, None)
+
+    def account_lock(self, username):
+        """Get the cross-worker lock for changing an account's server-side state, such as its cart"""
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', username)
+        return FileLock(str(self.store_path.parent / f"account_{safe_name}.lock"))
+
+    @staticmethod
+    def inject(driver, cookies):
+        """Set cookies before the first navigation where the browser allows it; returns False if it did not"""
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {'cookies': [
+                {**{key: value for key, value in cookie.items() if key != 'expiry'},
+                 **({'expires': cookie['expiry']} if cookie.get('expiry') else {})}
+                for cookie in cookies
+            ]})
+            return True
+        except (AttributeError, WebDriverException):
+            return False
+
+    @staticmethod
+    def add_to_page(driver, cookies):
+        """Add cookies through WebDriver (the browser must already be on the cookies' domain)"""
+        for cookie in cookies:
+            driver.add_cookie({key: value for key, value in cookie.items() if value is not None})
+
+    def stats(self):
+        """Get login and cache hit counts"""
+        return {'logins': self.logins, 'cache_hits': self.hits}
+
+    def _login(self, username, password):
+        try:
+            session = requests.Session()
+            response = session.post(self.base_url + self.LOGIN_ROUTE, data={'email': username, 'password': password},
+                                    allow_redirects=False, timeout=self.timeout)
+            # A successful login redirects to the account page; a failed one re-renders the form
+            if response.status_code not in (301, 302) or "account/account" not in response.headers.get('Location', ''):
+                raise ValueError(f"login for {username} was rejected (HTTP {response.status_code})")
+            self.logins += 1
+            logger.info(f"Logged in {username} over HTTP for the session cache")
+            return [self.to_selenium_cookie(cookie) for cookie in session.cookies]
+        except Exception as e:
+            logger.error(f"Failed to log in {username}: {str(e)}")
+            raise
+
+    @staticmethod
+    def to_selenium_cookie(cookie):
+        """Convert a requests cookie to the WebDriver cookie format"""
+        return {
+            'name': cookie.name,
+            'value': cookie.value,
+            'domain': cookie.domain,
+            'path': cookie.path or '/',
+            'secure': bool(cookie.secure),
+            'httpOnly': cookie.has_nonstandard_attr('HttpOnly'),
+            'expiry': cookie.expires,
+        }
+
+    def _load(self):
+        if not self.store_path.exists():
+            return {}
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session cache {self.store_path}: {str(e)}")
+            return {}
+
+    def _save(self, store):
+        with open(self.store_path, 'w', encoding='utf-8') as file:
+            json.dump(store, file, indent=1)
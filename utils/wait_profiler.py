@@ -0,0 +1,103 @@
+"""
+Per-test profile of time spent waiting versus acting and navigating
+"""
+import functools
+import heapq
+import time
+from contextlib import contextmanager
+
+
+class WaitProfiler:
+    """Splits each test's wall time into waits, page actions, navigation and everything else"""
+
+    CATEGORIES = ("wait", "action", "navigation")
+
+    _default = None
+
+    def __init__(self, slowest_per_test=5):
+        self.slowest_per_test = slowest_per_test
+        self.current = None
+        self._depth = 0
+        self.tests = {}
+
+    @classmethod
+    def default(cls):
+        """Get the process-wide profiler"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def begin(self, test_id):
+        """Start profiling a test"""
+        self.current = {'test': test_id, 'start': time.perf_counter(), 'waits': [],
+                        **{f"{category}_s": 0.0 for category in self.CATEGORIES}}
+        self._depth = 0
+
+    def end(self):
+        """Stop profiling and return the test's profile"""
+        current, self.current = self.current, None
+        if current is None:
+            return None
+        duration = time.perf_counter() - current['start']
+        profile = {
+            'duration_s': round(duration, 3),
+            **{f"{category}_s": round(current[f"{category}_s"], 3) for category in self.CATEGORIES},
+            'waiting_pct': round(100 * current['wait_s'] / duration, 1) if duration else 0.0,
+            'waits': len(current['waits']),
+            'timeouts': sum(1 for wait in current['waits'] if not wait['success']),
+            'slowest_waits': heapq.nlargest(self.slowest_per_test, current['waits'], key=lambda w: w['seconds']),
+        }
+        profile['other_s'] = round(max(0.0, duration - sum(profile[f"{c}_s"] for c in self.CATEGORIES)), 3)
+        self.tests[current['test']] = profile
+        return profile
+
+    def on_wait(self, event):
+        """WaitUtils listener: count the wait against the current test"""
+        if self.current is None:
+            return
+        self.current['wait_s'] += event['seconds']
+        self.current['waits'].append({'test': self.current['test'], 'kind': event['kind'],
+                                      'locator': str(event['locator']), 'seconds': round(event['seconds'], 3),
+                                      'success': event['success']})
+
+    @contextmanager
+    def measure(self, category):
+        """Time a page action or navigation, excluding the waits it runs"""
+        if self.current is None or self._depth:
+            # Nested calls (e.g. click -> find) are already covered by the outer one
+            yield
+            return
+        self._depth += 1
+        start = time.perf_counter()
+        wait_before = self.current['wait_s']
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self.current is not None:
+                inner_waits = self.current['wait_s'] - wait_before
+                self.current[f"{category}_s"] += max(0.0, time.perf_counter() - start - inner_waits)
+
+    def report(self, top_n=20):
+        """Get per-test profiles and the slowest waits of the run"""
+        return {
+            'top_slow_waits': self.top_slow_waits(self.tests.values(), top_n),
+            'tests': self.tests,
+        }
+
+    @staticmethod
+    def top_slow_waits(profiles, top_n=20):
+        """Get the slowest waits across test profiles"""
+        waits = [wait for profile in profiles for wait in profile['slowest_waits']]
+        return heapq.nlargest(top_n, waits, key=lambda wait: wait['seconds'])
+
+
+def profiled(category):
+    """Decorator for page object methods whose time counts as an action or navigation"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with WaitProfiler.default().measure(category):
+                return method(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -4,25 +4,241 @@ Wait utilities for handling dynamic elements
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, WebDriverException,
+                                        StaleElementReferenceException)
 from loguru import logger
 import time
 
+from utils.retry_policy import RetryPolicy
+
+
+# Resolves once any candidate's first matching element meets its condition, re-checking on every
+# DOM mutation (and on a short in-page timer for CSS transitions) instead of polling over the wire
+OBSERVER_SCRIPT = """
+var candidates = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var finished = false, observer = null, interval = null, timer = null;
+
+function find(by, value) {
+    switch (by) {
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(value, document, null,
+                                               XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+    }
+    return null;
+}
+
+function visible(el) {
+    if (!el || !el.isConnected) return false;
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') return false;
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function check(candidate) {
+    var el = find(candidate.by, candidate.value), text = candidate.text;
+    switch (candidate.condition) {
+        case 'present': return el ? {element: el} : null;
+        case 'visible': return visible(el) ? {element: el} : null;
+        case 'clickable': return visible(el) && !el.disabled ? {element: el} : null;
+        case 'text': return el && (el.innerText || el.textContent || '').indexOf(text) !== -1 ? {element: el} : null;
+        case 'gone': return visible(el) ? null : {element: null};
+    }
+    return null;
+}
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+}
+
+function evaluate() {
+    try {
+        for (var i = 0; i < candidates.length; i++) {
+            var match = check(candidates[i]);
+            if (match) return finish({matched: true, index: i, element: match.element});
+        }
+    } catch (e) {
+        finish({matched: false, error: String(e)});
+    }
+}
+
+evaluate();
+if (!finished) {
+    observer = new MutationObserver(evaluate);
+    observer.observe(document.documentElement || document,
+                     {childList: true, subtree: true, attributes: true, characterData: true});
+    interval = setInterval(evaluate, 100);
+    timer = setTimeout(function () { finish({matched: false}); }, timeoutMs);
+}
+"""
+
+# Counts in-flight XHR/fetch requests on the page; installed on every new document via CDP where
+# available, otherwise on first use by the network-idle wait
+NETWORK_TRACKER_SCRIPT = """
+(function () {
+    if (window.__networkTracker) return;
+    var tracker = window.__networkTracker = {inflight: 0, lastSettled: 0};
+    function started() { tracker.inflight++; }
+    function settled() { tracker.inflight = Math.max(0, tracker.inflight - 1); tracker.lastSettled = Date.now(); }
+
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', settled);
+        try {
+            return send.apply(this, arguments);
+        } catch (e) {
+            settled();
+            throw e;
+        }
+    };
+
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            started();
+            return fetch.apply(window, arguments).finally(settled);
+        };
+    }
+})();
+"""
+
+# Resolves once no tracked request (nor jQuery.active) has been in flight for the quiet window
+NETWORK_IDLE_SCRIPT = NETWORK_TRACKER_SCRIPT + """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var tracker = window.__networkTracker, deadline = Date.now() + timeoutMs, lastBusy = tracker.lastSettled;
+
+(function check() {
+    var now = Date.now();
+    var busy = tracker.inflight > 0 || (window.jQuery && window.jQuery.active > 0);
+    if (busy) {
+        lastBusy = now;
+    }
+    var quietSince = Math.max(lastBusy, tracker.lastSettled);
+    if (!busy && now - quietSince >= quietMs) {
+        done(true);
+    } else if (now >= deadline) {
+        done(false);
+    } else {
+        setTimeout(check, Math.min(25, quietMs || 25));
+    }
+})();
+"""
+
 
 class WaitUtils:
     """Utility class for handling various wait scenarios"""
     
-    def __init__(self, driver, timeout=20):
+    WAIT_MODES = ("poll", "event")
+    
+    # Conditions the observer script understands, and locator strategies it can evaluate in-page
+    OBSERVABLE_CONDITIONS = ("present", "visible", "clickable", "text", "gone")
+    OBSERVABLE_STRATEGIES = (By.CSS_SELECTOR, By.XPATH, By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME)
+    
+    def __init__(self, driver, timeout=20, mode="poll", network_quiet_ms=100, adaptive_timeouts=None):
+        if mode not in self.WAIT_MODES:
+            raise ValueError(f"Unsupported wait mode: {mode}")
         self.driver = driver
         self.timeout = timeout
+        self.mode = mode
+        self.network_quiet_ms = network_quiet_ms
+        self.adaptive_timeouts = adaptive_timeouts
         self.wait = WebDriverWait(driver, timeout)
+        self.listeners = []
+        self._script_timeout = None
+    
+    def add_listener(self, listener):
+        """Call listener(event) after every wait with kind, locator, seconds, success and mode"""
+        self.listeners.append(listener)
+    
+    def _timeout_for(self, kind, target, timeout):
+        """Get the timeout for a wait and its adaptive timeouts key (None unless the timeout is learned)"""
+        # An explicit timeout (probes, page objects' own learned timeouts) is always honoured as given
+        if timeout is not None or self.adaptive_timeouts is None or not self.adaptive_timeouts.enabled:
+            return (self.timeout if timeout is None else timeout), None
+        key = f"{kind}:{target[0]}={target[1]}" if isinstance(target, tuple) else f"{kind}:{target}"
+        return self.adaptive_timeouts.timeout_for(key, self.timeout), key
+    
+    def _learn(self, key, start, wait_time, success):
+        """Feed a learned-timeout wait's duration, or its timeout, back into the adaptive timeouts"""
+        if key is None:
+            return
+        if success:
+            self.adaptive_timeouts.record(key, time.perf_counter() - start, wait_time)
+        else:
+            self.adaptive_timeouts.record_timeout(key, wait_time)
+    
+    def _wait(self, kind, condition, locator=None, timeout=None, text=None, poll_frequency=0.5, key=None):
+        """Wait for a condition, observing the DOM in event mode and polling otherwise"""
+        wait_time = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        mode = "poll"
+        try:
+            if (self.mode == "event" and kind in self.OBSERVABLE_CONDITIONS
+                    and locator is not None and locator[0] in self.OBSERVABLE_STRATEGIES):
+                mode = "event"
+                observed, (_, element) = self._observe([(kind, locator, text)], wait_time)
+                if observed:
+                    self._notify(kind, locator, start, True, mode)
+                    self._learn(key, start, wait_time, True)
+                    return True if kind == "gone" else element
+                mode = "poll"
+            # Unobservable condition, or the page navigated away mid-observation
+            remaining = max(0, wait_time - (time.perf_counter() - start))
+            result = WebDriverWait(self.driver, remaining, poll_frequency=poll_frequency).until(condition)
+            self._notify(kind, locator, start, True, mode)
+            self._learn(key, start, wait_time, True)
+            return result
+        except TimeoutException:
+            self._notify(kind, locator, start, False, mode)
+            self._learn(key, start, wait_time, False)
+            raise
+    
+    def _observe(self, candidates, wait_time):
+        """Run the observer script on (kind, locator, text) candidates; returns (observed, (index, element))"""
+        self._ensure_script_timeout(wait_time)
+        locators = [locator for _, locator, _ in candidates]
+        try:
+            outcome = self.driver.execute_async_script(OBSERVER_SCRIPT, [
+                {'by': locator[0], 'value': locator[1], 'condition': kind, 'text': text or ""}
+                for kind, locator, text in candidates
+            ], int(wait_time * 1000))
+        except WebDriverException as e:
+            logger.debug(f"Observer wait for {locators} interrupted, polling instead: {str(e)}")
+            return False, (None, None)
+        if outcome.get("error"):
+            logger.debug(f"Observer wait for {locators} failed, polling instead: {outcome['error']}")
+            return False, (None, None)
+        if not outcome.get("matched"):
+            raise TimeoutException(f"No condition met for {locators} within {wait_time} seconds")
+        return True, (outcome["index"], outcome.get("element"))
+    
+    def _ensure_script_timeout(self, wait_time):
+        """Keep the session script timeout above the longest in-page wait"""
+        if self._script_timeout is None or self._script_timeout < wait_time + 5:
+            self._script_timeout = wait_time + 5
+            self.driver.set_script_timeout(self._script_timeout)
+    
+    def _notify(self, kind, locator, start, success, mode):
+        event = {'kind': kind, 'locator': locator, 'seconds': time.perf_counter() - start,
+                 'success': success, 'mode': mode}
+        for listener in self.listeners:
+            listener(event)
     
     def wait_for_element_visible(self, locator, timeout=None):
         """Wait for element to be visible"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            element = wait.until(EC.visibility_of_element_located(locator))
+            wait_time, key = self._timeout_for("visible", locator, timeout)
+            element = self._wait("visible", EC.visibility_of_element_located(locator), locator, wait_time, key=key)
             logger.debug(f"Element {locator} is visible")
             return element
         except TimeoutException:
@@ -32,9 +248,8 @@ class WaitUtils:
     def wait_for_element_clickable(self, locator, timeout=None):
         """Wait for element to be clickable"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            element = wait.until(EC.element_to_be_clickable(locator))
+            wait_time, key = self._timeout_for("clickable", locator, timeout)
+            element = self._wait("clickable", EC.element_to_be_clickable(locator), locator, wait_time, key=key)
             logger.debug(f"Element {locator} is clickable")
             return element
         except TimeoutException:
@@ -44,9 +259,8 @@ class WaitUtils:
     def wait_for_element_present(self, locator, timeout=None):
         """Wait for element to be present in DOM"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            element = wait.until(EC.presence_of_element_located(locator))
+            wait_time, key = self._timeout_for("present", locator, timeout)
+            element = self._wait("present", EC.presence_of_element_located(locator), locator, wait_time, key=key)
             logger.debug(f"Element {locator} is present")
             return element
         except TimeoutException:
@@ -56,9 +270,8 @@ class WaitUtils:
     def wait_for_text_to_be_present_in_element(self, locator, text, timeout=None):
         """Wait for specific text to be present in element"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            wait.until(EC.text_to_be_present_in_element(locator, text))
+            wait_time, key = self._timeout_for("text", locator, timeout)
+            self._wait("text", EC.text_to_be_present_in_element(locator, text), locator, wait_time, text=text, key=key)
             logger.debug(f"Text '{text}' found in element {locator}")
             return True
         except TimeoutException:
@@ -68,9 +281,8 @@ class WaitUtils:
     def wait_for_url_contains(self, url_fragment, timeout=None):
         """Wait for URL to contain specific text"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            wait.until(EC.url_contains(url_fragment))
+            wait_time, key = self._timeout_for("url", url_fragment, timeout)
+            self._wait("url", EC.url_contains(url_fragment), timeout=wait_time, key=key)
             logger.debug(f"URL contains '{url_fragment}'")
             return True
         except TimeoutException:
@@ -80,9 +292,8 @@ class WaitUtils:
     def wait_for_alert(self, timeout=None):
         """Wait for alert to be present"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            alert = wait.until(EC.alert_is_present())
+            wait_time = self.timeout if timeout is None else timeout
+            alert = self._wait("alert", EC.alert_is_present(), timeout=wait_time)
             logger.debug("Alert is present")
             return alert
         except TimeoutException:
@@ -92,20 +303,86 @@ class WaitUtils:
     def wait_for_element_to_disappear(self, locator, timeout=None):
         """Wait for element to disappear"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            wait.until(EC.invisibility_of_element_located(locator))
+            wait_time, key = self._timeout_for("gone", locator, timeout)
+            self._wait("gone", EC.invisibility_of_element_located(locator), locator, wait_time, key=key)
             logger.debug(f"Element {locator} has disappeared")
             return True
         except TimeoutException:
             logger.error(f"Element {locator} did not disappear within {wait_time} seconds")
             raise
     
+    def wait_for_any(self, conditions, timeout=None):
+        """Wait until one of several named conditions holds and return its name"""
+        # Each condition is a locator (fires when visible) or an expected condition callable
+        names = list(conditions)
+        outcomes = ",".join(f"{name}={conditions[name][1]}" if isinstance(conditions[name], tuple) else name
+                            for name in names)
+        wait_time, key = self._timeout_for("any", outcomes, timeout)
+        start = time.perf_counter()
+        mode = "poll"
+        try:
+            locators = [conditions[name] for name in names]
+            if self.mode == "event" and all(isinstance(locator, tuple) and locator[0] in self.OBSERVABLE_STRATEGIES
+                                            for locator in locators):
+                mode = "event"
+                observed, (index, _) = self._observe([("visible", locator, None) for locator in locators], wait_time)
+                if observed:
+                    self._notify("any", tuple(names), start, True, mode)
+                    self._learn(key, start, wait_time, True)
+                    logger.debug(f"Outcome '{names[index]}' fired")
+                    return names[index]
+                mode = "poll"
+            
+            checks = {name: EC.visibility_of_element_located(condition) if isinstance(condition, tuple) else condition
+                      for name, condition in conditions.items()}
+            
+            def first_fired(driver):
+                for name, check in checks.items():
+                    try:
+                        if check(driver):
+                            return name
+                    except WebDriverException:
+                        continue
+                return False
+            
+            remaining = max(0, wait_time - (time.perf_counter() - start))
+            name = WebDriverWait(self.driver, remaining).until(first_fired)
+            self._notify("any", tuple(names), start, True, mode)
+            self._learn(key, start, wait_time, True)
+            logger.debug(f"Outcome '{name}' fired")
+            return name
+        except TimeoutException:
+            self._notify("any", tuple(names), start, False, mode)
+            self._learn(key, start, wait_time, False)
+            logger.error(f"None of {names} happened within {wait_time} seconds")
+            raise
+    
+    def wait_for_network_idle(self, quiet_ms=None, timeout=None):
+        """Wait until no XHR/fetch request has been in flight for quiet_ms"""
+        wait_time = self.timeout if timeout is None else timeout
+        quiet_ms = self.network_quiet_ms if quiet_ms is None else quiet_ms
+        start = time.perf_counter()
+        self._ensure_script_timeout(wait_time)
+        try:
+            idle = self.driver.execute_async_script(NETWORK_IDLE_SCRIPT, quiet_ms, int(wait_time * 1000))
+        except WebDriverException as e:
+            # A response navigated the page; the new document's load is the settle point
+            logger.debug(f"Network idle wait interrupted by navigation: {str(e)}")
+            remaining = max(0, wait_time - (time.perf_counter() - start))
+            return self.wait_for_page_load(timeout=remaining)
+        self._notify("network_idle", None, start, idle, "event")
+        if not idle:
+            logger.error(f"Network not idle for {quiet_ms}ms within {wait_time} seconds")
+            raise TimeoutException(f"Network not idle within {wait_time} seconds")
+        logger.debug(f"Network idle after {time.perf_counter() - start:.3f}s")
+        return True
+    
     def fluent_wait(self, locator, timeout=30, poll_frequency=0.5):
         """Fluent wait with custom polling frequency"""
         try:
-            wait = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
-            element = wait.until(EC.presence_of_element_located(locator))
+            # Explicit poll frequency: always polls, whatever the wait mode
+            element = self._wait("fluent", EC.presence_of_element_located(locator), locator, timeout,
+                                 poll_frequency=poll_frequency)
             logger.debug(f"Element {locator} found with fluent wait")
             return element
         except TimeoutException:
@@ -114,29 +391,36 @@ class WaitUtils:
     
     def custom_retry_wait(self, locator, max_attempts=5, delay=2):
         """Custom retry wait with multiple attempts"""
-        for attempt in range(max_attempts):
-            try:
-                element = self.driver.find_element(*locator)
-                if element.is_displayed():
-                    logger.debug(f"Element {locator} found on attempt {attempt + 1}")
-                    return element
-            except NoSuchElementException:
-                pass
-            
-            logger.debug(f"Attempt {attempt + 1} failed, retrying in {delay} seconds...")
-            time.sleep(delay)
+        # Back off from a quarter of delay up to delay, within the old worst-case time budget
+        policy = RetryPolicy(base_delay=delay / 4, max_delay=delay, deadline=max_attempts * delay,
+                             rules={NoSuchElementException: max_attempts, StaleElementReferenceException: max_attempts})
         
-        logger.error(f"Element {locator} not found after {max_attempts} attempts")
-        raise NoSuchElementException(f"Element {locator} not found after {max_attempts} attempts")
+        def find_displayed():
+            element = self.driver.find_element(*locator)
+            if not element.is_displayed():
+                raise NoSuchElementException(f"Element {locator} not displayed")
+            return element
+        
+        try:
+            element = policy.run(find_displayed, f"find {locator}")
+            logger.debug(f"Element {locator} found after {policy.retries + 1} attempt(s)")
+            return element
+        except NoSuchElementException:
+            logger.error(f"Element {locator} not found after {max_attempts} attempts")
+            raise NoSuchElementException(f"Element {locator} not found after {max_attempts} attempts")
     
     def wait_for_page_load(self, timeout=None):
         """Wait for page to load completely"""
         try:
-            wait_time = timeout or self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
-            wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+            wait_time = self.timeout if timeout is None else timeout
+            self._wait("page_load", lambda driver: driver.execute_script("return document.readyState") == "complete",
+                       timeout=wait_time)
             logger.debug("Page loaded completely")
             return True
         except TimeoutException:
             logger.error(f"Page did not load completely within {wait_time} seconds")
             raise
+    
+    def get_page_load_strategy(self):
+        """Get the driver's page load strategy (normal, eager or none)"""
+        return self.driver.capabilities.get("pageLoadStrategy", "normal")